@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     port: int = 8001
     fulltext_service_url: str = "http://127.0.0.1:8079"
     fulltext_refresh_window_minutes: int = 60
+    # /file-content で読み込むファイルサイズの上限（バイト）。0 は無制限（従来通り）
+    file_content_max_bytes: int = 0
 
     # OS判定
     is_windows: bool = platform.system() == "Windows"
@@ -43,44 +45,85 @@ class Settings(BaseSettings):
     _base_dir_override: Optional[Path] = None
     _preferences_file_override: Optional[Path] = None
 
-    @property
-    def base_dir(self) -> Path:
-        """ベースディレクトリを取得"""
-        if self._base_dir_override is not None:
-            return self._base_dir_override
+    # base_dir / start_dir の解決結果キャッシュ（入力値のタプル -> (base_dir, start_dir, start_dirのPOSIX文字列)）
+    _path_cache: dict = {}
+
+    def _path_cache_key(self) -> tuple:
+        """パス解決に影響する入力値をまとめたキャッシュキーを返す"""
+        return (
+            self._base_dir_override,
+            os.environ.get("FILE_MANAGER_BASE_DIR"),
+            os.environ.get("FILE_MANAGER_START_DIR"),
+            os.environ.get("USERPROFILE") if self.is_windows else None,
+            self.is_windows,
+        )
+
+    def _resolve_base_dir(self, key: tuple) -> Path:
+        override, env_base_dir, _, user_profile, is_windows = key
+        if override is not None:
+            return override
 
         # 環境変数で指定されている場合はそれを使用
-        env_val = os.environ.get("FILE_MANAGER_BASE_DIR")
-        if env_val:
-            return Path(env_val)
+        if env_base_dir:
+            return Path(env_base_dir)
 
         # フォールバック: OSに応じたデフォルト
         # Windows: USERPROFILEをルート（制限範囲）とする
-        if self.is_windows:
-            user_profile = os.environ.get("USERPROFILE")
-            if user_profile:
-                return Path(user_profile)
-            return Path.home()
+        if is_windows and user_profile:
+            return Path(user_profile)
         # macOS/Linux: HOMEをルートとする
         return Path.home()
 
+    def _resolve_start_dir(self, key: tuple, base_dir: Path) -> Path:
+        _, env_base_dir, env_start_dir, _, is_windows = key
+        # 環境変数で指定されている場合はそれを使用
+        if env_start_dir:
+            return Path(env_start_dir)
+
+        # FILE_MANAGER_BASE_DIR が設定されている場合はそれをそのまま使用
+        if env_base_dir:
+            return base_dir
+
+        # デフォルトは base_dir/000_work (Windows) または base_dir
+        if is_windows:
+            return base_dir / "000_work"
+        return base_dir
+
+    def _resolved_dirs(self) -> tuple[Path, Path, str, Path]:
+        """
+        base_dir / start_dir を解決して返す（同じ入力値なら Path を再生成しない）
+        テスト用オーバーライドや環境変数が変わった場合はキーが変わるため自動的に再計算される
+        """
+        key = self._path_cache_key()
+        cached = self._path_cache.get(key)
+        if cached is None:
+            base_dir = self._resolve_base_dir(key)
+            start_dir = self._resolve_start_dir(key, base_dir)
+            cached = (base_dir, start_dir, start_dir.as_posix(), base_dir.resolve())
+            # 古いキーを溜め込まないよう、保持するのは最新の1件のみ
+            self._path_cache.clear()
+            self._path_cache[key] = cached
+        return cached
+
+    @property
+    def base_dir(self) -> Path:
+        """ベースディレクトリを取得"""
+        return self._resolved_dirs()[0]
+
     @property
     def start_dir(self) -> Path:
         """初期表示ディレクトリを取得"""
-        # 環境変数で指定されている場合はそれを使用
-        env_val = os.environ.get("FILE_MANAGER_START_DIR")
-        if env_val:
-            return Path(env_val)
-            
-        # FILE_MANAGER_BASE_DIR が設定されている場合はそれをそのまま使用
-        if os.environ.get("FILE_MANAGER_BASE_DIR"):
-            return self.base_dir
+        return self._resolved_dirs()[1]
 
-        # デフォルトは base_dir/000_work (Windows) または base_dir/Documents
-        if self.is_windows:
-             return self.base_dir / "000_work"
-        return self.base_dir
+    @property
+    def start_dir_posix(self) -> str:
+        """初期表示ディレクトリのPOSIX形式文字列を取得（/api/config 応答用）"""
+        return self._resolved_dirs()[2]
 
+    @property
+    def base_dir_resolved(self) -> Path:
+        """シンボリックリンク等を解決済みのベースディレクトリを取得（パストラバーサル判定用）"""
+        return self._resolved_dirs()[3]
 
     @property
     def obsidian_base_dir(self) -> Path:
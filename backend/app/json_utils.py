@@ -0,0 +1,35 @@
+"""
+JSONシリアライズの共通ユーティリティ
+
+orjson（C拡張）がインストールされていればそれを使い、無い環境では標準の json にフォールバックする。
+ファイルの読み書きや上流サービスの応答のデコードを高速化するためのもの。
+（APIレスポンスのエンコードは response_model / 戻り値注釈を宣言して FastAPI の pydantic シリアライザに任せる）
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson はオプション依存
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """JSONをデコードする（orjsonがあれば使用）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """JSONをインデント付きのUTF-8バイト列にエンコードする（ファイル保存用。orjsonがあれば使用）"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def response_json(response: Any) -> Any:
+    """httpx.Response のボディをJSONとしてデコードする（orjsonがあればバイト列から直接）"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
@@ -9,37 +9,64 @@ FastAPI ファイルマネージャー メインアプリケーション
 注: インデックス検索機能は外部サービス（file_index_service）に移行
 """
 import re
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 from typing import Optional
-import urllib.request
-import urllib.error
-import socket
 import os
-from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 from app.config import get_editor_preferences, save_editor_preferences, settings
+from app.response_cache import clear_response_caches, ttl_cache
 from app.routers import files, everything, history, clipboard, terminal, fulltext
 from fastapi.exceptions import RequestValidationError
 from fastapi import Request
-import mimetypes
-
-# Windows環境でSVGのMIMEタイプが正しく認識されない場合があるため明示的に設定
-mimetypes.add_type("image/svg+xml", ".svg")
 
 # フロントエンドのビルドディレクトリ（backend/の親ディレクトリ → frontend/dist）
 FRONTEND_DIST_DIR = Path(__file__).parent.parent.parent / "frontend" / "dist"
 HASHED_ASSET_PATTERN = re.compile(r".*-[0-9A-Za-z]{6,}\.(js|css|mjs)$")
 
+def _init_mimetypes() -> None:
+    """
+    静的配信用のMIMEタイプDBを初期化する
+    システムの mime.types 読み込みを初回の静的配信リクエストではなく起動時に済ませる
+    """
+    import mimetypes
+
+    # init() はDBを作り直すため、add_type より先に呼ぶ
+    if not mimetypes.inited:
+        mimetypes.init()
+    # Windows環境でSVGのMIMEタイプが正しく認識されない場合があるため明示的に設定
+    mimetypes.add_type("image/svg+xml", ".svg")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    アプリ全体で共有するリソースの生成と破棄を1か所にまとめる
+    - MIMEタイプDBの初期化（import時や初回リクエスト時ではなく起動時に行う）
+    - 応答キャッシュ（/api/config 等）を空の状態から開始し、終了時に破棄
+    - インデックス検索用の httpx.AsyncClient（接続を使い回してリクエスト毎の接続確立を省く）
+    終了処理は AsyncExitStack により生成と逆順で確実に行う
+    """
+    _init_mimetypes()
+    clear_response_caches()
+
+    async with AsyncExitStack() as stack:
+        stack.callback(clear_response_caches)
+        stack.callback(setattr, app.state, "everything_client", None)
+        app.state.everything_client = await stack.enter_async_context(everything.create_index_client())
+        yield
+
+
 app = FastAPI(
     title="File Manager API",
     description="軽量ファイルマネージャー API",
     version="2.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -67,9 +94,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={"detail": exc.errors()},
     )
 
-# CORS設定（個人利用のため全てのオリジンからのアクセスを許可）
+class ApiCORSMiddleware(CORSMiddleware):
+    """
+    /api 配下のリクエストにのみCORS処理を行うミドルウェア
+    PWAのHTMLや静的アセットは同一オリジンから取得されるため、ヘッダー解析を省いてそのまま通す
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not scope["path"].startswith("/api"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# CORS設定（個人利用のため全てのオリジンからのアクセスを許可、対象はAPIのみ）
 app.add_middleware(
-    CORSMiddleware,
+    ApiCORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
@@ -96,7 +136,24 @@ class EditorPreferencesRequest(BaseModel):
     pathMappings: Optional[dict[str, str]] = None
 
 
+def _config_cache_key() -> tuple:
+    """
+    設定応答のキャッシュキー（設定ファイルや環境の切り替えで別エントリになるようにする）
+
+    設定ファイルの更新時刻とサイズも含め、API以外（エディタ等）で直接編集された場合も
+    次のリクエストから新しい内容を返す
+    """
+    preferences_path = settings.preferences_file_path
+    try:
+        stat = os.stat(preferences_path)
+        file_version = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_version = None
+    return (preferences_path, file_version, settings.start_dir_posix, settings.is_windows)
+
+
 @app.get("/api/config")
+@ttl_cache(expire=3600, key=_config_cache_key)
 async def get_config():
     """
     フロントエンド用設定を取得
@@ -104,7 +161,7 @@ async def get_config():
     - isWindows: Windows環境かどうか
     """
     return {
-        "defaultBasePath": settings.start_dir.as_posix(),
+        "defaultBasePath": settings.start_dir_posix,
         "isWindows": settings.is_windows,
         **get_editor_preferences(),
     }
@@ -113,7 +170,7 @@ async def get_config():
 @app.post("/api/config/preferences")
 async def update_editor_preferences(request: EditorPreferencesRequest):
     """エディタ設定を設定ファイルへ保存する"""
-    return save_editor_preferences(
+    preferences = save_editor_preferences(
         text_file_open_mode=request.textFileOpenMode,  # type: ignore[arg-type]
         markdown_open_mode=request.markdownOpenMode,  # type: ignore[arg-type]
         api_timeout=request.apiTimeout,
@@ -121,6 +178,9 @@ async def update_editor_preferences(request: EditorPreferencesRequest):
         folder_latest_modified_max_entries=request.folderLatestModifiedMaxEntries,
         default_text_file_extension=request.defaultTextFileExtension,
     )
+    # 保存後の /api/config に新しい設定が反映されるようキャッシュを破棄する
+    get_config.cache_clear()
+    return preferences
 
 
 class ConnectionTestRequest(BaseModel):
@@ -133,6 +193,13 @@ async def test_connections(request: ConnectionTestRequest):
     """
     指定された新サーバー（パスやURL）の接続性を検証する
     """
+    # 接続検証でのみ使うモジュールは起動時に読み込まない
+    import asyncio
+    import socket
+    import urllib.error
+    import urllib.request
+    from concurrent.futures import ThreadPoolExecutor
+
     results = {}
     
     def _test_single(path_or_url: str) -> dict:
@@ -183,7 +250,6 @@ async def test_connections(request: ConnectionTestRequest):
                 return {"alive": False, "type": "path", "error": str(e)}
 
     # 非同期スレッドプールで検証を実行
-    import asyncio
     loop = asyncio.get_running_loop()
     with ThreadPoolExecutor() as pool:
         tasks = []
@@ -199,8 +265,31 @@ async def test_connections(request: ConnectionTestRequest):
 
 
 # --- PWA: フロントエンド配信 ---
+# SPAのディープリンクでは毎回 index.html を返すため、パスと存在確認・ヘッダーは配信ディレクトリごとに1度だけ計算する
+# （見つからなかった結果はキャッシュしない。起動後にフロントエンドをビルドした場合も配信できるように）
+_index_html_cache: dict[Path, tuple[Path, dict[str, str]]] = {}
+_NOT_FOUND_BODY = b'{"detail":"Not found"}'
+
+
+def _get_index_html() -> Optional[tuple[Path, dict[str, str]]]:
+    """index.html のパスとキャッシュヘッダーを返す（存在しない場合は None）"""
+    dist_dir = FRONTEND_DIST_DIR
+    try:
+        return _index_html_cache[dist_dir]
+    except KeyError:
+        pass
+    index_path = dist_dir / "index.html"
+    if not index_path.is_file():
+        return None
+    result = _index_html_cache[dist_dir] = (index_path, build_static_cache_headers(index_path))
+    return result
+
+
 # frontend/dist/ が存在する場合のみ、静的ファイル配信を有効化
 if FRONTEND_DIST_DIR.is_dir():
+    # 静的配信が有効な場合のみ読み込む
+    from fastapi.responses import FileResponse
+
     # SPAフォールバック: /api以外のGETリクエストでファイルが見つからない場合はindex.htmlを返す
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str):
@@ -215,11 +304,12 @@ if FRONTEND_DIST_DIR.is_dir():
             return FileResponse(file_path, headers=build_static_cache_headers(file_path))
 
         # index.html を返す（SPAルーティング対応）
-        index_path = FRONTEND_DIST_DIR / "index.html"
-        if index_path.is_file():
-            return FileResponse(index_path, headers=build_static_cache_headers(index_path))
+        index_html = _get_index_html()
+        if index_html is not None:
+            index_path, index_headers = index_html
+            return FileResponse(index_path, headers=index_headers)
 
-        return JSONResponse(status_code=404, content={"detail": "Not found"})
+        return Response(_NOT_FOUND_BODY, status_code=404, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+"""
+エンドポイント応答のインメモリTTLキャッシュ
+
+ほぼ静的な設定値や外部サービスのステータスなど、毎回計算・問い合わせする必要のない応答を
+プロセス内のdictに保持して返す。外部キャッシュ基盤（Redis等）は使わない個人利用前提の簡易実装。
+"""
+import functools
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+# ttl_cache で生成した全キャッシュ（起動/終了時にまとめて破棄するため）
+_registry: list[dict] = []
+
+
+def clear_response_caches() -> None:
+    """ttl_cache で保持している全エンドポイントのキャッシュを破棄する"""
+    for entries in _registry:
+        entries.clear()
+
+
+def ttl_cache(
+    expire: float,
+    key: Callable[..., Hashable] = lambda *args, **kwargs: (),
+    cache_if: Callable[[Any], bool] = lambda result: True,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    async エンドポイント用のTTLキャッシュデコレータ
+
+    Args:
+        expire: キャッシュの有効期間（秒）
+        key: エンドポイントと同じ引数を受け取り、キャッシュキーを返す関数
+        cache_if: 応答を受け取り、キャッシュしてよい場合に True を返す関数（失敗応答の除外用）
+
+    デコレート後の関数は cache_clear() で明示的にキャッシュを破棄できる
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: dict[Hashable, tuple[float, Any]] = {}
+        _registry.append(entries)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = key(*args, **kwargs)
+            now = time.monotonic()
+            entry = entries.get(cache_key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            result = await func(*args, **kwargs)
+            if cache_if(result):
+                entries[cache_key] = (now + expire, result)
+            return result
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -4,23 +4,62 @@ WindowsではEverythingのHTTPサーバー(localhost:8080)、macOSではLocal-fu
 フロントエンドが期待する形式に変換して返す
 """
 import httpx
-import platform
-from fastapi import APIRouter, HTTPException, Query
+import importlib.util
+from operator import itemgetter
+from contextlib import asynccontextmanager
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import AsyncIterator, List, Optional
 
 from app.config import settings
+from app.json_utils import response_json
+from app.response_cache import ttl_cache
 
 router = APIRouter()
 
+# OS判定はリクエスト毎ではなく起動時に1度だけ行う（config.py の判定結果を再利用）
+IS_WINDOWS = settings.is_windows
+
 EVERYTHING_BASE_URL = "http://localhost:8080"
 TIMEOUT = 5.0
+# HTTP/2 は h2 パッケージ（httpx[http2]）がある場合のみ有効化する
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 def get_mac_index_base_url() -> str:
     """macOS用の統合済みファイル検索APIのベースURLを返す"""
     return settings.fulltext_service_url.rstrip("/")
 
+
+def create_index_client() -> httpx.AsyncClient:
+    """
+    インデックスサービス用の共有クライアントを生成する
+    アプリのlifespanで1つだけ生成し、接続プール（keep-alive）を使い回す
+    HTTP/2 対応サーバーであれば同時リクエストを1接続に多重化する（非対応ならHTTP/1.1で通信）
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        trust_env=False,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_keepalive_connections=16),
+    )
+
+
+@asynccontextmanager
+async def index_client(request: Request) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    lifespanで生成された共有クライアントを返す
+    lifespanが動いていない場合（テストクライアント等）はリクエスト単位で生成する
+    """
+    shared = getattr(request.app.state, "everything_client", None)
+    if shared is not None:
+        yield shared
+        return
+    async with httpx.AsyncClient(trust_env=False) as client:
+        yield client
+
 class EverythingItem(BaseModel):
     name: str
     path: str
@@ -48,31 +87,96 @@ class StatusResponse(BaseModel):
     ready: bool
     total_indexed: int
 
+# 1601-01-01 -> 1970-01-01 の差分（100ナノ秒単位のTicks）
+_FT_EPOCH_DELTA = 116444736000000000
+
+
 def windows_filetime_to_timestamp(filetime: Optional[str]) -> Optional[float]:
     """Windows File Time (Ticks) を Unix Timestamp (Seconds) に変換"""
     if not filetime:
         return None
     try:
         # Windows File Time (100-nanosecond intervals since January 1, 1601)
-        ticks = int(filetime)
-        # 1601-01-01 -> 1970-01-01 is 11,644,473,600 seconds
-        # ticks / 10,000,000 = seconds
-        seconds_since_1601 = ticks / 10000000
-        seconds_since_1970 = seconds_since_1601 - 11644473600
-        return float(seconds_since_1970)
-    except:
+        return (int(filetime) - _FT_EPOCH_DELTA) / 1e7
+    except (TypeError, ValueError):
         return None
 
+
+# Everything（Windows）が返すパスの区切り文字
+_SEP = "\\"
+
+
+# 変換に使う列（Cで実装された itemgetter でまとめて取り出す）と、列が欠けている行の既定値
+_ROW_FIELDS = itemgetter("name", "path", "size", "date_modified", "type")
+_ROW_DEFAULTS = {"name": "", "path": "", "size": None, "date_modified": None, "type": "file"}
+
+
+def _extract_rows(items: List[dict]) -> List[tuple]:
+    """各行から変換に使う列をタプルで取り出す（通常は全列が揃っているため既定値の補完は例外時のみ）"""
+    try:
+        return list(map(_ROW_FIELDS, items))
+    except KeyError:
+        return [_ROW_FIELDS({**_ROW_DEFAULTS, **item}) for item in items]
+
+
+def _convert_row(name, parent, size, date_modified, item_type) -> dict:
+    """1行分を変換する（不正な行の切り分け用。正常系は convert_everything_results の内包表記で処理する）"""
+    return {
+        "name": name,
+        "type": "directory" if item_type == "folder" else "file",
+        "path": parent + ("" if parent.endswith(_SEP) else _SEP) + name if parent else name,
+        "size": int(size) if size else None,
+        "date_modified": windows_filetime_to_timestamp(date_modified),
+    }
+
+
+def _convert_rows_skipping_invalid(items: List[dict]) -> List[dict]:
+    """1行ずつ変換し、不正な行（サイズが数値でない、nameがnull等）は読み飛ばす"""
+    results = []
+    for item in items:
+        try:
+            results.append(_convert_row(*_ROW_FIELDS({**_ROW_DEFAULTS, **item})))
+        except (TypeError, ValueError, AttributeError):
+            continue
+    return results
+
+
+def convert_everything_results(items: List[dict]) -> List[dict]:
+    """
+    Everythingの検索結果をフロントエンドが期待する形式（FileItem相当のdict）へ変換する
+    件数が多い（count=1000など）ため、ループ内の属性参照と関数呼び出しを減らした内包表記で組み立てる
+    不正な行が混じっていた場合のみ、1行ずつの変換に切り替えてその行を読み飛ばす
+    """
+    to_timestamp = windows_filetime_to_timestamp
+    try:
+        return [
+            {
+                "name": name,
+                "type": "directory" if item_type == "folder" else "file",
+                # フルパスの構築（親パス末尾の区切り文字有無を考慮）
+                "path": parent + ("" if parent.endswith(_SEP) else _SEP) + name if parent else name,
+                "size": int(size) if size else None,
+                "date_modified": to_timestamp(date_modified),
+            }
+            for name, parent, size, date_modified, item_type in _extract_rows(items)
+        ]
+    except (TypeError, ValueError, AttributeError):
+        return _convert_rows_skipping_invalid(items)
+
+
+# 準備完了/未完了の切り替わりがすぐ反映されるよう、TTLは短めにする
+# 接続失敗（ready: False）はキャッシュせず、サービス起動後すぐに準備完了を返せるようにする
 @router.get("/index/status", response_model=StatusResponse)
-async def get_status():
+@ttl_cache(expire=5, key=lambda request: IS_WINDOWS, cache_if=lambda result: result["ready"])
+async def get_status(request: Request):
     """
     インデックスサービスのステータス確認
     """
-    is_windows = platform.system() == "Windows"
+    is_windows = IS_WINDOWS
     base_url = EVERYTHING_BASE_URL if is_windows else get_mac_index_base_url()
     path = "/" if is_windows else "/api/index/status"
     try:
-        async with httpx.AsyncClient(trust_env=False) as client:
+        async with index_client(request) as client:
             # 軽いクエリで接続確認
             params = {"search": "", "json": 1, "count": 1} if is_windows else None
             response = await client.get(
@@ -83,7 +187,7 @@ async def get_status():
             # ステータスコードチェックは省略（Macのサービス仕様不明なため）
             # response.raise_for_status() 
             
-            data = response.json()
+            data = response_json(response)
             # Windows(Everything) と Mac(Custom) でレスポンス構造が違う可能性も考慮
             # とりあえず totalResults を見る
             return {
@@ -97,8 +201,42 @@ async def get_status():
             "total_indexed": 0
         }
 
-@router.get("/index")
+async def _stream_passthrough(client: httpx.AsyncClient, url: str, params: dict) -> StreamingResponse:
+    """
+    上流のJSONをバッファリングせずにそのまま返す
+    上流レスポンスのクローズはレスポンス送信完了後にバックグラウンドタスクで行う
+    """
+    try:
+        upstream = await client.send(
+            client.build_request("GET", url, params=params, timeout=TIMEOUT),
+            stream=True,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Index service error: {e}")
+
+    try:
+        upstream.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        await upstream.aclose()
+        raise HTTPException(status_code=503, detail=f"Index service error: {e}")
+
+    # aiter_raw だと Content-Encoding を引き継ぐ必要があるため、デコード済みのバイト列を流す
+    return StreamingResponse(
+        upstream.aiter_bytes(),
+        media_type=upstream.headers.get("content-type", "application/json"),
+        background=BackgroundTask(upstream.aclose),
+    )
+
+
+# 結果件数が多いため、モデルを組み立てずに dict のまま返す（response_model=dict で pydantic-core に直接JSON化させる）。
+# スキーマはドキュメント用に responses で示す
+@router.get(
+    "/index",
+    response_model=dict,
+    responses={200: {"model": SearchResponse}},
+)
 async def search(
+    request: Request,
     search: str = Query(..., description="検索クエリ"),
     count: int = Query(100, description="取得件数"),
     offset: int = Query(0, description="オフセット"),
@@ -106,14 +244,12 @@ async def search(
     ascending: int = Query(1, description="昇順(1)/降順(0)"),
     path: Optional[str] = Query(None, description="検索対象フォルダ"),
     file_type: str = Query("all", description="ファイルタイプ（all/file/directory）"),
-):
+) -> dict | StreamingResponse:
     """
     インデックスでファイルを検索
     Macの場合はLocal-fulltext-searchへプロキシ、Windowsの場合はEverything APIを変換
     """
-    is_windows = platform.system() == "Windows"
-
-    if not is_windows:
+    if not IS_WINDOWS:
         # Mac: Local-fulltext-search の互換APIへプロキシ
         # パラメータはそのまま転送
         params = {
@@ -128,16 +264,21 @@ async def search(
         if file_type != "all":
             params["file_type"] = file_type
 
+        # Mac側はすでに期待する形式（date_modified含む）で返すと仮定し、
+        # 共有クライアントがあればデコード/再エンコードせずにそのままストリーミング転送する
+        shared = getattr(request.app.state, "everything_client", None)
+        if shared is not None:
+            return await _stream_passthrough(shared, f"{get_mac_index_base_url()}/api/index", params)
+
         try:
-            async with httpx.AsyncClient(trust_env=False) as client:
+            async with index_client(request) as client:
                 response = await client.get(
                     f"{get_mac_index_base_url()}/api/index",
                     params=params,
                     timeout=TIMEOUT
                 )
                 response.raise_for_status()
-                # Mac側はすでに期待する形式（date_modified含む）で返すと仮定
-                return response.json()
+                return response_json(response)
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"Index service error: {e}")
 
@@ -164,51 +305,22 @@ async def search(
         params["file_type"] = "folder" if file_type == "directory" else file_type
 
     try:
-        async with httpx.AsyncClient(trust_env=False) as client:
+        async with index_client(request) as client:
             response = await client.get(
                 f"{EVERYTHING_BASE_URL}/",
                 params=params,
                 timeout=TIMEOUT
             )
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
     except httpx.RequestError as e:
         raise HTTPException(status_code=503, detail=f"Everythingサービスに接続できません: {e}")
     except httpx.HTTPStatusError as e:
         raise HTTPException(status_code=502, detail=f"Everythingサービスエラー: {e}")
 
-    results = []
-    for item in data.get("results", []):
-        try:
-            name = item.get("name", "")
-            parent_path = item.get("path", "")
-            
-            # フルパスの構築
-            full_path = f"{parent_path}\\{name}" if parent_path else name
-            if parent_path.endswith("\\"): 
-                full_path = f"{parent_path}{name}"
-                
-            # サイズ変換
-            size_str = item.get("size")
-            size = int(size_str) if size_str else None
-            
-            # 日付変換 (Unix Timestamp)
-            date_str = item.get("date_modified")
-            timestamp = windows_filetime_to_timestamp(date_str)
-            
-            # タイプ変換
-            item_type = item.get("type", "file")
-            file_type = "directory" if item_type == "folder" else "file"
-            
-            results.append({
-                "name": name,
-                "type": file_type,
-                "path": full_path,
-                "size": size,
-                "date_modified": timestamp
-            })
-        except Exception as e:
-            continue
+    # 結果なし（タイプ途中のライブ検索などで多い）は変換処理を丸ごと省く。results が null の場合も空扱い
+    raw_results = data.get("results") or []
+    results = convert_everything_results(raw_results) if raw_results else []
 
     return {
         "totalResults": data.get("totalResults", 0),
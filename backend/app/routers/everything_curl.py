@@ -1,19 +1,23 @@
 """
 Everything検索プロキシ (CURL版)
-EverythingのHTTPサーバー(localhost:8080)にCURL経由でリクエストを転送し、
+EverythingのHTTPサーバー(localhost:8080)にリクエストを転送し、
 フロントエンドが期待する形式に変換して返す。
 httpxでプロキシ回避が難しい場合のバックアップ実装。
+注: curlサブプロセスは廃止し、プロキシ環境変数を無視する httpx クライアント（trust_env=False）で送信する
 """
-import subprocess
-import json
-import platform
-import urllib.parse
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
-from typing import List, Optional, Any
+from typing import List, Optional
+
+from app.json_utils import response_json
+from app.config import settings
+from app.routers.everything import convert_everything_results, index_client
 
 router = APIRouter()
 
+# OS判定はリクエスト毎ではなく起動時に1度だけ行う（config.py の判定結果を再利用）
+IS_WINDOWS = settings.is_windows
+
 EVERYTHING_BASE_URL = "http://localhost:8080"
 TIMEOUT = 5.0
 
@@ -44,60 +48,25 @@ class StatusResponse(BaseModel):
     ready: bool
     total_indexed: int
 
-def windows_filetime_to_timestamp(filetime: Optional[str]) -> Optional[float]:
-    """Windows File Time (Ticks) を Unix Timestamp (Seconds) に変換"""
-    if not filetime:
-        return None
-    try:
-        # Windows File Time (100-nanosecond intervals since January 1, 1601)
-        ticks = int(filetime)
-        # 1601-01-01 -> 1970-01-01 is 11,644,473,600 seconds
-        # ticks / 10,000,000 = seconds
-        seconds_since_1601 = ticks / 10000000
-        seconds_since_1970 = seconds_since_1601 - 11644473600
-        return float(seconds_since_1970)
-    except:
-        return None
-
-def curl_get(url: str, params: dict) -> dict:
-    """CURLを使ってGETリクエストを送信し、JSONレスポンスを返す"""
-    # パラメータをクエリ文字列に変換
-    query_string = urllib.parse.urlencode(params)
-    full_url = f"{url}?{query_string}"
-    
-    # curlコマンドの構築
-    # --noproxy "*" でプロキシを確実に回避
-    # -s でサイレントモード
-    command = ["curl", "-s", "--noproxy", "*", full_url]
-    
-    try:
-        result = subprocess.run(
-            command, 
-            capture_output=True, 
-            text=True, 
-            encoding='utf-8',
-            check=True
-        )
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError as e:
-        print(f"Curl error: {e.stderr}")
-        raise Exception(f"Curl command failed: {e}")
-    except json.JSONDecodeError as e:
-        print(f"JSON decode error: {result.stdout}")
-        raise Exception(f"Invalid JSON response: {e}")
-    except Exception as e:
-        print(f"Unexpected error: {e}")
-        raise e
+async def fetch_json(request: Request, url: str, params: dict) -> dict:
+    """
+    GETリクエストを送信し、JSONレスポンスを返す
+    以前はcurlサブプロセス（--noproxy "*"）を起動していたが、
+    trust_env=False の httpx でも同じくプロキシ環境変数を無視できるため、共有クライアントで送信する
+    """
+    async with index_client(request) as client:
+        response = await client.get(url, params=params, timeout=TIMEOUT)
+        response.raise_for_status()
+        return response_json(response)
 
 @router.get("/index/status", response_model=StatusResponse)
-async def get_status():
+async def get_status(request: Request):
     """
     Everythingサービスのステータス確認
     """
     try:
         params = {"search": "", "json": 1, "count": 1}
-        # curlを使用（非同期化していないが、バックアップ用なので許容）
-        data = curl_get(f"{EVERYTHING_BASE_URL}/", params)
+        data = await fetch_json(request, f"{EVERYTHING_BASE_URL}/", params)
         
         return {
             "ready": True,
@@ -110,21 +79,26 @@ async def get_status():
             "total_indexed": 0
         }
 
-@router.get("/index")
+# 結果件数が多いため、モデルを組み立てずに dict のまま返す（response_model=dict で pydantic-core に直接JSON化させる）。
+# スキーマはドキュメント用に responses で示す
+@router.get(
+    "/index",
+    response_model=dict,
+    responses={200: {"model": SearchResponse}},
+)
 async def search(
+    request: Request,
     search: str = Query(..., description="検索クエリ"),
     count: int = Query(100, description="取得件数"),
     offset: int = Query(0, description="オフセット"),
     sort: str = Query("name", description="ソート順"),
     ascending: int = Query(1, description="昇順(1)/降順(0)"),
     path: Optional[str] = Query(None, description="検索対象フォルダ")
-):
+) -> dict:
     """
     Everythingでファイルを検索 (CURL版)
     """
-    is_windows = platform.system() == "Windows"
-
-    if not is_windows:
+    if not IS_WINDOWS:
         # Mac: パススループロキシ
         params = {
             "search": search,
@@ -138,7 +112,7 @@ async def search(
             params["path"] = path
 
         try:
-            data = curl_get(f"{EVERYTHING_BASE_URL}/", params)
+            data = await fetch_json(request, f"{EVERYTHING_BASE_URL}/", params)
             return data
         except Exception as e:
             raise HTTPException(status_code=503, detail=f"Index service error: {e}")
@@ -161,38 +135,13 @@ async def search(
     }
 
     try:
-        data = curl_get(f"{EVERYTHING_BASE_URL}/", params)
+        data = await fetch_json(request, f"{EVERYTHING_BASE_URL}/", params)
     except Exception as e:
         raise HTTPException(status_code=503, detail=f"Everythingサービスに接続できません: {e}")
 
-    results = []
-    for item in data.get("results", []):
-        try:
-            name = item.get("name", "")
-            parent_path = item.get("path", "")
-            
-            full_path = f"{parent_path}\\{name}" if parent_path else name
-            if parent_path.endswith("\\"): 
-                full_path = f"{parent_path}{name}"
-                
-            size_str = item.get("size")
-            size = int(size_str) if size_str else None
-            
-            date_str = item.get("date_modified")
-            timestamp = windows_filetime_to_timestamp(date_str)
-            
-            item_type = item.get("type", "file")
-            file_type = "directory" if item_type == "folder" else "file"
-            
-            results.append({
-                "name": name,
-                "type": file_type,
-                "path": full_path,
-                "size": size,
-                "date_modified": timestamp
-            })
-        except Exception as e:
-            continue
+    # 結果なし（タイプ途中のライブ検索などで多い）は変換処理を丸ごと省く。results が null の場合も空扱い
+    raw_results = data.get("results") or []
+    results = convert_everything_results(raw_results) if raw_results else []
 
     return {
         "totalResults": data.get("totalResults", 0),
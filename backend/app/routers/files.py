@@ -6,16 +6,23 @@
 
 注: インデックス検索は外部サービス（file_index_service）に移行
 """
+import asyncio
+import codecs
+import collections
+import contextlib
 import fnmatch
+import functools
 import hashlib
+import itertools
 import html
+import re
 import zipfile
 import threading
-import queue
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 import webbrowser
 import urllib.parse
 
@@ -25,16 +32,31 @@ from pydantic import BaseModel
 
 import os
 import io
+import mmap
 import shutil
 import platform
 import subprocess
 import ctypes
-import struct
 import stat
 import time
+import uuid
 
 from app.config import get_editor_preferences, settings
-from app.task_manager import task_manager, TaskInfo
+from app.task_manager import task_manager
+
+# 実行中のOS名（"Windows" / "Darwin" / "Linux" 等）。リクエスト毎に platform.system() を呼ばないよう1度だけ取得する
+_PLATFORM = platform.system()
+
+# 削除ループ内で毎回importしないよう、モジュール読み込み時に1度だけ解決する
+try:
+    from send2trash import send2trash
+except ImportError:  # Windowsでは Win32 API を使うため未インストールでも動作する
+    send2trash = None
+
+try:
+    import blake3
+except ImportError:  # blake3 はオプション依存（無ければ hashlib の SHA256 を使う）
+    blake3 = None
 
 router = APIRouter()
 
@@ -42,6 +64,15 @@ WINDOWS_DELETE_RETRY_COUNT = 10
 WINDOWS_DELETE_RETRY_BASE_SECONDS = 0.2
 WINDOWS_DELETE_RETRY_MAX_SECONDS = 1.0
 
+# 上書きコピー時の一時ファイル名に付ける目印（"<コピー先>.fm-tmp-<16進8桁>"）
+COPY_TEMP_MARKER = ".fm-tmp-"
+_COPY_TEMP_NAME_RE = re.compile(re.escape(COPY_TEMP_MARKER) + r"[0-9a-f]{8}\Z")
+
+
+def _is_copy_temp_name(name: str) -> bool:
+    """上書きコピーの一時ファイル名か判定する（プロセス終了等で残った一時ファイルを一覧・検索から除くため）"""
+    return COPY_TEMP_MARKER in name and _COPY_TEMP_NAME_RE.search(name) is not None
+
 
 class FileItem(BaseModel):
     """ファイル/フォルダアイテムのスキーマ"""
@@ -115,18 +146,55 @@ class ObsidianPathResponse(BaseModel):
     path: str
 
 
+if os.sep == "\\":
+    def _to_posix_str(path_str: str) -> str:
+        """OSネイティブのパス文字列をPOSIX形式（/区切り）に変換する"""
+        return path_str.replace("\\", "/")
+else:
+    def _to_posix_str(path_str: str) -> str:
+        """OSネイティブのパス文字列をPOSIX形式（/区切り）に変換する（POSIX環境ではそのまま）"""
+        return path_str
+
+
+def _format_mtime(timestamp: float) -> str:
+    """
+    更新日時（UNIX時刻）をローカル時刻のISO形式文字列にする（マイクロ秒が0でなければ小数部も付く）
+
+    レスポンスの modified の形式は datetime.isoformat() のまま変えない。
+    （time.strftime で整形して小数部を足すより、C実装の fromtimestamp + isoformat の方が速い）
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+def _is_within_root(path_str: str, root: str) -> bool:
+    """path_str が root 自身またはその配下か（/base2 を /base 配下と誤判定しないようパス区切りで判定）"""
+    return path_str == root or path_str.startswith(root.rstrip(os.sep) + os.sep)
+
+
 def _is_recursive_symlink_target(path_str: str, search_root: str) -> bool:
     """
     ベース配下を指すシンボリックリンクを検出する。
 
     再帰探索や一覧表示で同一ツリーへ戻るリンクを辿ると、
     大量走査やループの原因になるため除外する。
+    リンク先が ".." を含まない絶対パスなら、readlink 1回の文字列だけでベース配下かどうかを判定する。
+    それ以外（相対パスや ".." を含むリンク先は、途中の要素がリンクだと字面と実際の位置が食い違う）や
+    ベース外を指す場合は realpath で最終的なリンク先を確認する。
     """
     try:
-        resolved = str(Path(path_str).resolve(strict=True))
-    except (OSError, RuntimeError):
+        target = os.readlink(path_str)
+    except OSError:
+        return True
+
+    if os.path.isabs(target) and os.path.normpath(target) == target and _is_within_root(target, search_root):
+        return True
+
+    try:
+        resolved = os.path.realpath(path_str, strict=True)
+    except OSError:
+        # リンク切れ・循環リンク
         return True
-    return resolved.startswith(search_root)
+    return _is_within_root(resolved, search_root)
 
 
 def _bring_explorer_to_front(process_id: int, target_path: Path) -> None:
@@ -136,7 +204,7 @@ def _bring_explorer_to_front(process_id: int, target_path: Path) -> None:
     Windowsのフォアグラウンド制御制限により必ず成功する保証はないが、
     起動直後の数回リトライでユーザー体感を改善する。
     """
-    if platform.system() != "Windows":
+    if _PLATFORM != "Windows":
         return
 
     def worker() -> None:
@@ -199,6 +267,23 @@ def _bring_explorer_to_front(process_id: int, target_path: Path) -> None:
     threading.Thread(target=worker, daemon=True).start()
 
 
+def _spawn_detached(argv: List[str]) -> None:
+    """
+    外部アプリ（open / xdg-open 等）を起動し、終了を待たずに戻る
+
+    POSIX環境では os.posix_spawn を使い、fork() によるプロセス全体のページテーブル複製を避ける。
+    （Pythonのファイル記述子は既定で継承不可のため、子プロセスへ余計なFDは渡らない）
+    posix_spawn が使えない環境（Windows）や実行ファイルが見つからない場合は subprocess.Popen に任せる。
+    """
+    executable = shutil.which(argv[0]) if hasattr(os, "posix_spawn") else None
+    if executable is None:
+        subprocess.Popen(argv)
+        return
+    pid = os.posix_spawn(executable, argv, os.environ)
+    # ゾンビプロセスを残さないよう、終了をバックグラウンドで回収する
+    threading.Thread(target=os.waitpid, args=(pid, 0), daemon=True).start()
+
+
 def _schedule_macos_obsidian_activation() -> None:
     """
     macOSでObsidianを少し遅らせて前面化する。
@@ -207,7 +292,7 @@ def _schedule_macos_obsidian_activation() -> None:
     再度アクティブになることがあるため、Obsidian URI 起動後に短い遅延を
     入れてアプリをactivateする。
     """
-    subprocess.Popen([
+    _spawn_detached([
         "/bin/sh",
         "-c",
         "sleep 0.35; /usr/bin/osascript -e 'tell application \"Obsidian\" to activate'",
@@ -221,11 +306,11 @@ def _bring_obsidian_to_front() -> None:
     obsidian:// 起動では既存のObsidianウィンドウが別デスクトップに残ることがあるため、
     起動直後にタイトルからObsidianウィンドウを探して前面化を数回リトライする。
     """
-    if platform.system() == "Darwin":
+    if _PLATFORM == "Darwin":
         _schedule_macos_obsidian_activation()
         return
 
-    if platform.system() != "Windows":
+    if _PLATFORM != "Windows":
         return
 
     def worker() -> None:
@@ -274,6 +359,36 @@ def _bring_obsidian_to_front() -> None:
     threading.Thread(target=worker, daemon=True).start()
 
 
+def _open_with_os(target: str) -> None:
+    """ファイルやURIをOSの既定アプリで開く（Windows: startfile / macOS: open / その他: xdg-open）"""
+    if _PLATFORM == "Windows":
+        os.startfile(target)
+    elif _PLATFORM == "Darwin":
+        _spawn_detached(["open", target])
+    else:
+        _spawn_detached(["xdg-open", target])
+
+
+def _open_folder_with_os(folder: Path) -> None:
+    """フォルダをエクスプローラー/Finder等で開く（Windowsでは開いたウィンドウを前面化する）"""
+    if _PLATFORM == "Windows":
+        process = subprocess.Popen(['explorer', str(folder).replace('/', '\\')])
+        _bring_explorer_to_front(process.pid, folder)
+    else:
+        _open_with_os(str(folder))
+
+
+def _open_custom_uri(uri: str) -> None:
+    """obsidian:// 等のカスタムURIを開く（ObsidianはmacOSではアプリを指定し、起動後に前面化する）"""
+    is_obsidian = uri.startswith("obsidian://")
+    if _PLATFORM == "Darwin" and is_obsidian:
+        _spawn_detached(['open', '-a', 'Obsidian', uri])
+    else:
+        _open_with_os(uri)
+    if is_obsidian and _PLATFORM in ("Darwin", "Windows"):
+        _bring_obsidian_to_front()
+
+
 def _focus_window_handle(user32, kernel32, hwnd: int, restore_minimized: bool) -> bool:
     """
     Windowsウィンドウを前面化する。
@@ -448,7 +563,8 @@ def normalize_path(path: str) -> Path:
         
         # パストラバーサル対策: ベースディレクトリ外へのアクセスを制限
         # ただし、絶対パスが明示的に指定された場合はそちらを優先する（File Manager用途）
-        if not str(resolved).startswith(str(settings.base_dir.resolve())):
+        # 文字列の前方一致だと /base2 が /base に一致してしまうため、パス要素単位で判定する
+        if not resolved.is_relative_to(settings.base_dir_resolved):
              raise HTTPException(status_code=403, detail="アクセスが拒否されました")
              
         return resolved
@@ -456,58 +572,71 @@ def normalize_path(path: str) -> Path:
         raise HTTPException(status_code=400, detail=f"無効なパスです: {str(e)}")
 
 
+# 大きなフォルダでは項目数が数千〜数万になるため、モデルを組み立てずに dict のまま返す
+# （response_model の検証とJSON化は pydantic-core がまとめて行い、jsonable_encoder を通さない）
 @router.get("/files", response_model=DirectoryResponse)
-async def get_files(path: str = "") -> DirectoryResponse:
+async def get_files(path: str = "") -> dict:
     """
     ファイル一覧を取得
     """
     target_path = normalize_path(path)
 
-    def _get_files_sync(t_path: Path) -> Tuple[Path, List[FileItem]]:
-        if not t_path.exists():
+    def _get_files_sync(t_path: Path) -> Tuple[Path, List[dict]]:
+        # exists()/is_file()/is_dir() を個別に呼ぶと stat が3回走るため、1回の stat で判定する
+        try:
+            mode = os.stat(t_path).st_mode
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(status_code=404, detail="パスが見つかりません")
+        except (PermissionError, OSError):
+            raise HTTPException(status_code=403, detail="ディレクトリにアクセスできません")
 
         # ファイルパスが指定された場合、その親フォルダを表示する
-        if t_path.is_file():
+        if stat.S_ISREG(mode):
             t_path = t_path.parent
-
-        if not t_path.is_dir():
+        elif not stat.S_ISDIR(mode):
             raise HTTPException(status_code=400, detail="指定されたパスはディレクトリではありません")
 
-        items: List[FileItem] = []
-        target_root = str(t_path.resolve())
+        # FileItem と同じキーを持つ dict で組み立てる
+        items: List[dict] = []
+        # 循環リンク判定用のルートは、シンボリックリンクが見つかった時だけ解決する
+        target_root: Optional[str] = None
 
         try:
             with os.scandir(t_path) as entries:
                 for entry in entries:
                     try:
-                        if entry.is_symlink() and _is_recursive_symlink_target(entry.path, target_root):
+                        if _is_copy_temp_name(entry.name):
                             continue
 
-                        item_path = Path(entry.path)
-                        item_absolute_path = item_path.as_posix()
+                        # is_symlink()/is_dir() は readdir の型情報を使い、stat() は DirEntry 内にキャッシュされる
+                        if entry.is_symlink():
+                            if target_root is None:
+                                target_root = str(t_path.resolve())
+                            if _is_recursive_symlink_target(entry.path, target_root):
+                                continue
+
+                        # Path を経由せず DirEntry のパス文字列から直接POSIX形式にする
+                        item_absolute_path = _to_posix_str(entry.path)
                         is_dir = entry.is_dir()
 
                         if is_dir:
-                            items.append(
-                                FileItem(
-                                    name=entry.name,
-                                    type="directory",
-                                    path=item_absolute_path,
-                                )
-                            )
+                            items.append({
+                                "name": entry.name,
+                                "type": "directory",
+                                "path": item_absolute_path,
+                                "size": None,
+                                "modified": None,
+                            })
                             continue
 
                         stat_result = entry.stat()
-                        items.append(
-                            FileItem(
-                                name=entry.name,
-                                type="file",
-                                path=item_absolute_path,
-                                size=stat_result.st_size,
-                                modified=datetime.fromtimestamp(stat_result.st_mtime).isoformat(),
-                            )
-                        )
+                        items.append({
+                            "name": entry.name,
+                            "type": "file",
+                            "path": item_absolute_path,
+                            "size": stat_result.st_size,
+                            "modified": _format_mtime(stat_result.st_mtime),
+                        })
                     except (PermissionError, OSError):
                         continue
         except (PermissionError, OSError):
@@ -517,11 +646,11 @@ async def get_files(path: str = "") -> DirectoryResponse:
 
     resolved_path, items = await run_with_timeout(_get_files_sync, target_path)
 
-    return DirectoryResponse(
-        type="directory",
-        path=resolved_path.as_posix(),
-        items=items
-    )
+    return {
+        "type": "directory",
+        "path": resolved_path.as_posix(),
+        "items": items,
+    }
 
 
 # 共有フォルダを意図せず長時間走査しないための既定上限。
@@ -680,23 +809,70 @@ async def get_git_folder_statuses(request: GitFolderStatusesRequest) -> GitFolde
     return await run_with_timeout(_get_git_folder_statuses_sync, target_paths)
 
 
-def should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
+class IgnoreMatcher:
     """
-    パスが除外パターンに一致するかチェック
+    除外パターンを事前にコンパイルした判定器
+
+    判定内容は従来の should_ignore と同じで、次のいずれかに当てはまれば除外する。
+    - エントリ名が fnmatch でパターンに一致する
+    - エントリ名がパターンと完全に一致する
+    - パス文字列がパターンを部分文字列として含む
+    走査するエントリ数 × パターン数だけ fnmatch や部分一致を繰り返さないよう、検索開始時に1度だけまとめる。
+    - ワイルドカードなしの fnmatch: frozenset（O(1)のハッシュ参照）
+    - ワイルドカードありの fnmatch: 1本に結合した正規表現
+    - 部分一致: 全パターンを1本の正規表現（選択）にまとめ、search 1回で判定
     """
-    name = path.name
-    path_str = str(path)
-    for pattern in ignore_patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        if fnmatch.fnmatch(name, pattern):
+
+    __slots__ = ("exact", "literals", "glob_re", "substring_re")
+
+    def __init__(self, ignore_patterns: List[str]):
+        patterns = [p.strip() for p in ignore_patterns if p and p.strip()]
+
+        self.exact = frozenset(patterns)
+        # fnmatch.fnmatch と同様にOSの大文字小文字規則（os.path.normcase）で比較する
+        self.literals = frozenset(os.path.normcase(p) for p in patterns if not _has_glob_magic(p))
+        self.glob_re = _compile_globs(p for p in patterns if _has_glob_magic(p))
+        # 部分一致は従来通り大文字小文字を区別する（長いパターンを先に試しても結果は変わらない）
+        self.substring_re = re.compile("|".join(map(re.escape, patterns))) if patterns else None
+
+    def matches(self, name: str, path_str: str) -> bool:
+        """名前とパス文字列が除外対象かどうかを返す"""
+        if name in self.exact:
             return True
-        if name == pattern:
+        name_key = os.path.normcase(name)
+        if name_key in self.literals:
             return True
-        if pattern in path_str:
+        if self.glob_re is not None and self.glob_re.match(name_key):
             return True
-    return False
+        return self.substring_re is not None and self.substring_re.search(path_str) is not None
+
+
+def _compile_globs(patterns) -> Optional["re.Pattern[str]"]:
+    """fnmatch パターン群を1本の正規表現に結合する（空なら None）"""
+    translated = [fnmatch.translate(os.path.normcase(p)) for p in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+def _has_glob_magic(pattern: str) -> bool:
+    """fnmatch のワイルドカード文字を含むかどうか"""
+    return "*" in pattern or "?" in pattern or "[" in pattern
+
+
+def should_ignore(path: Path, ignore_patterns: List[str]) -> bool:
+    """
+    パスが除外パターンに一致するかチェック
+    """
+    return IgnoreMatcher(ignore_patterns).matches(path.name, str(path))
+
+
+# Live検索でディレクトリ走査を並列に行うスレッド数（readdir/stat中はGILが解放されるためI/O待ちを重ねられる）
+SEARCH_MAX_WORKERS = 8
+# Live検索のディレクトリ走査を実行するプール（検索毎にスレッドを作り直さない）
+SEARCH_POOL = ThreadPoolExecutor(max_workers=SEARCH_MAX_WORKERS, thread_name_prefix="fm-search")
+# 1回の検索で同時に投入しておく走査ジョブ数（結果は投入順に受け取るため、先読みの幅を抑える）
+SEARCH_PREFETCH = SEARCH_MAX_WORKERS * 2
 
 
 def search_files_recursive(
@@ -705,12 +881,20 @@ def search_files_recursive(
     current_depth: int,
     max_depth: int,
     ignore_patterns: List[str],
-    results: List[FileItem],
+    results: List[dict],
     max_results: int = 1000,
     file_type_filter: str = "all",
 ) -> None:
     """
-    os.scandirを使って再帰的にファイルを検索
+    os.scandirでファイルを検索（ディレクトリ単位でスレッドプールに分散、再帰呼び出しなし）
+
+    走査中は Path を生成せず DirEntry の名前・パス文字列・キャッシュ済みの種別情報を使い、
+    stat はクエリに一致したファイルに対してのみ行う。
+    ネットワークドライブでは readdir/stat が往復待ちになるため、複数ディレクトリを同時に走査する。
+    走査は階層ごと（浅い階層から）に行い、同じ階層のディレクトリはパス順に投入して投入順に結果を受け取る。
+    このため max_results で打ち切る場合も、浅い階層・パス順で数えた先頭 max_results 件になり、
+    スレッドの完了順によって結果が変わらない。返す結果はパス順に並べ替える。
+    結果は FileItem と同じキーを持つ dict で格納する（件数分のモデル生成・検証を避けるため）。
 
     Args:
         base_path: 検索開始ディレクトリ
@@ -718,7 +902,7 @@ def search_files_recursive(
         current_depth: 現在の階層
         max_depth: 最大検索階層（0=無制限）
         ignore_patterns: 除外パターンのリスト
-        results: 検索結果を格納するリスト
+        results: 検索結果（FileItem 相当の dict）を格納するリスト
         max_results: 最大結果数
         file_type_filter: 返却するファイルタイプ（all/file/directory）
     """
@@ -727,72 +911,115 @@ def search_files_recursive(
 
     query_lower = query.lower()
     search_root = str(base_path.resolve())
-    stack: List[Tuple[Path, int]] = [(base_path, current_depth)]
-
-    while stack and len(results) < max_results:
-        current_path, depth = stack.pop()
-
-        if max_depth > 0 and depth > max_depth:
-            continue
+    # 除外パターンは走査前に1度だけコンパイルする
+    ignore_matcher = IgnoreMatcher(ignore_patterns)
+    is_ignored = ignore_matcher.matches
+    include_dirs = file_type_filter in ("all", "directory")
+    include_files = file_type_filter in ("all", "file")
+
+    # 打ち切りが決まったら、実行中のワーカーにも走査の中断を知らせる
+    stop = threading.Event()
+    initial_count = len(results)
+
+    def scan_directory(current_path: str, depth: int) -> Tuple[List[dict], List[str]]:
+        """1ディレクトリを走査し、一致した項目（パス順）と、次の階層で走査する子ディレクトリを返す"""
+        found: List[dict] = []
+        child_dirs: List[str] = []
+        descend = max_depth == 0 or depth < max_depth
 
         try:
             with os.scandir(current_path) as entries:
-                child_dirs: List[Path] = []
                 for entry in entries:
-                    if len(results) >= max_results:
-                        return
-
+                    if stop.is_set():
+                        break
                     try:
-                        entry_path = Path(entry.path)
+                        name = entry.name
+                        entry_path = entry.path
 
-                        if should_ignore(entry_path, ignore_patterns):
+                        if is_ignored(name, entry_path) or _is_copy_temp_name(name):
                             continue
 
-                        if entry.is_symlink() and _is_recursive_symlink_target(entry.path, search_root):
+                        if entry.is_symlink() and _is_recursive_symlink_target(entry_path, search_root):
                             continue
 
                         is_dir = entry.is_dir()
-                        if query_lower in entry.name.lower():
+                        if query_lower in name.lower():
                             if is_dir:
-                                if file_type_filter in ("all", "directory"):
-                                    results.append(
-                                        FileItem(
-                                            name=entry.name,
-                                            type="directory",
-                                            path=entry_path.as_posix(),
-                                        )
-                                    )
-                            elif file_type_filter in ("all", "file"):
+                                if include_dirs:
+                                    found.append({
+                                        "name": name,
+                                        "type": "directory",
+                                        "path": _to_posix_str(entry_path),
+                                        "size": None,
+                                        "modified": None,
+                                    })
+                            elif include_files:
                                 try:
                                     stat = entry.stat()
-                                    results.append(
-                                        FileItem(
-                                            name=entry.name,
-                                            type="file",
-                                            path=entry_path.as_posix(),
-                                            size=stat.st_size,
-                                            modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                        )
-                                    )
+                                    found.append({
+                                        "name": name,
+                                        "type": "file",
+                                        "path": _to_posix_str(entry_path),
+                                        "size": stat.st_size,
+                                        "modified": _format_mtime(stat.st_mtime),
+                                    })
                                 except (PermissionError, OSError):
-                                    results.append(
-                                        FileItem(
-                                            name=entry.name,
-                                            type="file",
-                                            path=entry_path.as_posix(),
-                                        )
-                                    )
-
-                        if is_dir and (max_depth == 0 or depth < max_depth):
+                                    found.append({
+                                        "name": name,
+                                        "type": "file",
+                                        "path": _to_posix_str(entry_path),
+                                        "size": None,
+                                        "modified": None,
+                                    })
+
+                        if is_dir and descend:
                             child_dirs.append(entry_path)
 
                     except (PermissionError, OSError):
                         continue
-
-                for child_dir in reversed(child_dirs):
-                    stack.append((child_dir, depth + 1))
         except (PermissionError, OSError):
-            continue
+            return [], []
+
+        found.sort(key=itemgetter("path"))
+        return found, child_dirs
+
+    def scan_level(dirs: List[str], depth: int) -> Iterator[Tuple[List[dict], List[str]]]:
+        """同じ階層のディレクトリを並列に走査し、結果を dirs の順に返す（途中で閉じると残りは取り消す）"""
+        dir_iter = iter(dirs)
+        window = collections.deque(
+            SEARCH_POOL.submit(scan_directory, d, depth) for d in itertools.islice(dir_iter, SEARCH_PREFETCH)
+        )
+        try:
+            while window:
+                result = window.popleft().result()
+                next_dir = next(dir_iter, None)
+                if next_dir is not None:
+                    window.append(SEARCH_POOL.submit(scan_directory, next_dir, depth))
+                yield result
+        finally:
+            for future in window:
+                future.cancel()
+
+    remaining = max_results - initial_count
+    level = [str(base_path)]
+    depth = current_depth
+    try:
+        while level and remaining > 0:
+            next_level: List[str] = []
+            with contextlib.closing(scan_level(level, depth)) as scanned:
+                for found, child_dirs in scanned:
+                    results.extend(found[:remaining])
+                    remaining -= len(found)
+                    if remaining <= 0:
+                        break
+                    next_level.extend(child_dirs)
+            level = sorted(next_level)
+            depth += 1
+    finally:
+        stop.set()
+
+    # 階層ごとに集めているため、今回追加した分をパス順に揃える
+    results[initial_count:] = sorted(results[initial_count:], key=itemgetter("path"))
 
 
 class PathInfoResponse(BaseModel):
@@ -833,6 +1060,7 @@ async def get_path_info(path: str = "") -> PathInfoResponse:
     return await run_with_timeout(_get_path_info_sync, target_path)
 
 
+# 結果件数が多いため、モデルを組み立てずに dict のまま返す（検証とJSON化は pydantic-core に任せる）
 @router.get("/search", response_model=SearchResponse)
 async def search_files(
     path: str = Query("", description="検索開始ディレクトリ"),
@@ -841,7 +1069,7 @@ async def search_files(
     ignore: str = Query("", description="除外パターン（カンマ区切り）"),
     max_results: int = Query(1000, ge=1, le=10000, description="最大結果数"),
     file_type: str = Query("all", description="ファイルタイプフィルタ（all/file/directory）"),
-) -> SearchResponse:
+) -> dict:
     """
     ファイル検索（Liveモード - ディレクトリ走査）
 
@@ -856,20 +1084,20 @@ async def search_files(
         file_type: ファイルタイプフィルタ（all/file/directory）
 
     Returns:
-        SearchResponse: 検索結果
+        SearchResponse 相当のJSONレスポンス
     """
     ignore_patterns = [p.strip() for p in ignore.split(",") if p.strip()]
     default_ignores = [".git", ".svn", "__pycache__", ".DS_Store"]
     ignore_patterns.extend(default_ignores)
 
     if not query.strip():
-        return SearchResponse(
-            query=query,
-            path=path,
-            depth=depth,
-            total=0,
-            items=[],
-        )
+        return {
+            "query": query,
+            "path": path,
+            "depth": depth,
+            "total": 0,
+            "items": [],
+        }
 
     target_path = normalize_path(path)
 
@@ -879,8 +1107,10 @@ async def search_files(
     if not target_path.is_dir():
         raise HTTPException(status_code=400, detail="指定されたパスはディレクトリではありません")
 
-    results: List[FileItem] = []
-    search_files_recursive(
+    results: List[dict] = []
+    # 走査は数秒かかることがあるため、イベントループを塞がないようワーカースレッドで実行する
+    await asyncio.to_thread(
+        search_files_recursive,
         target_path,
         query,
         1,
@@ -891,13 +1121,13 @@ async def search_files(
         file_type,
     )
 
-    return SearchResponse(
-        query=query,
-        path=target_path.as_posix(),
-        depth=depth,
-        total=len(results),
-        items=results,
-    )
+    return {
+        "query": query,
+        "path": target_path.as_posix(),
+        "depth": depth,
+        "total": len(results),
+        "items": results,
+    }
 
 
 class DeleteRequest(BaseModel):
@@ -909,7 +1139,7 @@ class DeleteRequest(BaseModel):
     force_kill_pids: Optional[List[int]] = None  # 強制終了するプロセスのPIDリスト
 
 
-def _is_network_drive(path: Path) -> bool:
+def _is_network_drive(path: str | Path) -> bool:
     """ネットワークドライブかどうかを判定"""
     path_str = str(path)
     # macOS/Linuxのネットワークドライブ判定
@@ -968,7 +1198,8 @@ def _move_to_trash(path_str: str) -> None:
         if op.fAnyOperationsAborted:
             raise OSError("File deletion was aborted by user or system")
     else:
-        from send2trash import send2trash
+        if send2trash is None:
+            raise OSError("send2trash がインストールされていないため、ゴミ箱へ移動できません")
         send2trash(path_str)
 
 
@@ -1063,12 +1294,12 @@ def _kill_processes(pids: list[int]) -> None:
             pass
 
 
-def _clear_windows_readonly(path: Path) -> None:
+def _clear_windows_readonly(path: str | Path) -> None:
     if not settings.is_windows:
         return
 
     try:
-        path.chmod(path.stat().st_mode | stat.S_IWRITE)
+        os.chmod(path, os.stat(path).st_mode | stat.S_IWRITE)
     except OSError:
         pass
 
@@ -1084,7 +1315,24 @@ def _handle_rmtree_remove_readonly(func, path_str, exc_info):
     func(path_str)
 
 
-def _delete_with_retry(path: Path, is_network: bool) -> None:
+def _unlink_or_rmdir(path: str | Path) -> None:
+    """
+    直接削除（ゴミ箱を使わない）
+
+    ファイル削除が大半を占めるため、is_file()/is_symlink() の事前statを省いて
+    まず unlink を1回だけ発行し、ディレクトリだった場合のみ rmdir にフォールバックする。
+    （ネットワークドライブでは1回のシステムコールの往復が高コストなため）
+    """
+    try:
+        os.unlink(path)
+    except (IsADirectoryError, PermissionError):
+        # ディレクトリへの unlink は Linux では EISDIR、macOS/Windows では EPERM/EACCES になる
+        if os.path.islink(path) or not os.path.isdir(path):
+            raise
+        os.rmdir(path)
+
+
+def _delete_with_retry(path: str | Path, is_network: bool) -> None:
     """Windowsで一時的なファイルロックが残るケースを吸収する"""
     retry_count = WINDOWS_DELETE_RETRY_COUNT if settings.is_windows else 1
     last_error: Exception | None = None
@@ -1093,12 +1341,9 @@ def _delete_with_retry(path: Path, is_network: bool) -> None:
         try:
             _clear_windows_readonly(path)
             if is_network:
-                if path.is_file() or path.is_symlink():
-                    path.unlink()
-                else:
-                    path.rmdir()
+                _unlink_or_rmdir(path)
             else:
-                _move_to_trash(str(path))
+                _move_to_trash(os.fspath(path))
             return
         except (PermissionError, OSError) as exc:
             last_error = exc
@@ -1157,32 +1402,133 @@ def _safe_delete(path: Path, debug_mode: bool = False, force_kill_pids: Optional
         return False, str(e), locked_by
 
 
-def collect_all_files(path: Path) -> List[Path]:
+# 進捗更新の間引き: 件数ごと、または一定時間ごとにのみタスク状態（ロック付き）を更新する
+PROGRESS_UPDATE_EVERY = 64
+PROGRESS_UPDATE_INTERVAL_SECONDS = 0.1
+
+
+class _ProgressThrottle:
+    """
+    進捗更新を一定件数または一定時間ごとに間引く
+
+    大量ファイルの削除で1件ごとに task_manager を更新するとロック取得が処理件数分発生するため、
+    PROGRESS_UPDATE_EVERY 件ごと、または PROGRESS_UPDATE_INTERVAL_SECONDS 経過時のみ更新する。
+    """
+
+    __slots__ = ("_last_time",)
+
+    def __init__(self):
+        self._last_time = time.monotonic()
+
+    def ready(self, count: int) -> bool:
+        """count 件目で進捗を更新すべきかどうか"""
+        now = time.monotonic()
+        if count % PROGRESS_UPDATE_EVERY == 0 or now - self._last_time >= PROGRESS_UPDATE_INTERVAL_SECONDS:
+            self._last_time = now
+            return True
+        return False
+
+
+# 進捗を task_manager に通知する間隔（秒）。UI が追従できる程度（約30Hz）で十分
+PROGRESS_PUBLISH_INTERVAL = 1 / 30
+
+
+class _ProgressPublisher:
+    """
+    処理済み件数と処理中のファイル名を専用スレッドから一定間隔で task_manager に通知する
+
+    集計側は update() で値を置き換えるだけで、ファイル毎にロック付きの update_progress を呼ばない。
+    通知するのは進捗率（整数%）が変わったとき、PROGRESS_UPDATE_EVERY 件以上進んだとき、
+    または PROGRESS_UPDATE_INTERVAL_SECONDS 経過したとき（大きなファイルで処理中の名前を更新するため）のみ。
+    with ブロックを抜けるとスレッドを止め、最後の値を通知する。
+    """
+
+    def __init__(self, task_id: str, label: str = ""):
+        self._task_id = task_id
+        self._label = label
+        self._processed = 0
+        self._current_path = ""
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def update(self, processed: int, current_path: str) -> None:
+        """処理済み件数と処理中のパスを更新する（通知は専用スレッドが行う）"""
+        self._processed = processed
+        self._current_path = current_path
+
+    def _percent(self, processed: int) -> Optional[int]:
+        """処理済み件数から進捗率（整数%）を求める。総数が未確定なら None"""
+        task = task_manager.get_task(self._task_id)
+        total = task.total_files if task else 0
+        return processed * 100 // total if total > 0 else None
+
+    def _publish(self, processed: int, current_path: str, percent: Optional[int]) -> None:
+        if current_path:
+            task_manager.update_progress(
+                self._task_id,
+                processed_files=processed,
+                current_file=self._label + os.path.basename(current_path),
+                progress=percent,
+            )
+
+    def _run(self) -> None:
+        published = None
+        last_percent = None
+        last_processed = 0
+        last_time = time.monotonic()
+        while not self._stop.wait(PROGRESS_PUBLISH_INTERVAL):
+            processed, current_path = self._processed, self._current_path
+            if (processed, current_path) == published:
+                continue
+            percent = self._percent(processed)
+            now = time.monotonic()
+            if (
+                percent != last_percent
+                or processed - last_processed >= PROGRESS_UPDATE_EVERY
+                or now - last_time >= PROGRESS_UPDATE_INTERVAL_SECONDS
+            ):
+                self._publish(processed, current_path, percent)
+                published = (processed, current_path)
+                last_percent, last_processed, last_time = percent, processed, now
+
+    def __enter__(self) -> "_ProgressPublisher":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        processed = self._processed
+        self._publish(processed, self._current_path, self._percent(processed))
+
+
+def collect_all_files(path: Path) -> Iterator[Tuple[str, bool]]:
     """
     フォルダ内のすべてのファイルとディレクトリを収集する（深い階層から）
 
+    os.walk(topdown=False) は子ディレクトリを親より先に返すため、深さでのソートは不要。
+    ジェネレータとして順に返すので、全件をリスト化せずに削除処理へ流せる。
+    種別は走査時に判明しているため一緒に返し、削除側で is_file()/is_dir() を再度呼ばずに済むようにする。
+
     Args:
         path: 収集対象のパス
 
-    Returns:
-        ファイルとディレクトリのリスト（深い階層から浅い階層の順）
+    Yields:
+        (パス文字列, ディレクトリか) のタプル（深い階層から浅い階層の順、最後にルート自身）
     """
     if path.is_file():
-        return [path]
-
-    items = []
-    try:
-        # rglob("*")で全アイテムを取得し、深さでソート（深い順）
-        all_items = list(path.rglob("*"))
-        # パスの深さ（セパレータの数）で降順ソート
-        all_items.sort(key=lambda p: str(p).count(os.sep), reverse=True)
-        items.extend(all_items)
-        # 最後にルートディレクトリ自体を追加
-        items.append(path)
-    except (PermissionError, OSError):
-        pass
+        yield str(path), False
+        return
 
-    return items
+    for root, dirs, files in os.walk(path, topdown=False, followlinks=False):
+        for name in files:
+            yield os.path.join(root, name), False
+        # ディレクトリへのシンボリックリンクは os.walk が辿らないため、リンク自体をここで返す
+        for name in dirs:
+            dir_path = os.path.join(root, name)
+            if os.path.islink(dir_path):
+                yield dir_path, False
+        yield root, True
 
 
 def _safe_delete_with_progress(
@@ -1212,7 +1558,8 @@ def _safe_delete_with_progress(
     try:
         # ファイルリストを収集
         log(f"ファイルリスト収集開始: {path}")
-        items = collect_all_files(path)
+        # 総数を進捗に使うためリスト化する
+        items = list(collect_all_files(path))
         total_items = len(items)
         log(f"削除対象: {total_items}件")
 
@@ -1224,42 +1571,42 @@ def _safe_delete_with_progress(
 
         success_count = 0
         fail_count = 0
+        progress = _ProgressThrottle()
 
         # 各アイテムを削除（深い階層から）
-        for i, item in enumerate(items):
-            # キャンセルチェック
-            if task_id and task_manager.is_cancelled(task_id):
-                log("キャンセルが検出されました")
-                return False, "キャンセルされました", success_count, fail_count
-
-            # 進捗更新
-            if task_id:
+        for i, (item, is_dir) in enumerate(items):
+            name = os.path.basename(item)
+            # キャンセルチェックと進捗更新（間引いて行う）
+            if task_id and progress.ready(i):
+                if task_manager.is_cancelled(task_id):
+                    log("キャンセルが検出されました")
+                    return False, "キャンセルされました", success_count, fail_count
                 task_manager.update_progress(
                     task_id,
                     processed_files=i,
-                    current_file=item.name
+                    current_file=name
                 )
 
             try:
-                if item.is_file() or item.is_symlink():
+                if not is_dir:
                     # ファイルまたはシンボリックリンクを削除
                     _delete_with_retry(item, is_network=is_network)
-                    log(f"削除成功 ({i+1}/{total_items}): {item.name}")
+                    log(f"削除成功 ({i+1}/{total_items}): {name}")
                     success_count += 1
-                elif item.is_dir():
+                else:
                     # ディレクトリを削除（この時点で中身は空のはず）
                     try:
                         _delete_with_retry(item, is_network=is_network)
-                        log(f"ディレクトリ削除成功 ({i+1}/{total_items}): {item.name}")
+                        log(f"ディレクトリ削除成功 ({i+1}/{total_items}): {name}")
                         success_count += 1
                     except OSError as e:
                         # ディレクトリが空でない場合は警告を出すが続行
-                        log(f"ディレクトリ削除スキップ ({i+1}/{total_items}): {item.name} - {e}")
+                        log(f"ディレクトリ削除スキップ ({i+1}/{total_items}): {name} - {e}")
                         # 空でないディレクトリは強制削除を試みる
                         if is_network:
                             try:
                                 shutil.rmtree(
-                                    str(item),
+                                    item,
                                     onerror=_handle_rmtree_remove_readonly if settings.is_windows else None
                                 )
                                 success_count += 1
@@ -1268,7 +1615,7 @@ def _safe_delete_with_progress(
                         else:
                             fail_count += 1
             except Exception as e:
-                log(f"削除エラー ({i+1}/{total_items}): {item.name} - {e}")
+                log(f"削除エラー ({i+1}/{total_items}): {name} - {e}")
                 fail_count += 1
 
         # 最終進捗更新
@@ -1337,11 +1684,7 @@ async def delete_item(request: DeleteRequest):
         task = task_manager.create_task(total_files=1)
         task_id = task.id
 
-        thread = threading.Thread(
-            target=_execute_delete_async,
-            args=(task_id, target_path, request.debug_mode)
-        )
-        thread.start()
+        _submit_batch_job(task_id, _execute_delete_async, task_id, target_path, request.debug_mode)
 
         return {"status": "async", "task_id": task_id, "message": "削除処理を開始しました"}
 
@@ -1359,7 +1702,12 @@ async def delete_item(request: DeleteRequest):
         raise HTTPException(status_code=500, detail=f"削除に失敗しました: {message}")
 
 
-def count_files_in_directory(path: Path, max_depth: int = 3, current_depth: int = 0) -> int:
+def count_files_in_directory(
+    path: Path,
+    max_depth: int = 3,
+    current_depth: int = 0,
+    limit: Optional[int] = None,
+) -> int:
     """
     ディレクトリ内のファイル数をカウント（指定した深さまで）
 
@@ -1367,33 +1715,50 @@ def count_files_in_directory(path: Path, max_depth: int = 3, current_depth: int
         path: カウント対象のパス
         max_depth: 最大探索深度（デフォルト3）
         current_depth: 現在の深度（内部用）
+        limit: この件数に達したら探索を打ち切る（Noneなら上限なし）
 
     Returns:
-        ファイル数
+        ファイル数（limit 指定時は limit を超えない）
     """
-    if not path.exists():
+    if limit is not None and limit <= 0:
         return 0
 
-    if path.is_file():
+    try:
+        st = os.stat(path)
+    except (PermissionError, OSError):
+        return 0
+
+    if stat.S_ISREG(st.st_mode):
         return 1
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         return 0
 
+    return _count_files_scandir(os.fspath(path), max_depth, current_depth, limit)
+
+
+def _count_files_scandir(path_str: str, max_depth: int, current_depth: int, limit: Optional[int]) -> int:
+    """
+    count_files_in_directory の本体（os.scandir で DirEntry の型情報を使い、追加statを避ける）
+    """
     # 最大深度に達したら0を返す
     if current_depth >= max_depth:
         return 0
 
     count = 0
     try:
-        for item in path.iterdir():
-            try:
-                if item.is_file():
-                    count += 1
-                elif item.is_dir() and current_depth < max_depth:
-                    count += count_files_in_directory(item, max_depth, current_depth + 1)
-            except (PermissionError, OSError):
-                continue
+        with os.scandir(path_str) as it:
+            for entry in it:
+                if limit is not None and count >= limit:
+                    break
+                try:
+                    if entry.is_file():
+                        count += 1
+                    elif entry.is_dir():
+                        remaining = None if limit is None else limit - count
+                        count += _count_files_scandir(entry.path, max_depth, current_depth + 1, remaining)
+                except (PermissionError, OSError):
+                    continue
     except (PermissionError, OSError):
         pass
 
@@ -1404,6 +1769,8 @@ class CountFilesRequest(BaseModel):
     """ファイル数カウントリクエストのスキーマ"""
     paths: List[str]
     max_depth: int = 3
+    # 合計がこの件数に達したら探索を打ち切る（UIで「999+」のように表示する用途）
+    limit: Optional[int] = None
 
 
 class CountFilesResponse(BaseModel):
@@ -1428,9 +1795,10 @@ async def count_files(request: CountFilesRequest):
     details = []
 
     for path_str in request.paths:
+        remaining = None if request.limit is None else max(request.limit - total, 0)
         try:
             path = normalize_path(path_str)
-            count = count_files_in_directory(path, request.max_depth)
+            count = count_files_in_directory(path, request.max_depth, limit=remaining)
             total += count
             details.append({
                 "path": path_str,
@@ -1523,6 +1891,15 @@ class BatchDeleteRequest(BaseModel):
     force_kill_pids: Optional[List[int]] = None  # 強制終了するプロセスのPIDリスト
 
 
+def _delete_one(target_path: str, is_network: bool) -> Tuple[str, Optional[str]]:
+    """1件削除する（バッチ削除のスレッドプール用）。失敗時はエラーメッセージを返す"""
+    try:
+        _delete_with_retry(target_path, is_network=is_network)
+        return target_path, None
+    except Exception as e:
+        return target_path, str(e)
+
+
 def _execute_batch_delete_async(
     task_id: str,
     paths: List[str],
@@ -1538,153 +1915,112 @@ def _execute_batch_delete_async(
     task_manager.update_progress(task_id, processed_files=0, current_file="準備中...")
     log(f"削除開始: {len(paths)} パス")
 
-    # 削除キュー: path
-    del_queue = queue.Queue()
-    # ディレクトリリスト（後で削除するため）
-    dir_list = []
-    
+    # ディレクトリリスト: (パス, ネットワークドライブか)（後で削除するため）
+    dir_list: List[Tuple[Path, bool]] = []
     total_files = 0
-    scanned_files = 0
-    scanner_finished = False
 
-    # 統計
+    # 統計（結果はメインスレッドで受け取って集計するためロック不要）
     success_count = 0
     fail_count = 0
-    lock = threading.Lock()
-    results = []
-
-    def scanner_thread():
-        nonlocal total_files, scanner_finished
-        try:
-             for path_str in paths:
-                try:
-                    p = normalize_path(path_str)
-                    if not p.exists():
-                        continue
-                    
-                    if p.is_file() or p.is_symlink():
-                        # 単一ファイル
-                        total_files += 1
-                        del_queue.put(p)
-                    else:
-                        # ディレクトリの場合、再帰的に収集
-                        # topdown=Falseで深い方から...と言いたいが、
-                        # 並列削除の場合はファイルだけ先に全消しして、最後にディレクトリを消す方が安全かつ高速
-                        for root, dirs, files in os.walk(p):
-                            for name in files:
-                                file_path = Path(root) / name
-                                total_files += 1
-                                del_queue.put(file_path)
-                            
-                            for name in dirs:
-                                dir_path = Path(root) / name
-                                dir_list.append(dir_path)
-                        
-                        # ルートディレクトリも追加
-                        dir_list.append(p)
-                                
-                    # 定期的にタスク情報の総数を更新
-                    task = task_manager.get_task(task_id)
-                    if task:
-                        task.total_files = total_files
-
-                except Exception as e:
-                    log(f"スキャンエラー: {path_str} - {e}")
+    results: List[dict] = []
+    progress = _ProgressThrottle()
+    # 削除対象は通常同じディレクトリから選ばれるため、先頭パスのデバイスで並列度を決める
+    io_workers = _io_workers_for(paths[0]) if paths else MAX_IO_WORKERS
 
-        except Exception as e:
-            log(f"スキャンクリティカルエラー: {e}")
-        finally:
-            scanner_finished = True
-            log(f"スキャン完了: {total_files} ファイル")
-            # タスク情報の総数を最終更新
-            task = task_manager.get_task(task_id)
-            if task:
-                task.total_files = total_files
+    def update_total_files():
+        task = task_manager.get_task(task_id)
+        if task:
+            task.total_files = total_files
 
-    def worker_thread():
-        nonlocal success_count, fail_count, scanned_files
-        while True:
+    def iter_targets() -> Iterator[Tuple[str, bool]]:
+        """削除対象のファイルを (文字列パス, ネットワークドライブか) で順に返す"""
+        nonlocal total_files
+        for path_str in paths:
             try:
-                # キューから取得（タイムアウト付き）
-                try:
-                    target_path = del_queue.get(timeout=0.5)
-                except queue.Empty:
-                    if scanner_finished:
-                        break
+                p = normalize_path(path_str)
+                if not p.exists():
                     continue
 
-                try:
-                    # 削除実行
-                    is_network = _is_network_drive(target_path)
-                    item_success = False
-                    error_msg = ""
+                # 同じルート配下は同じドライブなので、ネットワーク判定はルートごとに1回だけ行う
+                is_network = _is_network_drive(p)
 
-                    try:
-                        _delete_with_retry(target_path, is_network=is_network)
-                        item_success = True
-                    except Exception as e:
-                        error_msg = str(e)
-
-                    with lock:
-                        if item_success:
-                            success_count += 1
-                            if debug_mode:
-                                log(f"削除成功: {target_path.name}")
-                        else:
-                            fail_count += 1
-                            log(f"削除失敗: {target_path.name} - {error_msg}")
-                            results.append({
-                                "path": str(target_path),
-                                "status": "error",
-                                "message": error_msg
-                            })
+                if p.is_file() or p.is_symlink():
+                    # 単一ファイル
+                    total_files += 1
+                    yield str(p), is_network
+                else:
+                    # ディレクトリの場合、再帰的に収集
+                    # 並列削除の場合はファイルだけ先に全消しして、最後にディレクトリを消す方が安全かつ高速
+                    # topdown=False は子ディレクトリを親より先に返すため、
+                    # dir_list はそのまま深い順になる（ルート自身が最後）
+                    # Path ではなく文字列パスを渡す（1件ごとの PurePath 生成・正規化を避ける）
+                    for root, dirs, files in os.walk(p, topdown=False):
+                        for name in files:
+                            total_files += 1
+                            yield os.path.join(root, name), is_network
+
+                        for name in dirs:
+                            dir_path = os.path.join(root, name)
+                            # ディレクトリへのシンボリックリンクは辿らずリンク自体をファイルとして削除
+                            if os.path.islink(dir_path):
+                                total_files += 1
+                                yield dir_path, is_network
 
-                        scanned_files += 1
-                        # 進捗更新
-                        task_manager.update_progress(
-                            task_id,
-                            processed_files=scanned_files,
-                            current_file=target_path.name
-                        )
+                        dir_list.append((Path(root), is_network))
 
-                finally:
-                    del_queue.task_done()
+                # ルートごとにタスク情報の総数を更新
+                update_total_files()
 
             except Exception as e:
-                log(f"ワーカースレッドエラー: {e}")
-
-    # スキャナー開始
-    t_scanner = threading.Thread(target=scanner_thread, daemon=True)
-    t_scanner.start()
-
-    # ワーカー開始
-    workers = []
-    for _ in range(MAX_WORKERS):
-        t = threading.Thread(target=worker_thread, daemon=True)
-        t.start()
-        workers.append(t)
-
-    # 全て終了するまで待機
-    t_scanner.join()
-    for t in workers:
-        t.join()
-
-    # 残ったディレクトリを削除（深い順にソートして削除）
-    # os.walkで集めたdir_listは順不同の可能性があるため、パスの深さでソート
-    dir_list.sort(key=lambda x: str(x).count(os.sep), reverse=True)
-    
+                log(f"スキャンエラー: {path_str} - {e}")
+
+        log(f"スキャン完了: {total_files} ファイル")
+        update_total_files()
+
+    def record(result: Tuple[str, Optional[str]]):
+        nonlocal success_count, fail_count
+        target_path, error_msg = result
+        if error_msg is None:
+            success_count += 1
+            if debug_mode:
+                log(f"削除成功: {os.path.basename(target_path)}")
+        else:
+            fail_count += 1
+            log(f"削除失敗: {os.path.basename(target_path)} - {error_msg}")
+            results.append({
+                "path": target_path,
+                "status": "error",
+                "message": error_msg
+            })
+
+        # 進捗更新（間引いて行う）
+        processed = success_count + fail_count
+        if progress.ready(processed):
+            task_manager.update_progress(
+                task_id,
+                processed_files=processed,
+                current_file=os.path.basename(target_path)
+            )
+
+    # スキャンしながら削除ジョブを共有プールに投入し、完了したものから結果を受け取る
+    for result in _run_bounded(IO_POOL, _delete_one, iter_targets(), io_workers):
+        record(result)
+
+    scanned_files = success_count + fail_count
+
+    # 残ったディレクトリを削除（スキャン時点で深い順に並んでいるためソート不要）
     log(f"ディレクトリ削除フェーズ: {len(dir_list)} 件")
     
-    for d in dir_list:
-        if task_manager.is_cancelled(task_id):
-            break
-        
-        # 進捗更新
-        task_manager.update_progress(task_id, processed_files=scanned_files, current_file=d.name)
+    task_manager.update_progress(task_id, processed_files=scanned_files)
+    for dir_index, (d, is_network) in enumerate(dir_list):
+        # キャンセルチェックと進捗更新（間引いて行う）
+        if progress.ready(dir_index):
+            if task_manager.is_cancelled(task_id):
+                break
+            task_manager.update_progress(task_id, processed_files=scanned_files, current_file=d.name)
         
         try:
             if d.exists():
-                is_network = _is_network_drive(d)
                 _delete_with_retry(d, is_network=is_network)
                 log(f"ディレクトリ削除: {d.name}")
         except Exception as e:
@@ -1732,8 +2068,7 @@ async def delete_items_batch(request: BatchDeleteRequest):
                 debug_mode=request.debug_mode
             )
 
-        thread = threading.Thread(target=run_batch_delete, daemon=True)
-        thread.start()
+        _submit_batch_job(task_id, run_batch_delete)
 
         return {"status": "async", "task_id": task_id, "message": "削除処理を開始しました"}
 
@@ -1824,6 +2159,13 @@ async def create_folder(request: CreateFolderRequest):
 
 
 
+def _write_text_file_sync(path: Path, content: str) -> None:
+    """テキストファイルを UTF-8 で書き込む（create-file / update-file 用）"""
+    with open(path, 'w', encoding='utf-8') as f:
+        if content:
+            f.write(content)
+
+
 class CreateFileRequest(BaseModel):
     """ファイル作成リクエストのスキーマ"""
 
@@ -1851,11 +2193,9 @@ async def create_file(request: CreateFileRequest):
         raise HTTPException(status_code=400, detail="同名のファイル/フォルダが既に存在します")
 
     try:
-        with open(new_file, 'w', encoding='utf-8') as f:
-            if request.content:
-                f.write(request.content)
-            else:
-                pass # 空ファイルを作成
+        # 書き込み中にイベントループを止めないようスレッドで実行する（content が空なら空ファイルを作成）
+        # 書き込みは途中で打ち切れないため run_with_timeout のタイムアウトは使わない
+        await asyncio.to_thread(_write_text_file_sync, new_file, request.content)
         return {"status": "success", "message": f"ファイルを作成しました: {new_file}", "path": str(new_file)}
     except PermissionError:
         raise HTTPException(status_code=403, detail="作成権限がありません")
@@ -1884,8 +2224,8 @@ async def update_file(request: UpdateFileRequest):
         raise HTTPException(status_code=400, detail="指定されたパスはディレクトリです")
 
     try:
-        with open(target_path, 'w', encoding='utf-8') as f:
-            f.write(request.content)
+        # 書き込み中にイベントループを止めないようスレッドで実行する
+        await asyncio.to_thread(_write_text_file_sync, target_path, request.content)
         return {"status": "success", "message": f"ファイルを更新しました: {target_path}"}
     except PermissionError:
         raise HTTPException(status_code=403, detail="更新権限がありません")
@@ -1993,69 +2333,237 @@ async def rename_item(request: RenameRequest):
 # 並列コピー・検証・安全な移動のヘルパー関数
 # ----------------------------------------------------------------
 
-# 並列処理のワーカー数（Turboモード）
-# I/O待ち時間を埋めるため、CPUコア数の64倍、最大512まで許可
-MAX_WORKERS = min(64, (os.cpu_count() or 4) * 8)
+# I/O（コピー・削除）の並列ワーカー数
+# I/O待ち時間を埋めるため、CPUコア数の8倍、最大64まで許可（NVMe/SSDの深いキューを埋める）
+MAX_IO_WORKERS = min(64, (os.cpu_count() or 4) * 8)
+# 回転ディスク（HDD）でのI/Oワーカー数
+# HDDはシークが律速のため、並列度を上げてもランダムアクセスが増えるだけで速くならない
+ROTATIONAL_IO_WORKERS = min(8, MAX_IO_WORKERS)
+# ネットワークファイルシステム（NFS/SMB 等）でのI/Oワーカー数
+# 往復遅延を埋めるには並列度が要るが、上げすぎるとサーバー側で詰まる
+NETWORK_IO_WORKERS = min(16, MAX_IO_WORKERS)
+# ネットワークファイルシステムとして扱う /proc/self/mountinfo のファイルシステム種別
+NETWORK_FS_TYPES = frozenset({
+    "nfs", "nfs4", "cifs", "smb3", "smbfs", "afs", "9p", "ceph", "glusterfs", "fuse.sshfs",
+})
+# チェックサム計算の並列ワーカー数（CPUバウンドのためコア数まで）
+MAX_HASH_WORKERS = os.cpu_count() or 4
+# 非同期モードのバッチ処理を同時に実行する数（各処理の中のI/Oは IO_POOL で並列化される）
+MAX_BATCH_JOBS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _is_rotational_device(st_dev: int) -> bool:
+    """
+    デバイス番号のブロックデバイスが回転ディスク（HDD）かどうかを判定する
+
+    Linux の sysfs（/sys/dev/block/<major>:<minor>）の queue/rotational を参照する。
+    パーティションの場合は親デバイスの queue を見る。
+    判定できない場合（Linux以外、ネットワークドライブ等）は False を返す。
+    """
+    if not hasattr(os, "major"):
+        return False
+    try:
+        device_dir = os.path.realpath(f"/sys/dev/block/{os.major(st_dev)}:{os.minor(st_dev)}")
+    except (OSError, ValueError):
+        return False
+    for base in (device_dir, os.path.dirname(device_dir)):
+        try:
+            with open(os.path.join(base, "queue", "rotational")) as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
 
 
-def fast_copy_file(src: Path, dest: Path) -> bool:
+@functools.lru_cache(maxsize=None)
+def _is_network_device(st_dev: int) -> bool:
     """
-    プラットフォーム固有の最適化を使用した高速ファイルコピー
-
-    - macOS (APFS): clonefile システムコール（Copy-on-Write、瞬時）
-    - Windows: CopyFileEx Win32 API（ネイティブコピー）
-    - Linux: sendfile システムコール（ゼロコピー）
+    デバイス番号のファイルシステムがネットワークファイルシステム（NFS/SMB 等）かどうかを判定する
 
-    エラー時は自動的にshutil.copy2にフォールバックする。
+    Linux の /proc/self/mountinfo で major:minor が一致するマウントの種別を参照する。
+    判定できない場合（Linux以外など）は False を返す。
+    """
+    if not hasattr(os, "major"):
+        return False
+    device = f"{os.major(st_dev)}:{os.minor(st_dev)}"
+    try:
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                # 形式: <id> <parent> <major:minor> <root> <mount point> ... - <fstype> <source> <options>
+                fields = line.split()
+                if len(fields) > 2 and fields[2] == device and " - " in line:
+                    fs_type = line.split(" - ", 1)[1].split(maxsplit=1)[0]
+                    return fs_type in NETWORK_FS_TYPES
+    except OSError:
+        pass
+    return False
 
-    Args:
-        src: コピー元ファイルのパス
-        dest: コピー先ファイルのパス
 
-    Returns:
-        コピー成功時True、失敗時はFileNotFoundErrorを発生
+def _io_workers_for(path: str | Path) -> int:
+    """
+    パスのあるデバイスに合わせたI/Oワーカー数を返す
 
-    Raises:
-        FileNotFoundError: ソースファイルが存在しない場合
+    ネットワークファイルシステムでは NETWORK_IO_WORKERS、HDD では ROTATIONAL_IO_WORKERS、
+    それ以外（SSD/NVMe/判定不能）では MAX_IO_WORKERS。
+    パスがまだ存在しない場合（コピー先など）は親ディレクトリのデバイスで判定する。
     """
-    if not src.exists():
-        raise FileNotFoundError(f"Source file not found: {src}")
+    for candidate in (path, os.path.dirname(os.fspath(path))):
+        try:
+            st_dev = os.stat(candidate).st_dev
+        except OSError:
+            continue
+        if _is_network_device(st_dev):
+            return NETWORK_IO_WORKERS
+        return ROTATIONAL_IO_WORKERS if _is_rotational_device(st_dev) else MAX_IO_WORKERS
+    return MAX_IO_WORKERS
 
-    system = platform.system()
 
-    try:
-        if system == "Darwin":
-            # macOS: clonefile を使用（APFS Copy-on-Write）
-            return _fast_copy_macos(src, dest)
-        elif system == "Windows":
+# プロセス全体で共有するスレッドプール（バッチ毎にスレッドを作り直さない）
+# スレッドは必要になった時点で max_workers まで作られ、以降は再利用される
+IO_POOL = ThreadPoolExecutor(max_workers=MAX_IO_WORKERS, thread_name_prefix="fm-io")
+HASH_POOL = ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS, thread_name_prefix="fm-hash")
+# 非同期モードのバッチ処理（コピー・移動・削除）全体を実行するプール。上限を超えた分は順番待ちになる
+BATCH_POOL = ThreadPoolExecutor(max_workers=MAX_BATCH_JOBS, thread_name_prefix="fm-batch")
+# バッチコピーの走査（Producer）を実行するプール。各バッチ処理が使う走査は1本なので BATCH_POOL と同数で待たされない
+# （IO_POOL で走査すると、キューが満杯で止まった走査がコピージョブの実行枠を塞ぐおそれがある）
+SCAN_POOL = ThreadPoolExecutor(max_workers=MAX_BATCH_JOBS, thread_name_prefix="fm-scan")
+
+
+def _submit_batch_job(task_id: str, fn, *args) -> None:
+    """
+    バッチ処理を BATCH_POOL で実行する（リクエスト毎にスレッドを作らない）
+
+    想定外の例外で処理が終了した場合はタスクをエラーにする（実行中のまま残さない）
+    """
+    def run():
+        try:
+            fn(*args)
+        except Exception as e:
+            print(f"[BATCH] 予期しないエラー: {e}")
+            task_manager.fail_task(task_id, str(e))
+
+    BATCH_POOL.submit(run)
+
+
+def _run_bounded(pool: ThreadPoolExecutor, fn, arg_tuples: Iterable[tuple], max_in_flight: int) -> Iterator:
+    """
+    共有プールで fn(*args) を実行し、完了したものから結果を返す
+
+    同時に投入するジョブ数を max_in_flight に制限する（共有プールでもデバイスに合わせた並列度を守り、
+    走査が処理より大きく先行してメモリを使いすぎないようにする）。
+    呼び出し側が途中でループを抜けると、未着手のジョブは取り消し、実行中のジョブの終了を待つ。
+    """
+    pending = set()
+    try:
+        for args in arg_tuples:
+            pending.add(pool.submit(fn, *args))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        wait(pending)
+
+
+def _fast_copy_function(src: str, dest: str) -> str:
+    """shutil.copytree の copy_function 用に fast_copy_file を呼ぶ（コピー先パスを返す）"""
+    fast_copy_file(Path(src), Path(dest))
+    return dest
+
+
+def fast_copy_file(src: Path, dest: Path, exclusive: bool = False) -> bool:
+    """
+    プラットフォーム固有の最適化を使用した高速ファイルコピー
+
+    - macOS (APFS): clonefile システムコール（Copy-on-Write、瞬時）
+    - Windows: CopyFileEx Win32 API（ネイティブコピー）
+    - Linux: sendfile システムコール（ゼロコピー）
+
+    エラー時は自動的にshutil.copy2にフォールバックする。
+
+    Args:
+        src: コピー元ファイルのパス
+        dest: コピー先ファイルのパス
+        exclusive: コピー先が既に存在する場合は上書きせず FileExistsError にする
+
+    Returns:
+        コピー成功時True、失敗時はFileNotFoundErrorを発生
+
+    Raises:
+        FileNotFoundError: ソースファイルが存在しない場合
+        FileExistsError: exclusive=True でコピー先が既に存在する場合
+    """
+    system = _PLATFORM
+
+    # Linux ではコピー元の open 自体が FileNotFoundError になるため、事前の stat を省く
+    if system != "Linux" and not src.exists():
+        raise FileNotFoundError(f"Source file not found: {src}")
+
+    try:
+        if system == "Darwin":
+            # macOS: clonefile を使用（APFS Copy-on-Write）
+            return _fast_copy_macos(src, dest, exclusive=exclusive)
+        elif system == "Windows":
             # Windows: CopyFileEx API を使用
-            return _fast_copy_windows(src, dest)
+            return _fast_copy_windows(src, dest, exclusive=exclusive)
         elif system == "Linux":
             # Linux: sendfile を使用
-            return _fast_copy_linux(src, dest)
+            return _fast_copy_linux(src, dest, exclusive=exclusive)
         else:
             # その他のプラットフォーム: フォールバック
-            shutil.copy2(str(src), str(dest))
+            _copy2(src, dest, exclusive)
             return True
+    except FileNotFoundError:
+        raise
+    except FileExistsError:
+        # 上書きしないコピーで既存ファイルがあった場合はフォールバックせずに呼び出し側へ伝える
+        if exclusive:
+            raise
+        _copy2(src, dest, exclusive)
+        return True
     except Exception as e:
         # エラー時はフォールバック
         try:
-            shutil.copy2(str(src), str(dest))
+            _copy2(src, dest, exclusive)
             return True
         except Exception:
             raise
 
 
-def _fast_copy_macos(src: Path, dest: Path) -> bool:
+def _copy2(src: str | Path, dest: str | Path, exclusive: bool = False) -> None:
+    """
+    shutil.copy2 相当のコピー（フォールバック用）
+
+    exclusive=True の場合はコピー先を排他作成（"xb"）で開き、既に存在すれば FileExistsError にする。
+    """
+    if not exclusive:
+        shutil.copy2(str(src), str(dest))
+        return
+    with open(src, "rb") as fsrc, open(dest, "xb") as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+    shutil.copystat(str(src), str(dest))
+
+
+def _fast_copy_macos(src: Path, dest: Path, exclusive: bool = False) -> bool:
     """
     macOS専用: clonefileシステムコールを使用した超高速コピー
 
     APFSファイルシステムでは、Copy-on-Write技術により瞬時にコピーが完了する。
     実際のデータコピーは書き込み時に発生する。
+    clonefile は既存のコピー先を上書きしない（EEXIST）ため、exclusive の判定もそのまま任せる。
 
     Args:
         src: コピー元ファイルのパス
         dest: コピー先ファイルのパス
+        exclusive: コピー先が既に存在する場合は FileExistsError にする
 
     Returns:
         コピー成功時True
@@ -2086,13 +2594,14 @@ def _fast_copy_macos(src: Path, dest: Path) -> bool:
         # EXDEV (18): 異なるファイルシステム間のコピー
         if errno in (45, 18):
             # サポートされていない場合はフォールバック
-            shutil.copy2(str(src), str(dest))
+            _copy2(src, dest, exclusive)
             return True
         else:
+            # EEXIST (17) は OSError のコンストラクタで FileExistsError になる
             raise OSError(errno, f"clonefile failed: {os.strerror(errno)}")
 
 
-def _fast_copy_windows(src: Path, dest: Path) -> bool:
+def _fast_copy_windows(src: Path, dest: Path, exclusive: bool = False) -> bool:
     """
     Windows専用: CopyFileEx Win32 APIを使用した高速コピー
 
@@ -2101,6 +2610,7 @@ def _fast_copy_windows(src: Path, dest: Path) -> bool:
     Args:
         src: コピー元ファイルのパス
         dest: コピー先ファイルのパス
+        exclusive: コピー先が既に存在する場合は FileExistsError にする（bFailIfExists）
 
     Returns:
         コピー成功時True
@@ -2113,26 +2623,37 @@ def _fast_copy_windows(src: Path, dest: Path) -> bool:
     kernel32.CopyFileW.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_bool]
     kernel32.CopyFileW.restype = ctypes.c_bool
 
-    # CopyFileWを呼び出し (既存ファイルがあれば上書き)
-    result = kernel32.CopyFileW(str(src), str(dest), False)
+    # CopyFileWを呼び出し (exclusive でなければ既存ファイルを上書き)
+    result = kernel32.CopyFileW(str(src), str(dest), exclusive)
 
     if not result:
         # エラー発生
         error_code = ctypes.get_last_error()
+        # ERROR_FILE_EXISTS (80): bFailIfExists 指定時にコピー先が既に存在する
+        if error_code == 80:
+            raise FileExistsError(f"Destination already exists: {dest}")
         raise OSError(f"CopyFileW failed with error code: {error_code}")
 
     return True
 
 
-def _fast_copy_linux(src: Path, dest: Path) -> bool:
+def _fast_copy_linux(
+    src: str | Path,
+    dest: str | Path,
+    dest_dir_fd: Optional[int] = None,
+    exclusive: bool = False,
+) -> bool:
     """
-    Linux専用: sendfileシステムコールを使用した高速コピー
+    Linux専用: copy_file_range / sendfile システムコールを使用した高速コピー
 
-    カーネル空間でゼロコピー転送を行い、ユーザー空間へのコピーを省略する。
+    copy_file_range はカーネル内でコピーし、btrfs/xfs 等ではreflink（ブロック共有）になる。
+    未対応のカーネル・ファイルシステムの組み合わせでは sendfile（ゼロコピー転送）にフォールバックする。
 
     Args:
         src: コピー元ファイルのパス
-        dest: コピー先ファイルのパス
+        dest: コピー先ファイルのパス（dest_dir_fd 指定時はそのディレクトリ内のファイル名）
+        dest_dir_fd: コピー先ディレクトリのFD（openat でディレクトリ部分の解決を省く）
+        exclusive: コピー先を O_EXCL で開き、既に存在する場合は FileExistsError にする
 
     Returns:
         コピー成功時True
@@ -2140,21 +2661,22 @@ def _fast_copy_linux(src: Path, dest: Path) -> bool:
     # os.sendfileが利用可能か確認（Linux専用機能）
     if not hasattr(os, 'sendfile'):
         # sendfileが使えない場合はフォールバック
-        shutil.copy2(str(src), str(dest))
+        _copy2(src, dest, exclusive)
         return True
 
-    # sendfileを使用してカーネル空間でコピー
     src_fd = os.open(str(src), os.O_RDONLY)
     try:
         src_stat = os.fstat(src_fd)
-        dest_fd = os.open(str(dest), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, src_stat.st_mode)
+        dest_flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+        dest_fd = os.open(str(dest), dest_flags, src_stat.st_mode, dir_fd=dest_dir_fd)
         try:
-            # sendfileでコピー
             total_size = src_stat.st_size
 
             # 空ファイルの場合はスキップ
             if total_size > 0:
-                offset = 0
+                offset = _copy_range_in_kernel(src_fd, dest_fd, total_size)
+                # copy_file_range はオフセット指定のためファイル位置が進まない。sendfile の書き込み位置を合わせる
+                os.lseek(dest_fd, offset, os.SEEK_SET)
                 while offset < total_size:
                     # sendfile(out_fd, in_fd, offset, count)
                     sent = os.sendfile(dest_fd, src_fd, offset, total_size - offset)
@@ -2162,9 +2684,19 @@ def _fast_copy_linux(src: Path, dest: Path) -> bool:
                         break
                     offset += sent
 
-            # タイムスタンプを保持
-            os.utime(dest, (src_stat.st_atime, src_stat.st_mtime))
-
+                # コピー元のデータはこの後使わないため、ページキャッシュから外してもらう
+                _advise_dontneed(src_fd)
+
+            # 既存ファイルへの上書き時は O_CREAT のモード指定が効かないため明示的に揃える
+            os.fchmod(dest_fd, stat.S_IMODE(src_stat.st_mode))
+            # タイムスタンプを保持（開いている fd に対して設定し、パスの再解決を省く）
+            os.utime(dest_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        except BaseException:
+            if exclusive:
+                # 作成したのはこの呼び出しなので消しておく（フォールバックの排他作成が既存扱いにならないように）
+                with contextlib.suppress(OSError):
+                    os.unlink(str(dest), dir_fd=dest_dir_fd)
+            raise
         finally:
             os.close(dest_fd)
     finally:
@@ -2173,22 +2705,416 @@ def _fast_copy_linux(src: Path, dest: Path) -> bool:
     return True
 
 
-def calculate_file_checksum(file_path: Path, chunk_size: int = 65536) -> str:
+def _fast_copy_linux_at(src: str, dest: str, dest_dir_fd: int) -> None:
+    """開いておいたコピー先ディレクトリFDを使ってコピーする（失敗時は fast_copy_file と同様に shutil.copy2 へ）"""
+    try:
+        _fast_copy_linux(src, os.path.basename(dest), dest_dir_fd=dest_dir_fd)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def fast_copy_many(pairs: List[Tuple[str, str]]) -> List[Tuple[str, bool, str]]:
     """
-    ファイルのSHA256チェックサムを計算する
-    
+    複数ファイルをまとめてコピーする（コピー先の親ディレクトリは作成済みであること）
+
+    Linux ではコピー先ディレクトリ毎にディレクトリFDを1度だけ開き、各ファイルは dir_fd 相対で開く
+    （ファイル毎にコピー先パスのディレクトリ部分を解決し直さない）。
+    それ以外のプラットフォームでは copy_file_worker を順に呼ぶ。
+
+    Args:
+        pairs: (コピー元パス, コピー先パス) の文字列のタプルのリスト
+
+    Returns:
+        (コピー元パス, 成功フラグ, メッセージ) のリスト（コピー先ディレクトリ毎にまとめた順）
+    """
+    if _PLATFORM != "Linux" or not hasattr(os, "sendfile"):
+        return [copy_file_worker(pair, make_parents=False) for pair in pairs]
+
+    by_dir: Dict[str, List[Tuple[str, str]]] = {}
+    for src, dest in pairs:
+        by_dir.setdefault(os.path.dirname(dest), []).append((src, dest))
+
+    results: List[Tuple[str, bool, str]] = []
+    for dest_dir, dir_pairs in by_dir.items():
+        try:
+            dir_fd = os.open(dest_dir, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            results.extend((src, False, str(e)) for src, _ in dir_pairs)
+            continue
+        try:
+            for src, dest in dir_pairs:
+                try:
+                    _fast_copy_linux_at(src, dest, dir_fd)
+                    results.append((src, True, "成功"))
+                except Exception as e:
+                    results.append((src, False, str(e)))
+        finally:
+            os.close(dir_fd)
+    return results
+
+
+def _copy_range_in_kernel(src_fd: int, dest_fd: int, total_size: int) -> int:
+    """
+    copy_file_range でコピーし、コピーできたバイト数を返す
+
+    copy_file_range が使えない（古いカーネル・ファイルシステム間コピー非対応など）場合は
+    その時点までのバイト数を返し、残りは呼び出し側が sendfile でコピーする。
+    """
+    if not hasattr(os, "copy_file_range"):
+        return 0
+
+    offset = 0
+    while offset < total_size:
+        try:
+            copied = os.copy_file_range(src_fd, dest_fd, total_size - offset, offset, offset)
+        except OSError:
+            return offset
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+# parallel_copy_directory で1ジョブにまとめるファイル数（fast_copy_many がディレクトリFDを使い回す単位）
+COPY_MANY_CHUNK_SIZE = 16
+
+# チェックサム計算の読み込みチャンクサイズ（大きいほどシステムコール回数とPython側のループが減る）
+CHECKSUM_CHUNK_SIZE = 4 * 1024 * 1024
+# blake3 でこのサイズ以上のファイルは mmap して内部並列（マルチスレッド）でハッシュする
+BLAKE3_MMAP_THRESHOLD = 16 * 1024 * 1024
+# チェックサムのメモ（LRU）に保持する件数
+CHECKSUM_CACHE_SIZE = 4096
+
+# 計算済みチェックサムのメモ: {(パス, mtime_ns, サイズ): ハッシュ}
+# コピー中に計算したコピー元のハッシュを、後続の検証で読み直さずに再利用するため。
+# 内容が変わればほぼ確実に mtime かサイズが変わるので、それをキーに含めて古い値を使わないようにする。
+_checksum_cache: "collections.OrderedDict[Tuple[str, int, int], str]" = collections.OrderedDict()
+_checksum_cache_lock = threading.Lock()
+
+
+def _checksum_cache_key(file_path: str | Path, st: os.stat_result) -> Tuple[str, int, int]:
+    """チェックサムのメモのキーを作る"""
+    return os.fspath(file_path), st.st_mtime_ns, st.st_size
+
+
+def _checksum_cache_get(key: Tuple[str, int, int]) -> Optional[str]:
+    """メモからチェックサムを取得する（無ければ None）"""
+    with _checksum_cache_lock:
+        checksum = _checksum_cache.get(key)
+        if checksum is not None:
+            _checksum_cache.move_to_end(key)
+        return checksum
+
+
+def _checksum_cache_put(key: Tuple[str, int, int], checksum: str) -> None:
+    """チェックサムをメモに記録する（上限を超えたら古いものから捨てる）"""
+    with _checksum_cache_lock:
+        _checksum_cache[key] = checksum
+        _checksum_cache.move_to_end(key)
+        while len(_checksum_cache) > CHECKSUM_CACHE_SIZE:
+            _checksum_cache.popitem(last=False)
+
+
+def _new_checksum_hasher():
+    """チェックサム計算用のハッシュオブジェクトを生成する（blake3 があれば BLAKE3、無ければ SHA256）"""
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
+
+def _advise_sequential(fd: int) -> None:
+    """先頭から末尾まで順に読むことをカーネルに伝え、先読みを増やしてもらう（対応OSのみ）"""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _advise_dontneed(fd: int) -> None:
+    """
+    読み終えたファイルのページキャッシュを不要とカーネルに伝える（対応OSのみ）
+
+    大きなツリーのコピー・検証で一度しか読まないデータがページキャッシュを占有し、
+    他の作業中データを追い出すのを防ぐ。
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+
+
+def calculate_file_checksum(
+    file_path: str | Path,
+    chunk_size: int = CHECKSUM_CHUNK_SIZE,
+    use_cache: bool = False,
+) -> str:
+    """
+    ファイルのチェックサムを計算する（コピー元/コピー先の一致検証用）
+
+    blake3 がインストールされていれば BLAKE3（SIMD・マルチスレッド）を使い、
+    無い環境では SHA256 を計算する。
+    値は同一プロセス内での比較にのみ使うため、アルゴリズムは環境によって異なってよい。
+    バッファ付きファイルオブジェクトを介さず os.open/os.read で大きなチャンクを直接読む。
+    use_cache=True の場合、パス・mtime・サイズが同じファイルはメモ済みの値を返す（コピー時に計算した値の再利用）。
+    メモを使うのはコピー元だけにすること。コピー先は copystat で mtime が引き継がれるため、
+    メモを引くと内容が壊れていても検証をすり抜けてしまう。
+
     Args:
         file_path: チェックサムを計算するファイルのパス
-        chunk_size: 読み込みチャンクサイズ（デフォルト64KB）
-    
+        chunk_size: 読み込みチャンクサイズ（デフォルト4MB）
+        use_cache: チェックサムのメモを参照・記録するか（コピー元のみ True）
+
+    Returns:
+        ハッシュの16進文字列
+    """
+    st = os.stat(file_path)
+    if use_cache:
+        cache_key = _checksum_cache_key(file_path, st)
+        cached = _checksum_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    hasher = _new_checksum_hasher()
+    if blake3 is not None and hasattr(hasher, "update_mmap") and st.st_size >= BLAKE3_MMAP_THRESHOLD:
+        hasher.update_mmap(file_path)
+        checksum = hasher.hexdigest()
+    else:
+        fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            _advise_sequential(fd)
+            if blake3 is None and hasattr(hashlib, "file_digest"):
+                # SHA256 は読み込みと更新のループごと C 実装（Python 3.11+）に任せる
+                # （チャンク毎のインタプリタのオーバーヘッドが無く、ループ全体で GIL を解放できる）
+                with open(fd, "rb", buffering=0, closefd=False) as f:
+                    checksum = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                while chunk := os.read(fd, chunk_size):
+                    hasher.update(chunk)
+                checksum = hasher.hexdigest()
+            _advise_dontneed(fd)
+        finally:
+            os.close(fd)
+
+    if use_cache:
+        _checksum_cache_put(cache_key, checksum)
+    return checksum
+
+
+def calculate_file_sample_checksum(file_path: str | Path, block_size: int = CHECKSUM_CHUNK_SIZE) -> str:
+    """
+    ファイルの先頭・中央・末尾のブロックだけからチェックサムを計算する（簡易検証用）
+
+    全体を読む calculate_file_checksum と違い、大きなファイルでも読み込みは最大3ブロック。
+    途中が切れた・ずれたコピーや末尾の欠けは検出できるが、サンプル外の破損は検出できない。
+    ファイルサイズもハッシュに含める。3ブロック以下の小さなファイルは全体をハッシュする。
+
+    Args:
+        file_path: チェックサムを計算するファイルのパス
+        block_size: 読み込むブロックのサイズ（デフォルト4MB）
+
     Returns:
-        SHA256ハッシュの16進文字列
+        ハッシュの16進文字列
     """
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+    hasher = _new_checksum_hasher()
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        hasher.update(size.to_bytes(8, "little"))
+        if size <= block_size * 3:
+            offsets = [0]
+            block_size = size
+        else:
+            offsets = [0, (size - block_size) // 2, size - block_size]
+        for offset in offsets:
+            os.lseek(fd, offset, os.SEEK_SET)
+            remaining = block_size
+            while remaining > 0 and (chunk := os.read(fd, remaining)):
+                hasher.update(chunk)
+                remaining -= len(chunk)
+    finally:
+        os.close(fd)
+    return hasher.hexdigest()
+
+
+# このサイズ以上のファイルをチェックサム付きでコピーする場合、コピー先を O_DIRECT で書き込む（Linux）
+DIRECT_IO_THRESHOLD = 16 * 1024 * 1024
+# O_DIRECT の書き込みで揃える必要があるバッファ・長さの境界
+DIRECT_IO_ALIGNMENT = 4096
+
+
+def _open_direct_for_write(dest: str | Path, flags: int = os.O_WRONLY | os.O_CREAT | os.O_TRUNC) -> Optional[int]:
+    """
+    コピー先を O_DIRECT で開く（O_DIRECT が無い環境・非対応のファイルシステムでは None）
+
+    flags に O_EXCL を含めた場合、コピー先が既に存在すれば FileExistsError をそのまま送出する。
+    """
+    if not hasattr(os, "O_DIRECT"):
+        return None
+    try:
+        return os.open(dest, flags | os.O_DIRECT, 0o666)
+    except FileExistsError:
+        raise
+    except OSError:
+        if flags & os.O_EXCL:
+            # 非対応のファイルシステムではファイルだけ作成されて失敗することがある。
+            # O_EXCL で EEXIST にならなかった以上、作成したのはこの呼び出しなので消しておく
+            with contextlib.suppress(OSError):
+                os.unlink(dest)
+        return None
+
+
+def _write_all(fd: int, view: memoryview) -> None:
+    """バッファの内容を最後まで書き込む（部分書き込みに対応）"""
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _copy_and_hash_direct(src_fd: int, dest_fd: int, hasher, chunk_size: int) -> None:
+    """
+    O_DIRECT で開いたコピー先へコピーしながらコピー元をハッシュする
+
+    O_DIRECT の書き込みはページキャッシュを経由しない（大きなファイルでキャッシュを汚さず、
+    close 時にまとめて書き出す待ちも無い）が、バッファのアドレスと長さをブロック境界に揃える必要がある。
+    匿名 mmap はページ境界に揃っているのでそれを読み込みバッファにし、
+    ファイル末尾の端数だけは O_DIRECT を外して通常の書き込みにする。
+    """
+    import fcntl
+
+    chunk_size = max(DIRECT_IO_ALIGNMENT, chunk_size - chunk_size % DIRECT_IO_ALIGNMENT)
+    with mmap.mmap(-1, chunk_size) as buf:
+        view = memoryview(buf)
+        try:
+            while True:
+                filled = 0
+                while filled < chunk_size:
+                    read = os.readv(src_fd, [view[filled:]])
+                    if read == 0:
+                        break
+                    filled += read
+                if filled == 0:
+                    break
+
+                hasher.update(view[:filled])
+                aligned = filled - filled % DIRECT_IO_ALIGNMENT
+                _write_all(dest_fd, view[:aligned])
+                if aligned < filled:
+                    flags = fcntl.fcntl(dest_fd, fcntl.F_GETFL)
+                    fcntl.fcntl(dest_fd, fcntl.F_SETFL, flags & ~os.O_DIRECT)
+                    _write_all(dest_fd, view[aligned:filled])
+                if filled < chunk_size:
+                    break
+        finally:
+            view.release()
+
+
+def copy_file_with_checksum(
+    src: str | Path,
+    dest: str | Path,
+    chunk_size: int = CHECKSUM_CHUNK_SIZE,
+    exclusive: bool = False,
+) -> str:
+    """
+    ファイルをコピーしながらコピー元のチェックサムを計算する（チェックサム検証付きコピー用）
+
+    コピー後に元ファイルを読み直してハッシュすると元データを2回読むことになるため、
+    コピーで読んだバッファをそのままハッシュにも渡し、元ファイルの読み込みを1回で済ませる。
+    DIRECT_IO_THRESHOLD 以上のファイルは、可能ならコピー先を O_DIRECT で書き込む。
+    タイムスタンプ・パーミッションは shutil.copy2 と同様に引き継ぐ。
+
+    Args:
+        src: コピー元ファイルのパス
+        dest: コピー先ファイルのパス
+        chunk_size: 読み込みチャンクサイズ（デフォルト4MB）
+        exclusive: コピー先を O_EXCL で開き、既に存在する場合は FileExistsError にする
+
+    Returns:
+        コピー元のチェックサム（calculate_file_checksum と同じ形式）
+    """
+    hasher = _new_checksum_hasher()
+    binary_flag = getattr(os, "O_BINARY", 0)
+    src_fd = os.open(src, os.O_RDONLY | binary_flag)
+    try:
+        _advise_sequential(src_fd)
+        src_stat = os.fstat(src_fd)
+        dest_flags = os.O_WRONLY | os.O_CREAT | (os.O_EXCL if exclusive else os.O_TRUNC)
+        dest_fd = _open_direct_for_write(dest, dest_flags) if src_stat.st_size >= DIRECT_IO_THRESHOLD else None
+        direct = dest_fd is not None
+        if not direct:
+            dest_fd = os.open(dest, dest_flags | binary_flag, 0o666)
+        try:
+            if direct:
+                _copy_and_hash_direct(src_fd, dest_fd, hasher, chunk_size)
+            else:
+                # 読み込みバッファは使い回す（チャンク毎に bytes を確保しない）
+                buf = memoryview(bytearray(chunk_size))
+                while read := os.readv(src_fd, [buf]):
+                    chunk = buf[:read]
+                    hasher.update(chunk)
+                    _write_all(dest_fd, chunk)
+            # コピー元は読み直さない（チェックサムは計算済み）ためキャッシュから外す
+            _advise_dontneed(src_fd)
+        finally:
+            os.close(dest_fd)
+    finally:
+        os.close(src_fd)
+
+    shutil.copystat(src, dest)
+    checksum = hasher.hexdigest()
+    # 後続の検証（calculate_file_checksum(use_cache=True)）でコピー元を読み直さないようにメモしておく
+    _checksum_cache_put(_checksum_cache_key(src, src_stat), checksum)
+    return checksum
+
+
+def _scandir_recursive(root: str) -> Iterator[Tuple[os.DirEntry, Tuple[str, ...]]]:
+    """
+    os.scandir でディレクトリ配下を再帰的に列挙する（親ディレクトリが子より先）
+
+    rglob("*") と違い Path を生成せず、DirEntry の種別・stat のキャッシュをそのまま使える。
+    ディレクトリへのシンボリックリンクは辿らない（エントリ自体は返す）。
+
+    Args:
+        root: 走査するディレクトリ
+
+    Yields:
+        (DirEntry, root からの相対パス要素のタプル)
+    """
+    stack: List[Tuple[str, Tuple[str, ...]]] = [(root, ())]
+    while stack:
+        current, rel_parts = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    entry_rel = rel_parts + (entry.name,)
+                    yield entry, entry_rel
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, entry_rel))
+                    except OSError:
+                        continue
+        except (PermissionError, OSError):
+            continue
+
+
+def _collect_tree(dir_path: Path) -> Dict[Tuple[str, ...], Tuple[int, str]]:
+    """
+    ディレクトリ配下のファイルを1回の走査で収集する
+
+    Args:
+        dir_path: 走査するディレクトリのパス
+
+    Returns:
+        {相対パス要素のタプル: (サイズ, フルパス)} の辞書
+    """
+    tree: Dict[Tuple[str, ...], Tuple[int, str]] = {}
+    for entry, rel_parts in _scandir_recursive(str(dir_path)):
+        if entry.is_file():
+            tree[rel_parts] = (entry.stat().st_size, entry.path)
+    return tree
 
 
 def get_directory_stats(dir_path: Path) -> Tuple[int, int]:
@@ -2201,16 +3127,36 @@ def get_directory_stats(dir_path: Path) -> Tuple[int, int]:
     Returns:
         (ファイル数, 合計サイズ) のタプル
     """
+    # 件数と合計だけが必要なので、_collect_tree のような辞書は作らずに集計する
+    # （種別は readdir 時の d_type で判定済み、stat はファイル1件につき1回のみ）
     file_count = 0
     total_size = 0
-    for item in dir_path.rglob("*"):
-        if item.is_file():
+    for entry, _ in _scandir_recursive(str(dir_path)):
+        if entry.is_file():
             file_count += 1
-            total_size += item.stat().st_size
+            total_size += entry.stat().st_size
     return file_count, total_size
 
 
-def verify_copy(src: Path, dest: Path, use_checksum: bool = False) -> Tuple[bool, str]:
+def _checksums_match(
+    rel_parts: Tuple[str, ...],
+    src_file: str,
+    dest_file: str,
+    sample: bool = False
+) -> Tuple[Tuple[str, ...], bool]:
+    """コピー元とコピー先のチェックサムを比較する（verify_copy の並列検証用）"""
+    if sample:
+        return rel_parts, calculate_file_sample_checksum(src_file) == calculate_file_sample_checksum(dest_file)
+    return rel_parts, calculate_file_checksum(src_file, use_cache=True) == calculate_file_checksum(dest_file)
+
+
+def verify_copy(
+    src: Path,
+    dest: Path,
+    use_checksum: bool = False,
+    src_checksum: Optional[str] = None,
+    sample: bool = False,
+) -> Tuple[bool, str]:
     """
     コピー結果を検証する
     
@@ -2218,6 +3164,9 @@ def verify_copy(src: Path, dest: Path, use_checksum: bool = False) -> Tuple[bool
         src: コピー元のパス
         dest: コピー先のパス
         use_checksum: チェックサム検証を使用するか（Falseの場合はサイズ比較のみ）
+        src_checksum: コピー時に計算済みのコピー元チェックサム（ファイルの場合、指定があれば再計算しない）
+        sample: チェックサムを先頭・中央・末尾のブロックだけで比較するか
+            （calculate_file_sample_checksum。use_checksum が True の場合のみ有効）
     
     Returns:
         (成功フラグ, メッセージ) のタプル
@@ -2232,8 +3181,11 @@ def verify_copy(src: Path, dest: Path, use_checksum: bool = False) -> Tuple[bool
         if src_size != dest_size:
             return False, f"サイズが一致しません (元: {src_size}, 先: {dest_size})"
         
-        if use_checksum:
-            src_hash = calculate_file_checksum(src)
+        if use_checksum and sample:
+            if calculate_file_sample_checksum(src) != calculate_file_sample_checksum(dest):
+                return False, "チェックサムが一致しません"
+        elif use_checksum:
+            src_hash = src_checksum if src_checksum is not None else calculate_file_checksum(src, use_cache=True)
             dest_hash = calculate_file_checksum(dest)
             if src_hash != dest_hash:
                 return False, "チェックサムが一致しません"
@@ -2241,47 +3193,63 @@ def verify_copy(src: Path, dest: Path, use_checksum: bool = False) -> Tuple[bool
         return True, "検証成功"
     
     elif src.is_dir():
-        # ディレクトリの場合
-        src_count, src_size = get_directory_stats(src)
-        dest_count, dest_size = get_directory_stats(dest)
+        # ディレクトリの場合（各ツリーを1回だけ走査し、件数・サイズ・チェックサム検証で使い回す）
+        src_tree = _collect_tree(src)
+        dest_tree = _collect_tree(dest)
+        src_count, src_size = len(src_tree), sum(size for size, _ in src_tree.values())
+        dest_count, dest_size = len(dest_tree), sum(size for size, _ in dest_tree.values())
         
         if src_count != dest_count:
             return False, f"ファイル数が一致しません (元: {src_count}, 先: {dest_count})"
         if src_size != dest_size:
             return False, f"合計サイズが一致しません (元: {src_size}, 先: {dest_size})"
+
+        missing = src_tree.keys() - dest_tree.keys()
+        if missing:
+            return False, f"ファイルが見つかりません: {Path(*min(missing))}"
         
-        if use_checksum:
-            # ディレクトリ内の全ファイルをチェックサム検証
-            for src_file in src.rglob("*"):
-                if src_file.is_file():
-                    rel_path = src_file.relative_to(src)
-                    dest_file = dest / rel_path
-                    if not dest_file.exists():
-                        return False, f"ファイルが見つかりません: {rel_path}"
-                    src_hash = calculate_file_checksum(src_file)
-                    dest_hash = calculate_file_checksum(dest_file)
-                    if src_hash != dest_hash:
-                        return False, f"チェックサムが一致しません: {rel_path}"
+        if use_checksum and src_tree:
+            # ディレクトリ内の全ファイルをチェックサム検証（ハッシュ計算中はGILが解放されるため並列化）
+            pairs = (
+                (rel_parts, src_file, dest_tree[rel_parts][1], sample)
+                for rel_parts, (_, src_file) in src_tree.items()
+            )
+            # HASH_POOL 自体がコア数で並列度を制限するので、待ち行列が途切れない程度に多めに投入する
+            for rel_parts, matched in _run_bounded(HASH_POOL, _checksums_match, pairs, MAX_HASH_WORKERS * 2):
+                if not matched:
+                    # 1件でも不一致なら残りの計算は不要（未着手の計算は取り消される）
+                    return False, f"チェックサムが一致しません: {Path(*rel_parts)}"
         
         return True, "検証成功"
     
     return False, "不明なファイルタイプ"
 
 
-def copy_file_worker(args: Tuple[Path, Path]) -> Tuple[Path, bool, str]:
+def copy_file_worker(
+    args: Tuple[str, str],
+    make_parents: bool = True,
+    with_checksum: bool = False
+) -> Tuple[str, bool, str]:
     """
     並列コピー用のワーカー関数（単一ファイルをコピー）
     
     Args:
-        args: (コピー元パス, コピー先パス) のタプル
+        args: (コピー元パス, コピー先パス) の文字列のタプル
+        make_parents: コピー先の親ディレクトリを作成するか（呼び出し側で作成済みならFalse）
+        with_checksum: コピーと同時にコピー元のチェックサムを計算してメモするか
+            （後でチェックサム検証する場合、検証時にコピー元を読み直さずに済む）
     
     Returns:
         (コピー元パス, 成功フラグ, メッセージ) のタプル
     """
     src, dest = args
     try:
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        fast_copy_file(src, dest)
+        if make_parents:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if with_checksum:
+            copy_file_with_checksum(src, dest)
+        else:
+            fast_copy_file(Path(src), Path(dest))
         return (src, True, "成功")
     except Exception as e:
         return (src, False, str(e))
@@ -2291,7 +3259,8 @@ def parallel_copy_directory(
     src: Path,
     dest: Path,
     task_id: Optional[str] = None,
-    debug_mode: bool = False
+    debug_mode: bool = False,
+    with_checksum: bool = False
 ) -> Tuple[bool, str, int, int]:
     """
     ディレクトリを並列コピーする
@@ -2301,6 +3270,7 @@ def parallel_copy_directory(
         dest: コピー先ディレクトリ
         task_id: タスクID（進捗追跡とキャンセル用）
         debug_mode: デバッグモード
+        with_checksum: コピーと同時にコピー元のチェックサムを計算してメモするか（copy_file_worker 参照）
     
     Returns:
         (成功フラグ, メッセージ, 成功数, 失敗数) のタプル
@@ -2309,22 +3279,23 @@ def parallel_copy_directory(
         if debug_mode:
             print(f"[PARALLEL_COPY] {msg}")
     
-    # コピー対象のファイルリストを収集
-    copy_tasks: List[Tuple[Path, Path]] = []
-    for src_file in src.rglob("*"):
-        if src_file.is_file():
-            rel_path = src_file.relative_to(src)
-            dest_file = dest / rel_path
-            copy_tasks.append((src_file, dest_file))
+    # コピー対象のファイルリストを収集（ファイルが1件も無い場合に備えてサブディレクトリも記録）
+    # ファイル毎に Path を作らず、文字列パスのまま扱う
+    dest_str = str(dest)
+    copy_tasks: List[Tuple[str, str]] = []
+    sub_dirs: List[str] = []
+    for entry, rel_parts in _scandir_recursive(str(src)):
+        if entry.is_file():
+            copy_tasks.append((entry.path, os.path.join(dest_str, *rel_parts)))
+        elif entry.is_dir():
+            sub_dirs.append(os.path.join(dest_str, *rel_parts))
     
     if not copy_tasks:
         # ファイルがない場合（空ディレクトリ）
-        dest.mkdir(parents=True, exist_ok=True)
+        os.makedirs(dest_str, exist_ok=True)
         # 空のサブディレクトリも作成
-        for src_dir in src.rglob("*"):
-            if src_dir.is_dir():
-                rel_path = src_dir.relative_to(src)
-                (dest / rel_path).mkdir(parents=True, exist_ok=True)
+        for sub_dir in sub_dirs:
+            os.makedirs(sub_dir, exist_ok=True)
         return True, "空ディレクトリをコピーしました", 0, 0
     
     total_files = len(copy_tasks)
@@ -2341,32 +3312,46 @@ def parallel_copy_directory(
     errors: List[str] = []
     cancelled = False
     
-    # 並列コピー実行
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(copy_file_worker, task): task for task in copy_tasks}
-        for future in as_completed(futures):
+    # コピー先の親ディレクトリは事前にまとめて作成しておく
+    # （ワーカーがファイルごとに mkdir を発行せずに済み、同じディレクトリへの mkdir 競合も起きない）
+    for parent_dir in sorted({os.path.dirname(dest_file) for _, dest_file in copy_tasks}):
+        os.makedirs(parent_dir, exist_ok=True)
+
+    # 共有プールで並列コピー（ループを抜けると未着手のコピーは取り消され、実行中のものは終了を待つ）
+    io_workers = _io_workers_for(dest)
+
+    def iter_results() -> Iterator[Tuple[str, bool, str]]:
+        if with_checksum:
+            copy_args = ((task, False, True) for task in copy_tasks)
+            yield from _run_bounded(IO_POOL, copy_file_worker, copy_args, io_workers)
+            return
+        # 走査順で同じディレクトリのファイルが連続するため、数件ずつまとめてディレクトリFDを使い回す
+        chunks = (
+            (copy_tasks[i:i + COPY_MANY_CHUNK_SIZE],)
+            for i in range(0, total_files, COPY_MANY_CHUNK_SIZE)
+        )
+        for chunk_results in _run_bounded(IO_POOL, fast_copy_many, chunks, io_workers):
+            yield from chunk_results
+
+    progress = _ProgressPublisher(task_id) if task_id else contextlib.nullcontext()
+    with progress, contextlib.closing(iter_results()) as results:
+        for src_file, success, msg in results:
             # キャンセルチェック
             if task_id and task_manager.is_cancelled(task_id):
                 log("キャンセルが検出されました")
                 cancelled = True
-                executor.shutdown(wait=False, cancel_futures=True)
                 break
             
-            src_file, success, msg = future.result()
             if success:
                 success_count += 1
-                log(f"コピー完了 ({success_count}/{total_files}): {src_file.name}")
+                log(f"コピー完了 ({success_count}/{total_files}): {os.path.basename(src_file)}")
             else:
                 fail_count += 1
-                errors.append(f"{src_file.name}: {msg}")
+                errors.append(f"{os.path.basename(src_file)}: {msg}")
             
-            # タスク進捗更新
+            # タスク進捗更新（通知は _ProgressPublisher が間引いて行う）
             if task_id:
-                task_manager.update_progress(
-                    task_id,
-                    processed_files=success_count + fail_count,
-                    current_file=src_file.name
-                )
+                progress.update(success_count + fail_count, src_file)
     
     if cancelled:
         return False, "キャンセルされました", success_count, fail_count
@@ -2377,12 +3362,55 @@ def parallel_copy_directory(
     return True, f"{success_count}ファイルをコピーしました", success_count, fail_count
 
 
+def _is_within(path_resolved: str, root_resolved: str) -> bool:
+    """
+    path が root 自身またはその配下かを文字列比較で判定する（どちらも解決済みのパス）
+
+    区切り文字まで含めて比較するため、/a/foo と /a/foobar は別ディレクトリとして扱う
+    """
+    return os.path.join(path_resolved, "").startswith(os.path.join(root_resolved, ""))
+
+
+def _resolve_child(dir_resolved: str, name: str) -> str:
+    """
+    解決済みディレクトリ直下の name を解決したパスを返す
+
+    親は解決済みなので、末尾がシンボリックリンクの場合だけ realpath する
+    （resolve() のようにパスの全要素を stat し直さない）
+    """
+    path = os.path.join(dir_resolved, name)
+    return os.path.realpath(path) if os.path.islink(path) else path
+
+
+def _try_rename_same_device(src: Path, dest: Path) -> bool:
+    """
+    移動元と移動先が同じファイルシステム上なら os.rename で移動する
+
+    rename は同一ファイルシステム内ならアトミックかつデータ量によらず一瞬で終わるため、
+    コピー → 検証 → 削除を丸ごと省ける。移動先が既に存在する場合（上書き・マージ）は
+    従来のコピー経路に任せる。
+
+    Returns:
+        リネームで移動できた場合True（Falseならコピー経路で移動する）
+    """
+    try:
+        if os.lstat(src).st_dev != os.stat(dest.parent).st_dev:
+            return False
+        if os.path.lexists(dest):
+            return False
+        os.rename(src, dest)
+        return True
+    except OSError:
+        return False
+
+
 def safe_move(
     src: Path,
     dest: Path,
     verify_checksum: bool = False,
     task_id: Optional[str] = None,
-    debug_mode: bool = False
+    debug_mode: bool = False,
+    sample_verify: bool = False
 ) -> Tuple[bool, str]:
     """
     安全な移動を実行する（コピー → 検証 → 削除）
@@ -2393,6 +3421,8 @@ def safe_move(
         verify_checksum: チェックサム検証を使用するか
         task_id: タスクID（非同期モード時に進捗追跡とキャンセルチェック用）
         debug_mode: デバッグモード（ログ出力用）
+        sample_verify: 先頭・中央・末尾のブロックのチェックサムで簡易検証するか
+            （verify_checksum が False の場合のみ有効）
     
     Returns:
         (成功フラグ, メッセージ) のタプル
@@ -2415,15 +3445,25 @@ def safe_move(
         # キャンセルチェック
         if check_cancelled():
             return False, "キャンセルされました"
+
+        # 同一ファイルシステム内ならリネームで完了（チェックサム検証を求められた場合はコピー経路で検証する）
+        if not verify_checksum and _try_rename_same_device(src, dest):
+            log("同一ファイルシステム内のためリネームで移動")
+            return True, "移動完了"
         
         # ステップ1: コピー
         log("ステップ1: コピー開始")
+        src_checksum: Optional[str] = None
         if src.is_file():
             dest.parent.mkdir(parents=True, exist_ok=True)
-            fast_copy_file(src, dest)
+            if verify_checksum:
+                # チェックサム検証時はコピーと同時にコピー元をハッシュし、元ファイルの再読み込みを省く
+                src_checksum = copy_file_with_checksum(src, dest)
+            else:
+                fast_copy_file(src, dest)
             log(f"ファイルコピー完了: {src.name}")
         else:
-            success, msg, _, fail_count = parallel_copy_directory(src, dest, task_id, debug_mode)
+            success, msg, _, fail_count = parallel_copy_directory(src, dest, task_id, debug_mode, verify_checksum)
             if not success or fail_count > 0:
                 # コピー失敗時はコピー先を削除
                 if dest.exists():
@@ -2442,7 +3482,10 @@ def safe_move(
         
         # ステップ2: 検証
         log("ステップ2: 検証開始")
-        verified, verify_msg = verify_copy(src, dest, verify_checksum)
+        if verify_checksum:
+            verified, verify_msg = verify_copy(src, dest, True, src_checksum)
+        else:
+            verified, verify_msg = verify_copy(src, dest, sample_verify, sample=True)
         if not verified:
             # 検証失敗時はコピー先を削除
             if dest.is_file():
@@ -2495,10 +3538,20 @@ class BatchMoveRequest(BaseModel):
     dest_path: str
     overwrite: bool = True  # デフォルトで上書き
     verify_checksum: bool = False  # チェックサム検証を有効化
+    # 検証方法: "size"=サイズ比較のみ, "sample"=先頭・中央・末尾のブロックのチェックサム, "full"=全体のチェックサム
+    # 未指定の場合は verify_checksum に従う（True なら "full"、False なら "size"）
+    verify_mode: Optional[Literal["size", "sample", "full"]] = None
     async_mode: bool = False  # 非同期モード（プログレス追跡用）
     debug_mode: bool = False  # デバッグモード（ログ出力用）
 
 
+def _resolve_verify_mode(verify_checksum: bool, verify_mode: Optional[str]) -> str:
+    """実際に使う検証方法を返す（verify_mode 未指定時は verify_checksum に従う）"""
+    if verify_mode is not None:
+        return verify_mode
+    return "full" if verify_checksum else "size"
+
+
 
 @router.post("/move")
 async def move_item(request: MoveRequest):
@@ -2545,13 +3598,15 @@ async def move_item(request: MoveRequest):
     else:
         raise HTTPException(status_code=500, detail=f"移動に失敗しました: {message}")
 
+# 同期モードの結果はパス数に比例して大きくなるため、戻り値注釈で pydantic-core に直接JSON化させる
 @router.post("/move/batch")
-async def move_items_batch(request: BatchMoveRequest, background_tasks: BackgroundTasks):
+async def move_items_batch(request: BatchMoveRequest, background_tasks: BackgroundTasks) -> dict:
     """
     複数のファイル/フォルダを安全に移動（コピー → 検証 → 削除）
     
     並列コピーを使用して高速化し、検証後に元ファイルを削除する。
-    verify_checksum が True の場合、SHA256によるチェックサム検証を行う。
+    verify_mode（未指定時は verify_checksum）に応じて、サイズ比較・サンプリングしたチェックサム・
+    全体のチェックサムのいずれかで検証する。
     async_mode が True の場合、バックグラウンドで処理しタスクIDを返す。
     """
     dest_path = normalize_path(request.dest_path)
@@ -2566,6 +3621,8 @@ async def move_items_batch(request: BatchMoveRequest, background_tasks: Backgrou
     if request.debug_mode:
         print(f"[BATCH_MOVE] 開始: Dest={dest_path}, Sources={request.src_paths}, Async={request.async_mode}")
 
+    verify_mode = _resolve_verify_mode(request.verify_checksum, request.verify_mode)
+
     # 非同期モードの場合
     if request.async_mode:
         # タスクを作成
@@ -2579,40 +3636,59 @@ async def move_items_batch(request: BatchMoveRequest, background_tasks: Backgrou
                 src_paths=request.src_paths,
                 dest_path=dest_path,
                 overwrite=request.overwrite,
-                verify_checksum=request.verify_checksum,
-                debug_mode=request.debug_mode
+                verify_checksum=verify_mode == "full",
+                debug_mode=request.debug_mode,
+                sample_verify=verify_mode == "sample"
             )
         
-        thread = threading.Thread(target=run_batch_move, daemon=True)
-        thread.start()
+        _submit_batch_job(task.id, run_batch_move)
         
         return {"status": "async", "task_id": task.id}
     
-    # 同期モード（従来通り）
-    return _execute_batch_move_sync(
+    # 同期モード（従来通り）。移動中もイベントループを塞がないよう、ワーカースレッドで実行する
+    return await asyncio.to_thread(
+        _execute_batch_move_sync,
         src_paths=request.src_paths,
         dest_path=dest_path,
         overwrite=request.overwrite,
-        verify_checksum=request.verify_checksum,
-        debug_mode=request.debug_mode
+        verify_checksum=verify_mode == "full",
+        debug_mode=request.debug_mode,
+        sample_verify=verify_mode == "sample"
     )
 
 
+# バッチ移動: キャンセルを確認する間隔（走査したエントリ数）
+SCAN_CANCEL_CHECK_INTERVAL = 256
+
+
+def _batch_root_results(src_paths: List[str], path_errors: Dict[str, str], success_message: str) -> List[dict]:
+    """
+    バッチ処理のルートパスごとの結果リストを作る
+
+    path_errors に記録されたパスはエラー、それ以外は success_message で成功とする
+    """
+    return [
+        {"path": src_str, "status": "error", "message": error}
+        if (error := path_errors.get(src_str)) is not None
+        else {"path": src_str, "status": "success", "message": success_message}
+        for src_str in src_paths
+    ]
+
+
 def _execute_batch_move(
     task_id: str,
     src_paths: List[str],
     dest_path: Path,
     overwrite: bool,
     verify_checksum: bool,
-    debug_mode: bool
+    debug_mode: bool,
+    sample_verify: bool = False
 ):
     """
-    バッチ移動をバックグラウンドで実行する（Producer-Consumerパターン）
-    スキャンとコピーを並列化して開始遅延を解消
+    バッチ移動をバックグラウンドで実行する
+    走査しながらコピージョブを共有プール（IO_POOL）に投入し、スキャンとコピーを並列化して開始遅延を解消
+    sample_verify が True の場合、コピー後に先頭・中央・末尾のブロックのチェックサムで簡易検証する
     """
-    import queue
-    import time
-    
     def log(msg: str):
         if debug_mode:
             print(f"[BATCH_MOVE:{task_id[:8]}] {msg}")
@@ -2622,34 +3698,34 @@ def _execute_batch_move(
     task_manager.update_progress(task_id, processed_files=0, current_file="準備中...")
     log(f"移動開始: {len(src_paths)} パス -> {dest_path}")
 
-    # キュー: (action, src_item, dest_item, root_src_path)
-    # action: "copy_file", "mkdir", "delete_file", "delete_dir"
-    work_queue = queue.Queue(maxsize=10000)
-    
-    # 結果管理
-    results_lock = threading.Lock()
+    # 結果管理（走査と結果の集計はこの関数のスレッドだけで行うためロック不要）
     results = []
     stats = {"success": 0, "fail": 0, "total_files_discovered": 0}
 
     # パス毎のエラー情報を保持
     path_errors = {}  # {src_path_str: error_message}
 
-    # コピー成功したルートパスを記録（削除用）
-    successfully_copied_roots = []  # [Path, ...]
+    # コピージョブのエラー (root_src, message)。deque.append はスレッドセーフなのでロック不要
+    # （コピーフェーズ完了後に path_errors へ反映する）
+    worker_errors = collections.deque()
+
+    # スキャンしたコピー元ディレクトリ（ファイル移動後に空になったものを削除するため）
+    # {ルートパス文字列: [ルート, サブディレクトリ, ...]}（親が子より先の順）
+    source_dirs: Dict[str, List[str]] = {}
 
-    # 完了フラグ
-    scan_complete = threading.Event()
-    
     # 初期の予定総数を仮設定（進捗バーを動かすため）
     initial_estimate = len(src_paths) * 10
     task_manager.get_task(task_id).total_files = initial_estimate
 
     # ---------------------------------------------------------
-    # スキャナー（Producer）: ディレクトリを走査してキューに入れる
+    # 走査: ディレクトリを走査してコピージョブの引数 (src, dest, root_src) を順に返す
+    # root_src はリクエストで指定されたパス文字列のまま（結果・エラーの紐付けキー）
     # ---------------------------------------------------------
-    def scanner_thread():
+    def iter_copy_jobs() -> Iterator[Tuple[str, str, str]]:
         log("スキャン開始")
         total_discovered = 0
+        # 移動先の解決はバッチ全体で1回だけ行う
+        dest_resolved = str(dest_path.resolve())
         
         for src_str in src_paths:
             # キャンセルチェック（ループ毎）
@@ -2659,20 +3735,20 @@ def _execute_batch_move(
             try:
                 src_path = normalize_path(src_str)
                 if not src_path.exists():
-                    with results_lock:
-                        path_errors[src_str] = "ファイルが見つかりません"
-                        results.append({"path": src_str, "status": "error", "message": "ファイルが見つかりません"})
-                        stats["fail"] += 1
+                    path_errors[src_str] = "ファイルが見つかりません"
+                    results.append({"path": src_str, "status": "error", "message": "ファイルが見つかりません"})
+                    stats["fail"] += 1
                     continue
                 
+                src_resolved = str(src_path)  # normalize_path で解決済み
+
                 # 自分自身のサブディレクトリへの移動チェック
                 if src_path.is_dir():
                     try:
-                        if str(dest_path.resolve()).startswith(str(src_path.resolve())):
-                            with results_lock:
-                                path_errors[src_str] = "自分自身のサブディレクトリには移動できません"
-                                results.append({"path": src_str, "status": "error", "message": "自分自身のサブディレクトリには移動できません"})
-                                stats["fail"] += 1
+                        if _is_within(dest_resolved, src_resolved):
+                            path_errors[src_str] = "自分自身のサブディレクトリには移動できません"
+                            results.append({"path": src_str, "status": "error", "message": "自分自身のサブディレクトリには移動できません"})
+                            stats["fail"] += 1
                             continue
                     except ValueError:
                         pass
@@ -2681,221 +3757,170 @@ def _execute_batch_move(
                 
                 # 同一パスチェック
                 try:
-                    if src_path.resolve() == final_dest.resolve():
-                        with results_lock:
-                            results.append({"path": src_str, "status": "success", "message": "移動元と移動先が同じです"})
-                            stats["success"] += 1
+                    if src_resolved == _resolve_child(dest_resolved, src_path.name):
+                        results.append({"path": src_str, "status": "success", "message": "移動元と移動先が同じです"})
+                        stats["success"] += 1
                         continue
                 except OSError:
                     pass
 
+                # 同一ファイルシステム内ならリネームで完了（スキャン・コピー・削除が不要）
+                if not verify_checksum and _try_rename_same_device(src_path, final_dest):
+                    log(f"リネームで移動: {src_path} -> {final_dest}")
+                    results.append({"path": src_str, "status": "success", "message": "移動完了"})
+                    stats["success"] += 1
+                    continue
+
                 # ファイル/ディレクトリの場合分け
                 if src_path.is_file():
-                    work_queue.put(("copy_file", src_path, final_dest, src_path))
                     total_discovered += 1
-                    with results_lock:
-                        stats["total_files_discovered"] += 1
-                        # 移動（コピー+削除）なので2カウント
-                        task_manager.get_task(task_id).total_files = stats["total_files_discovered"] * 2
+                    stats["total_files_discovered"] += 1
+                    task_manager.get_task(task_id).total_files = stats["total_files_discovered"]
+                    yield str(src_path), str(final_dest), src_str
                 
                 elif src_path.is_dir():
-                    # まずルートディレクトリ作成タスク
-                    work_queue.put(("mkdir", src_path, final_dest, src_path))
+                    # コピー先ディレクトリは走査しながら作成する。_scandir_recursive は親を子より先に返すので、
+                    # ファイルのコピージョブを投入する時点で親ディレクトリは必ず存在する
+                    # （コピージョブがファイル毎に makedirs して同じディレクトリを取り合うことがない）
+                    os.makedirs(final_dest, exist_ok=True)
                     
                     # 再帰的にスキャン (os.scandir使用で高速化)
-                    # delete用のリストは、コピー完了後に「深い順」に処理する必要があるため
-                    # ここではコピー順序（浅い順）でキューに入れ、削除はコピー完了を待つか、
-                    # あるいは別の戦略をとる。
-                    # 「移動」はコピー成功後に削除なので、ファイル単位で「コピー→削除」はできない（ディレクトリが消せない）
-                    # したがって、コピーフェーズと削除フェーズを分ける。
+                    # ファイルはコピー成功直後に削除する。ディレクトリはファイルが無くなるまで
+                    # 消せないため、ここで記録しておき、コピー完了後に深い順に rmdir する（再走査しない）
+                    dirs = [str(src_path)]
+                    source_dirs[src_str] = dirs
                     
-                    # scan_treeはジェネレータ
-                    for root, dirs, files in os.walk(str(src_path)):
-                        if task_manager.is_cancelled(task_id):
+                    # _scandir_recursive はジェネレータ。コピー先は相対パス要素から組み立てる
+                    # （ディレクトリごとの relative_to による文字列比較を避ける）
+                    # エントリ毎の Path 生成は走査が律速になるため、ジョブには文字列パスを渡す
+                    final_dest_str = str(final_dest)
+                    for entry_index, (entry, rel_parts) in enumerate(_scandir_recursive(str(src_path))):
+                        if entry_index % SCAN_CANCEL_CHECK_INTERVAL == 0 and task_manager.is_cancelled(task_id):
                             break
-                            
-                        root_path = Path(root)
-                        rel_path = root_path.relative_to(src_path)
-                        current_dest_dir = final_dest / rel_path
-                        
-                        # ディレクトリ作成
-                        for d in dirs:
-                            d_src = root_path / d
-                            d_dest = current_dest_dir / d
-                            work_queue.put(("mkdir", d_src, d_dest, src_path))
-                        
-                        # ファイルコピー
-                        for f in files:
-                            f_src = root_path / f
-                            f_dest = current_dest_dir / f
-                            work_queue.put(("copy_file", f_src, f_dest, src_path))
-                            
-                            total_discovered += 1
-                            if total_discovered % 10 == 0:
-                                with results_lock:
-                                    stats["total_files_discovered"] = total_discovered
-                                    # 移動操作なので x2
-                                    task_manager.get_task(task_id).total_files = total_discovered * 2 + 100 # バッファ
-
-            except Exception as e:
-                with results_lock:
-                    path_errors[src_str] = str(e)
-                    results.append({"path": src_str, "status": "error", "message": f"Scan error: {e}"})
-                    stats["fail"] += 1
-                continue  # エラーがあった場合は次のパスへ
 
-            # スキャンが成功した場合、後で削除するためにルートパスを記録
-            with results_lock:
-                successfully_copied_roots.append(src_path)
+                        entry_src = entry.path
+                        entry_dest = os.path.join(final_dest_str, *rel_parts)
 
-        log(f"スキャン完了: {total_discovered} ファイル")
-        with results_lock:
-             stats["total_files_discovered"] = total_discovered
-             task_manager.get_task(task_id).total_files = total_discovered * 2
-        scan_complete.set()
-
-    # ---------------------------------------------------------
-    # ワーカー（Consumer）: キューから取り出して実行
-    # ---------------------------------------------------------
-    def worker_thread():
-        while True:
-            try:
-                # タイムアウト付きで取得して完了チェック
-                item = work_queue.get(timeout=0.1)
-            except queue.Empty:
-                if scan_complete.is_set():
-                    break
-                continue
-                
-            # キャンセルフラグで処理をスキップ（task_done()はfinallyで必ず呼ぶ）
-            cancelled = task_manager.is_cancelled(task_id)
-
-            action, src, dest, root_src = item
-
-            try:
-                # キャンセルされている場合は処理をスキップ
-                if cancelled:
-                    continue
-
-                if action == "copy_file":
-                    # 親ディレクトリ作成はmkdirタスクで行われるが、念のため
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-
-                    # 上書きチェック
-                    if dest.exists():
-                        if overwrite:
-                            if dest.is_dir():
-                                shutil.rmtree(str(dest))
-                            else:
-                                dest.unlink()
-                        else:
-                            # スキップ（task_done()はfinallyで呼ぶ）
-                            with results_lock:
-                                stats["fail"] += 1
-                                # エラーログ等は省略
+                        # ディレクトリ作成
+                        if entry.is_dir():
+                            try:
+                                os.mkdir(entry_dest)
+                            except FileExistsError:
+                                pass
+                            except OSError as e:
+                                log(f"Error mkdir {entry_src}: {e}")
+                                worker_errors.append((src_str, str(e)))
+                            dirs.append(entry_src)
                             continue
 
-                    fast_copy_file(src, dest)
-
-                    if verify_checksum:
-                        if calculate_file_checksum(src) != calculate_file_checksum(dest):
-                            raise Exception("Checksum mismatch")
+                        total_discovered += 1
+                        if total_discovered % 10 == 0:
+                            stats["total_files_discovered"] = total_discovered
+                            task_manager.get_task(task_id).total_files = total_discovered + 100 # バッファ
 
-                    with results_lock:
-                        stats["success"] += 1
-                        processed = stats["success"] + stats["fail"]
-                        task_manager.update_progress(task_id, processed_files=processed, current_file=f"コピー: {src.name}")
-                    
-                    log(f"コピー成功: {src.name} -> {dest.name}")
+                        # ファイルコピー
+                        yield entry_src, entry_dest, src_str
 
-                elif action == "mkdir":
-                    dest.mkdir(parents=True, exist_ok=True)
-                    log(f"ディレクトリ作成: {dest.name}")
-            
             except Exception as e:
-                log(f"Error {action} {src}: {e}")
-                with results_lock:
-                    stats["fail"] += 1
-                    path_errors[str(root_src)] = str(e) # 親パスにエラーを紐付け
-            
-            finally:
-                work_queue.task_done()
+                path_errors[src_str] = str(e)
+                results.append({"path": src_str, "status": "error", "message": f"Scan error: {e}"})
+                stats["fail"] += 1
+                continue  # エラーがあった場合は次のパスへ
+
+        log(f"スキャン完了: {total_discovered} ファイル")
+        stats["total_files_discovered"] = total_discovered
+        task_manager.get_task(task_id).total_files = total_discovered
 
-    # スレッド開始
-    scanner = threading.Thread(target=scanner_thread, daemon=True)
-    scanner.start()
-    
-    workers = []
-    for _ in range(MAX_WORKERS):
-        t = threading.Thread(target=worker_thread, daemon=True)
-        t.start()
-        workers.append(t)
-        
-    # コピー完了を待機
-    scanner.join()
-    for t in workers:
-        t.join()
-        
-    log("コピーフェーズ完了。削除フェーズ開始")
-    
     # ---------------------------------------------------------
-    # 削除フェーズ（移動の場合のみ）
+    # コピージョブ（IO_POOL で実行）: 1ファイルをコピーしてコピー元を削除する
     # ---------------------------------------------------------
-    # コピーでエラーが出ていない root_src のみを削除対象とする
-    
-    del_success = 0
-    del_fail = 0
+    def move_file(src: str, dest: str, root_src: str) -> Tuple[bool, str]:
+        """1ファイルを移動する。(成功なら True・失敗/スキップなら False, コピー元パス) を返す"""
+        # src/dest は文字列パス（Path への変換は必要な箇所だけで行う）
+        try:
+            # 上書きチェック
+            if os.path.exists(dest):
+                if overwrite:
+                    if os.path.isdir(dest):
+                        shutil.rmtree(dest)
+                    else:
+                        os.unlink(dest)
+                else:
+                    # スキップ（コピー元は削除されずに残る）
+                    worker_errors.append((root_src, "同名のファイルが存在します"))
+                    return False, src
+
+            if verify_checksum:
+                # コピーと同時にコピー元をハッシュし、元ファイルの再読み込みを省く
+                if copy_file_with_checksum(src, dest) != calculate_file_checksum(dest):
+                    raise Exception("Checksum mismatch")
+            else:
+                fast_copy_file(Path(src), Path(dest))
+                if sample_verify and calculate_file_sample_checksum(src) != calculate_file_sample_checksum(dest):
+                    raise Exception("Checksum mismatch")
 
-    # ===============================================================
-    # ステップ2: 削除フェーズ（コピーが成功したルートパスのみ削除）
-    # ===============================================================
-    log(f"削除フェーズ開始: {len(successfully_copied_roots)} パス")
+            log(f"コピー成功: {os.path.basename(src)} -> {os.path.basename(dest)}")
 
-    if not successfully_copied_roots:
-        log("削除可能なパスがありません")
-    else:
-        for root_path in successfully_copied_roots:
-            # コピーエラーがあったパスはスキップ
-            if str(root_path) in path_errors:
-                log(f"コピーエラーがあったためスキップ: {root_path}")
-                continue
+            # コピー（と検証）が済んだらすぐにコピー元を削除する（削除のための再走査をしない）
+            try:
+                os.unlink(src)
+            except OSError as e:
+                # コピーは完了しているので成功として数え、エラー情報だけ記録する
+                log(f"削除エラー: {src} - {e}")
+                worker_errors.append((root_src, f"削除エラー: {e}"))
+            return True, src
 
+        except Exception as e:
+            log(f"Error copy_file {src}: {e}")
+            worker_errors.append((root_src, str(e)))  # 親パスにエラーを紐付け
+            return False, src
+
+    # 走査しながらコピージョブを共有プールに投入し、完了したものから集計する
+    # （同時実行数はコピー先デバイスに合わせる。キャンセル時は未着手のジョブが取り消される）
+    # 進捗はファイル毎ではなく _ProgressPublisher が一定間隔でまとめて通知する
+    with _ProgressPublisher(task_id, label="コピー: ") as progress:
+        for moved, src in _run_bounded(IO_POOL, move_file, iter_copy_jobs(), _io_workers_for(dest_path)):
+            if moved:
+                stats["success"] += 1
+            else:
+                stats["fail"] += 1
+            progress.update(stats["success"] + stats["fail"], src)
             if task_manager.is_cancelled(task_id):
                 log("キャンセルが検出されました")
                 break
 
-            try:
-                if not root_path.exists():
-                    log(f"既に削除済み: {root_path}")
-                    continue
+    for root_src_str, message in worker_errors:
+        path_errors[root_src_str] = message
+        
+    log("コピーフェーズ完了。空になったディレクトリを削除")
+
+    # ---------------------------------------------------------
+    # 空ディレクトリ削除（ファイルはコピー直後に削除済み）
+    # ---------------------------------------------------------
+    for root_str, dirs in source_dirs.items():
+        # エラーがあったパスは、コピーできなかった空ディレクトリを消さないようにスキップ
+        if root_str in path_errors:
+            log(f"コピーエラーがあったためスキップ: {root_str}")
+            continue
 
-                log(f"削除中: {root_path}")
-                task_manager.update_progress(task_id, processed_files=stats["success"], current_file=f"削除: {root_path.name}")
+        if task_manager.is_cancelled(task_id):
+            log("キャンセルが検出されました")
+            break
 
-                # ディレクトリまたはファイルを削除
-                if root_path.is_dir():
-                    shutil.rmtree(str(root_path))
-                    log(f"ディレクトリ削除完了: {root_path}")
-                else:
-                    root_path.unlink()
-                    log(f"ファイル削除完了: {root_path}")
+        # 記録順は親が先なので、逆順にすれば子から削除できる
+        for dir_str in reversed(dirs):
+            try:
+                os.rmdir(dir_str)
+            except OSError as e:
+                # 空でない（移動できなかったファイルが残っている）場合などは残す
+                log(f"ディレクトリを残します: {dir_str} - {e}")
+        log(f"ディレクトリ削除完了: {root_str}")
 
-            except Exception as e:
-                log(f"削除エラー: {root_path} - {e}")
-                # 削除エラーは致命的ではないので、エラー情報を記録して続行
-                with results_lock:
-                    path_errors[str(root_path)] = f"削除エラー: {str(e)}"
-    
     # 最終結果
     log(f"全完了: 成功={stats['success']}, 失敗={stats['fail']}")
     
     # Resultsリスト作成（ルートごとの結果）
-    final_results = []
-    for src_str in src_paths:
-        if src_str in path_errors:
-             final_results.append({"path": src_str, "status": "error", "message": path_errors[src_str]})
-        else:
-             final_results.append({"path": src_str, "status": "success", "message": "移動完了"})
+    final_results = _batch_root_results(src_paths, path_errors, "移動完了")
 
     task_manager.complete_task(task_id, result={
         "status": "completed",
@@ -2910,7 +3935,8 @@ def _execute_batch_move_sync(
     dest_path: Path,
     overwrite: bool,
     verify_checksum: bool,
-    debug_mode: bool
+    debug_mode: bool,
+    sample_verify: bool = False
 ):
     """
     バッチ移動を同期で実行する（従来モード）
@@ -2918,6 +3944,7 @@ def _execute_batch_move_sync(
     results = []
     success_count = 0
     fail_count = 0
+    dest_resolved = str(dest_path.resolve())
 
     for src_str in src_paths:
         src_path = normalize_path(src_str)
@@ -2931,7 +3958,8 @@ def _execute_batch_move_sync(
             continue
 
         try:
-            if src_path.is_dir() and str(dest_path.resolve()).startswith(str(src_path.resolve())):
+            src_resolved = str(src_path)  # normalize_path で解決済み
+            if src_path.is_dir() and _is_within(dest_resolved, src_resolved):
                  result["status"] = "error"
                  result["message"] = "自分自身のサブディレクトリには移動できません"
                  fail_count += 1
@@ -2941,7 +3969,7 @@ def _execute_batch_move_sync(
             final_dest = dest_path / src_path.name
 
             try:
-                if src_path.resolve() == final_dest.resolve():
+                if src_resolved == _resolve_child(dest_resolved, src_path.name):
                     result["status"] = "success"
                     result["message"] = "移動元と移動先が同じです"
                     success_count += 1
@@ -2963,7 +3991,7 @@ def _execute_batch_move_sync(
                      results.append(result)
                      continue
 
-            success, message = safe_move(src_path, final_dest, verify_checksum, None, debug_mode)
+            success, message = safe_move(src_path, final_dest, verify_checksum, None, debug_mode, sample_verify)
             if success:
                 result["status"] = "success"
                 result["message"] = "移動完了"
@@ -2988,6 +4016,156 @@ def _execute_batch_move_sync(
     }
 
 
+# バッチコピー: スキャナーとワーカー間でまとめて受け渡す作業数
+WORK_QUEUE_BATCH_SIZE = 64
+
+
+class _BatchQueue:
+    """
+    スキャナーからワーカーへ作業をまとめて受け渡す有界キュー（collections.deque + threading.Condition）
+
+    queue.Queue のように1件ごとにロックを取らず、put_many / get_batch で複数件をまとめて出し入れする。
+    投入側は最後に close() を呼び、取り出し側は空リストが返るまで get_batch を繰り返す（ポーリングしない）
+    """
+
+    def __init__(self, maxsize: int):
+        self._items: collections.deque = collections.deque()
+        self._maxsize = maxsize
+        self._closed = False
+        lock = threading.Lock()
+        self._not_empty = threading.Condition(lock)
+        self._not_full = threading.Condition(lock)
+
+    def put_many(self, items: List[tuple]) -> None:
+        """items をまとめて追加する（満杯の間は空きが出るまで待つ）"""
+        if not items:
+            return
+        with self._not_full:
+            self._not_full.wait_for(lambda: len(self._items) < self._maxsize)
+            self._items.extend(items)
+            self._not_empty.notify()
+
+    def get_batch(self, max_items: int) -> List[tuple]:
+        """最大 max_items 件を取り出す（空の間は待つ。close() 済みで空なら空リストを返す）"""
+        with self._not_empty:
+            self._not_empty.wait_for(lambda: self._items or self._closed)
+            items = self._items
+            batch = [items.popleft() for _ in range(min(max_items, len(items)))]
+            self._not_full.notify()
+            return batch
+
+    def close(self) -> None:
+        """これ以上投入しないことを通知し、待っている取り出し側を起こす"""
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+
+
+def _batch_copy_item(
+    src: str,
+    dest: str,
+    root_src: str,
+    overwrite: bool,
+    verify_checksum: bool
+) -> Tuple[str, str, str, str, Optional[str]]:
+    """
+    バッチコピーの1ファイルをコピーする（コピー先の親ディレクトリは作成済みであること）
+
+    共有状態には触れず結果だけを返す。集計は呼び出し側の1スレッドで行う
+    （コピーとハッシュ計算はGILを解放するため、プロセスではなくスレッドで並列化する）
+
+    Returns:
+        (status, src, dest, root_src, エラーメッセージ)
+        status は "success" / "skipped"（上書きしない既存ファイル）/ "error"
+    """
+    try:
+        if overwrite:
+            # 一時ファイルにコピーしてから置き換える（既存ファイルの確認・削除が不要になり、
+            # コピーや検証に失敗しても既存のファイルは壊れない）
+            target = f"{dest}{COPY_TEMP_MARKER}{uuid.uuid4().hex[:8]}"
+        else:
+            # コピー自体がコピー先を排他作成（O_EXCL / clonefile / bFailIfExists）し、
+            # 既に存在すれば FileExistsError になるのでスキップする（exists() で確認しない）
+            target = dest
+        exclusive = not overwrite
+        replaced = False
+
+        try:
+            if verify_checksum:
+                # コピーと同時にコピー元をハッシュし、元ファイルの再読み込みを省く
+                if copy_file_with_checksum(src, target, exclusive=exclusive) != calculate_file_checksum(target):
+                    raise Exception("Checksum mismatch")
+            else:
+                fast_copy_file(Path(src), Path(target), exclusive=exclusive)
+
+            if overwrite:
+                try:
+                    os.replace(target, dest)
+                except OSError:
+                    # 同名のディレクトリがある場合のみ削除して置き換える
+                    if not os.path.isdir(dest) or os.path.islink(dest):
+                        raise
+                    shutil.rmtree(dest)
+                    os.replace(target, dest)
+                replaced = True
+        except FileExistsError:
+            if exclusive:
+                # 既存のファイルには触れずにスキップする
+                return "skipped", src, dest, root_src, None
+            raise
+        except BaseException:
+            if exclusive:
+                # 途中まで書き込んだコピー先を残さない
+                with contextlib.suppress(OSError):
+                    os.unlink(target)
+            raise
+        finally:
+            if overwrite and not replaced:
+                # 失敗時（例外・中断）は一時ファイルを必ずここで削除する
+                with contextlib.suppress(OSError):
+                    os.unlink(target)
+        return "success", src, dest, root_src, None
+    except Exception as e:
+        return "error", src, dest, root_src, str(e)
+
+
+def _try_copy_single_file(
+    task_id: str,
+    src_str: str,
+    dest_path: Path,
+    overwrite: bool,
+    verify_checksum: bool
+) -> bool:
+    """
+    コピー元が1ファイルだけのバッチをこのスレッドでコピーし、タスクを完了させる
+
+    Returns:
+        処理した場合 True（ディレクトリ・存在しないパス・同一ファイルへのコピーは False を返し、通常の経路に任せる）
+    """
+    try:
+        src_path = normalize_path(src_str)
+        if not src_path.is_file() or str(src_path) == _resolve_child(str(dest_path.resolve()), src_path.name):
+            return False
+    except Exception:
+        return False
+
+    task_manager.get_task(task_id).total_files = 1
+    status, _, _, _, error = _batch_copy_item(
+        str(src_path), str(dest_path / src_path.name), src_str, overwrite, verify_checksum
+    )
+    task_manager.update_progress(task_id, processed_files=1, current_file=f"コピー: {src_path.name}")
+
+    success_count = 1 if status == "success" else 0
+    path_errors = {src_str: error} if status == "error" else {}
+    task_manager.complete_task(task_id, result={
+        "status": "completed",
+        "success_count": success_count,
+        "fail_count": 1 - success_count,
+        "results": _batch_root_results([src_str], path_errors, "コピー完了")
+    })
+    return True
+
+
 def _execute_batch_copy_async(
     task_id: str,
     src_paths: List[str],
@@ -3000,9 +4178,6 @@ def _execute_batch_copy_async(
     バッチコピーを実行（Producer-Consumerパターン）
     スキャンとコピーを並列化して開始遅延を解消
     """
-    import queue
-    import time
-
     def log(msg: str):
         if debug_mode:
             print(f"[BATCH_COPY] {msg}")
@@ -3012,9 +4187,13 @@ def _execute_batch_copy_async(
     task_manager.update_progress(task_id, processed_files=0, current_file="準備中...")
     log(f"コピー開始: {len(src_paths)} パス -> {dest_path}")
 
-    # キュー: (action, src_item, dest_item, root_src_path)
-    # action: "copy_file", "mkdir"
-    work_queue = queue.Queue(maxsize=10000)
+    # 1ファイルだけのコピーはスキャナースレッドやキューを使わず、このスレッドで済ませる
+    if len(src_paths) == 1 and _try_copy_single_file(task_id, src_paths[0], dest_path, overwrite, verify_checksum):
+        log("1ファイルのコピーを完了")
+        return
+
+    # キュー: (src, dest, root_src)  root_src はリクエストで指定されたパス文字列（エラーの紐付けキー）
+    work_queue = _BatchQueue(maxsize=10000)
     
     # 結果管理
     results_lock = threading.Lock()
@@ -3022,19 +4201,29 @@ def _execute_batch_copy_async(
     stats = {"success": 0, "fail": 0, "total_files_discovered": 0}
     path_errors = {}
     
-    # 完了フラグ
-    scan_complete = threading.Event()
-    
     # 初期見積もり
     task_manager.get_task(task_id).total_files = len(src_paths) * 10
 
     # ---------------------------------------------------------
     # スキャナー（Producer）
     # ---------------------------------------------------------
-    def scanner_thread():
+    def scan_sources():
         log("スキャン開始")
         total_discovered = 0
-        
+        # コピー先の解決はバッチ全体で1回だけ行う
+        dest_resolved = str(dest_path.resolve())
+        # キューへはまとめて投入する（1件ごとにロックを取らない）
+        pending: List[tuple] = []
+
+        def enqueue(item: tuple) -> None:
+            pending.append(item)
+            if len(pending) >= WORK_QUEUE_BATCH_SIZE:
+                flush()
+
+        def flush() -> None:
+            work_queue.put_many(pending)
+            pending.clear()
+
         for src_str in src_paths:
             if task_manager.is_cancelled(task_id): break
                 
@@ -3047,10 +4236,12 @@ def _execute_batch_copy_async(
                         stats["fail"] += 1
                     continue
 
+                src_resolved = str(src_path)  # normalize_path で解決済み
+
                 # 自分自身のサブディレクトリへのコピーチェック
                 if src_path.is_dir():
                     try:
-                        if str(dest_path.resolve()).startswith(str(src_path.resolve())):
+                        if _is_within(dest_resolved, src_resolved):
                             with results_lock:
                                 path_errors[src_str] = "自分自身のサブディレクトリにはコピーできません"
                                 results.append({"path": src_str, "status": "error", "message": "自分自身のサブディレクトリにはコピーできません"})
@@ -3063,7 +4254,7 @@ def _execute_batch_copy_async(
                 
                 # 同一ファイルへのコピーチェック
                 try:
-                    if src_path.resolve() == final_dest.resolve():
+                    if src_resolved == _resolve_child(dest_resolved, src_path.name):
                         with results_lock:
                             # エラーとするかスキップするか。Windowsだとエラーになる。
                             path_errors[src_str] = "同一ファイルへのコピーはできません"
@@ -3075,38 +4266,42 @@ def _execute_batch_copy_async(
 
                 # ファイル/ディレクトリの場合分け
                 if src_path.is_file():
-                    work_queue.put(("copy_file", src_path, final_dest, src_path))
+                    enqueue((str(src_path), str(final_dest), src_str))
                     total_discovered += 1
                     with results_lock:
                         stats["total_files_discovered"] += 1
                         task_manager.get_task(task_id).total_files = stats["total_files_discovered"]
                 
                 elif src_path.is_dir():
-                    work_queue.put(("mkdir", src_path, final_dest, src_path))
-                    
-                    # 再帰的にスキャン
-                    for root, dirs, files in os.walk(str(src_path)):
-                        if task_manager.is_cancelled(task_id): break
-                            
-                        root_path = Path(root)
-                        rel_path = root_path.relative_to(src_path)
-                        current_dest_dir = final_dest / rel_path
-                        
-                        for d in dirs:
-                            d_src = root_path / d
-                            d_dest = current_dest_dir / d
-                            work_queue.put(("mkdir", d_src, d_dest, src_path))
-                        
-                        for f in files:
-                            f_src = root_path / f
-                            f_dest = current_dest_dir / f
-                            work_queue.put(("copy_file", f_src, f_dest, src_path))
-                            
-                            total_discovered += 1
-                            if total_discovered % 100 == 0:
+                    # コピー先ディレクトリは走査しながらこのスレッドで作成する。_scandir_recursive は親を子より先に
+                    # 返すので、ファイルをキューに入れる時点で親ディレクトリは必ず存在する（ワーカーは mkdir しない）
+                    final_dest_str = str(final_dest)
+                    os.makedirs(final_dest_str, exist_ok=True)
+
+                    # 再帰的にスキャン（os.scandir の DirEntry の種別キャッシュを使い、ジョブには文字列パスを渡す）
+                    for entry_index, (entry, rel_parts) in enumerate(_scandir_recursive(str(src_path))):
+                        if entry_index % SCAN_CANCEL_CHECK_INTERVAL == 0 and task_manager.is_cancelled(task_id):
+                            break
+
+                        entry_dest = os.path.join(final_dest_str, *rel_parts)
+                        if entry.is_dir():
+                            try:
+                                os.mkdir(entry_dest)
+                            except FileExistsError:
+                                pass
+                            except OSError as e:
+                                log(f"Error mkdir {entry.path}: {e}")
                                 with results_lock:
-                                    stats["total_files_discovered"] = total_discovered
-                                    task_manager.get_task(task_id).total_files = total_discovered + 100
+                                    stats["fail"] += 1
+                                    path_errors[src_str] = str(e)
+                            continue
+
+                        enqueue((entry.path, entry_dest, src_str))
+                        total_discovered += 1
+                        if total_discovered % 100 == 0:
+                            with results_lock:
+                                stats["total_files_discovered"] = total_discovered
+                                task_manager.get_task(task_id).total_files = total_discovered + 100
 
             except Exception as e:
                 with results_lock:
@@ -3114,98 +4309,65 @@ def _execute_batch_copy_async(
                     results.append({"path": src_str, "status": "error", "message": f"Scan error: {e}"})
                     stats["fail"] += 1
 
+            flush()
+
+        flush()
         log(f"スキャン完了: {total_discovered} ファイル")
         with results_lock:
              stats["total_files_discovered"] = total_discovered
              task_manager.get_task(task_id).total_files = total_discovered
-        scan_complete.set()
+
+    def scanner_thread():
+        try:
+            scan_sources()
+        finally:
+            # 走査が例外で終わった場合も、取り出し側が待ち続けないよう必ず閉じる
+            work_queue.close()
 
     # ---------------------------------------------------------
     # ワーカー（Consumer）
     # ---------------------------------------------------------
-    def worker_thread():
+    def iter_work():
         while True:
-            try:
-                item = work_queue.get(timeout=0.1)
-            except queue.Empty:
-                if scan_complete.is_set():
-                    break
+            batch = work_queue.get_batch(WORK_QUEUE_BATCH_SIZE)
+            if not batch:
+                return
+            # キャンセル後もキューは読み捨て、スキャナーが put で詰まらないようにする
+            if task_manager.is_cancelled(task_id):
                 continue
-                
-            # キャンセルフラグで処理をスキップ（task_done()はfinallyで必ず呼ぶ）
-            cancelled = task_manager.is_cancelled(task_id)
-
-            action, src, dest, root_src = item
-
-            try:
-                # キャンセルされている場合は処理をスキップ
-                if cancelled:
-                    continue
-
-                if action == "copy_file":
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-
-                    if dest.exists():
-                        if overwrite:
-                            if dest.is_dir():
-                                shutil.rmtree(str(dest))
-                            else:
-                                dest.unlink()
-                        else:
-                            # スキップ（task_done()はfinallyで呼ぶ）
-                            with results_lock:
-                                stats["fail"] += 1
-                            continue
-
-                    fast_copy_file(src, dest)
-
-                    if verify_checksum:
-                        if calculate_file_checksum(src) != calculate_file_checksum(dest):
-                            raise Exception("Checksum mismatch")
+            for item in batch:
+                yield (*item, overwrite, verify_checksum)
+
+    # 走査開始（バッチ毎にスレッドを作らず共有プールで実行する）
+    scanner = SCAN_POOL.submit(scanner_thread)
+
+    # コピー本体は共有プールで並列実行し、結果の集計はこのスレッドだけで行う
+    # 進捗は _ProgressPublisher が一定間隔でまとめて通知する（ファイル毎に update_progress を呼ばない）
+    with _ProgressPublisher(task_id, label="コピー: ") as progress:
+        for status, src, dest, root_src, error in _run_bounded(
+            IO_POOL, _batch_copy_item, iter_work(), _io_workers_for(dest_path)
+        ):
+            with results_lock:
+                if status == "success":
+                    stats["success"] += 1
+                else:
+                    stats["fail"] += 1
+                if status == "error":
+                    path_errors[root_src] = error
+                processed = stats["success"] + stats["fail"]
+            progress.update(processed, src)
 
-                    with results_lock:
-                        stats["success"] += 1
-                        processed = stats["success"] + stats["fail"]
-                        task_manager.update_progress(task_id, processed_files=processed, current_file=f"コピー: {src.name}")
-                    
-                    log(f"コピー成功: {src.name} -> {dest.name}")
+            if status == "error":
+                log(f"Error copy_file {src}: {error}")
+            elif status == "success":
+                log(f"コピー成功: {os.path.basename(src)} -> {os.path.basename(dest)}")
 
-                elif action == "mkdir":
-                    dest.mkdir(parents=True, exist_ok=True)
-                    log(f"ディレクトリ作成: {dest.name}")
-            
-            except Exception as e:
-                log(f"Error {action} {src}: {e}")
-                with results_lock:
-                    stats["fail"] += 1
-                    path_errors[str(root_src)] = str(e)
-            
-            finally:
-                work_queue.task_done()
+    scanner.result()
 
-    # スレッド開始
-    scanner = threading.Thread(target=scanner_thread, daemon=True)
-    scanner.start()
-    
-    workers = []
-    for _ in range(MAX_WORKERS):
-        t = threading.Thread(target=worker_thread, daemon=True)
-        t.start()
-        workers.append(t)
-        
-    scanner.join()
-    for t in workers:
-        t.join()
-        
     # 最終結果
     log(f"全完了: 成功={stats['success']}, 失敗={stats['fail']}")
     
-    final_results = []
-    for src_str in src_paths:
-        if src_str in path_errors:
-             final_results.append({"path": src_str, "status": "error", "message": path_errors[src_str]})
-        else:
-             final_results.append({"path": src_str, "status": "success", "message": "コピー完了"})
+    final_results = _batch_root_results(src_paths, path_errors, "コピー完了")
 
     task_manager.complete_task(task_id, result={
         "status": "completed",
@@ -3214,70 +4376,19 @@ def _execute_batch_copy_async(
         "results": final_results
     })
 
-class BatchCopyRequest(BaseModel):
-    """一括コピーリクエストのスキーマ"""
-    src_paths: List[str]
-    dest_path: str
-    overwrite: bool = True  # デフォルトで上書き
-    verify_checksum: bool = False
-    async_mode: bool = False  # 非同期モード
-    debug_mode: bool = False  # デバッグモード
-
-
-@router.post("/copy/batch")
-async def copy_items_batch(request: BatchCopyRequest):
-    dest_path = normalize_path(request.dest_path)
-    
-    if not dest_path.exists() or not dest_path.is_dir():
-         raise HTTPException(status_code=404, detail="コピー先フォルダが見つかりません")
 
-    # 非同期モードの場合
-    if request.async_mode:
-        task = task_manager.create_task(total_files=len(request.src_paths))
-        task_id = task.id
-        
-        def run_copy():
-            _execute_batch_copy_async(
-                task_id, request.src_paths, dest_path, 
-                request.overwrite, request.verify_checksum, request.debug_mode
-            )
-        
-        thread = threading.Thread(target=run_copy)
-        thread.start()
-        
-        return {"status": "async", "task_id": task_id, "message": "コピー処理を開始しました"}
+def _execute_batch_copy_sync(src_paths: List[str], dest_path: Path, overwrite: bool) -> dict:
+    """
+    バッチコピーを同期で実行する（従来モード）
 
-    # 同期モードの場合（従来の処理）
+    ブロッキングI/Oのみで構成されるため、エンドポイントからは asyncio.to_thread で呼び出す
+    """
     results = []
     success_count = 0
     fail_count = 0
 
-    import shutil
-
-    def get_unique_path(base_dir: Path, name: str) -> Path:
-        """
-        同名ファイルが存在する場合、ユニークな名前を生成する
-        example.txt -> example copy.txt -> example copy 2.txt
-        """
-        candidate = base_dir / name
-        if not candidate.exists():
-            return candidate
-
-        stem = candidate.stem
-        suffix = candidate.suffix
-        
-        candidate = base_dir / f"{stem} copy{suffix}"
-        if not candidate.exists():
-            return candidate
-            
-        counter = 2
-        while True:
-             candidate = base_dir / f"{stem} copy {counter}{suffix}"
-             if not candidate.exists():
-                 return candidate
-             counter += 1
-
-    for src_str in request.src_paths:
+    dest_resolved = str(dest_path.resolve())
+    for src_str in src_paths:
         src_path = normalize_path(src_str)
         result = {"path": src_str, "status": "pending", "message": ""}
 
@@ -3290,7 +4401,8 @@ async def copy_items_batch(request: BatchCopyRequest):
 
         try:
             # 自分自身のサブディレクトリへのコピーチェック（ディレクトリの場合）
-            if src_path.is_dir() and str(dest_path.resolve()).startswith(str(src_path.resolve())):
+            src_resolved = str(src_path)  # normalize_path で解決済み
+            if src_path.is_dir() and _is_within(dest_resolved, src_resolved):
                  result["status"] = "error"
                  result["message"] = "自分自身のサブディレクトリにはコピーできません"
                  fail_count += 1
@@ -3302,7 +4414,7 @@ async def copy_items_batch(request: BatchCopyRequest):
             
             # 同一ファイルへのコピーをチェック
             try:
-                if src_path.resolve() == final_dest.resolve():
+                if src_resolved == _resolve_child(dest_resolved, src_path.name):
                     result["status"] = "error"
                     result["message"] = "同一ファイルへのコピーはできません"
                     fail_count += 1
@@ -3312,7 +4424,7 @@ async def copy_items_batch(request: BatchCopyRequest):
                 pass
 
             if final_dest.exists():
-                if request.overwrite:
+                if overwrite:
                     # 上書きの場合、削除してからコピー
                     if final_dest.is_dir():
                         shutil.rmtree(final_dest)
@@ -3327,7 +4439,8 @@ async def copy_items_batch(request: BatchCopyRequest):
                     continue
 
             if src_path.is_dir():
-                shutil.copytree(str(src_path), str(final_dest))
+                # 各ファイルのコピーも fast_copy_file（copy_file_range / clonefile 等）で行う
+                shutil.copytree(str(src_path), str(final_dest), copy_function=_fast_copy_function)
             else:
                 fast_copy_file(src_path, final_dest)
 
@@ -3349,6 +4462,47 @@ async def copy_items_batch(request: BatchCopyRequest):
         "results": results
     }
 
+
+class BatchCopyRequest(BaseModel):
+    """一括コピーリクエストのスキーマ"""
+    src_paths: List[str]
+    dest_path: str
+    overwrite: bool = True  # デフォルトで上書き
+    verify_checksum: bool = False
+    async_mode: bool = False  # 非同期モード
+    debug_mode: bool = False  # デバッグモード
+
+
+# 同期モードの結果はパス数に比例して大きくなるため、戻り値注釈で pydantic-core に直接JSON化させる
+@router.post("/copy/batch")
+async def copy_items_batch(request: BatchCopyRequest) -> dict:
+    dest_path = normalize_path(request.dest_path)
+    
+    if not dest_path.exists() or not dest_path.is_dir():
+         raise HTTPException(status_code=404, detail="コピー先フォルダが見つかりません")
+
+    # 非同期モードの場合
+    if request.async_mode:
+        task = task_manager.create_task(total_files=len(request.src_paths))
+        task_id = task.id
+        
+        def run_copy():
+            _execute_batch_copy_async(
+                task_id, request.src_paths, dest_path, 
+                request.overwrite, request.verify_checksum, request.debug_mode
+            )
+        
+        _submit_batch_job(task_id, run_copy)
+        
+        return {"status": "async", "task_id": task_id, "message": "コピー処理を開始しました"}
+
+    # 同期モードの場合（従来の処理）
+    # コピー中もイベントループを塞がないよう、ワーカースレッドで実行する
+    return await asyncio.to_thread(
+        _execute_batch_copy_sync, request.src_paths, dest_path, request.overwrite
+    )
+
+
 class OpenRequest(BaseModel):
     path: str
     prefer_embedded: bool = False
@@ -3384,7 +4538,7 @@ def _ensure_program_code_file(path: Path) -> None:
 
 def _build_editor_open_command(path: Path) -> List[str]:
     """OSごとのテキストエディター起動コマンドを返す。"""
-    system = platform.system()
+    system = _PLATFORM
     if system == "Darwin":
         return ["open", "-a", "TextEdit", str(path)]
     if system == "Windows":
@@ -3394,7 +4548,7 @@ def _build_editor_open_command(path: Path) -> List[str]:
 
 def _build_execute_command(path: Path) -> List[str]:
     """拡張子に応じた実行コマンドを返す。"""
-    system = platform.system()
+    system = _PLATFORM
     suffix = path.suffix.lower()
 
     if suffix in {".py", ".pyw"}:
@@ -3421,13 +4575,13 @@ async def open_in_vscode(request: OpenRequest):
     """
     path = normalize_path(request.path)
     
-    if platform.system() == 'Darwin':
+    if _PLATFORM == 'Darwin':
         vscode_path = '/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code'
         # Fallback for other locations or names if needed
         if not os.path.exists(vscode_path):
              # Try generic 'code' command
              vscode_path = 'code'
-    elif platform.system() == 'Windows':
+    elif _PLATFORM == 'Windows':
         vscode_path = os.path.join(os.environ["USERPROFILE"], r"AppData\Local\Programs\Microsoft VS Code\Code.exe")
     else:
         raise HTTPException(status_code=501, detail="サポートされていないOSです")
@@ -3436,11 +4590,11 @@ async def open_in_vscode(request: OpenRequest):
     target_path = path if path.exists() else path.parent
 
     try:
-        if platform.system() == 'Darwin':
+        if _PLATFORM == 'Darwin':
              # macOS specific AppleScript for focus (optional, keeping simple subprocess first)
-             subprocess.Popen([vscode_path, str(target_path)])
+             _spawn_detached([vscode_path, str(target_path)])
         else:
-             subprocess.Popen([vscode_path, str(target_path)])
+             _spawn_detached([vscode_path, str(target_path)])
         return {"status": "success", "message": "VS Codeで開きました"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"VS Codeの起動に失敗しました: {str(e)}")
@@ -3455,7 +4609,7 @@ async def open_in_editor(request: OpenRequest):
     _ensure_program_code_file(path)
 
     try:
-        subprocess.Popen(_build_editor_open_command(path))
+        _spawn_detached(_build_editor_open_command(path))
         return {"status": "success", "message": "エディターで開きました"}
     except HTTPException:
         raise
@@ -3473,7 +4627,7 @@ async def execute_program_code(request: OpenRequest):
 
     try:
         popen_kwargs = {"cwd": str(path.parent)}
-        if platform.system() == "Windows":
+        if _PLATFORM == "Windows":
             popen_kwargs["creationflags"] = getattr(subprocess, "CREATE_NEW_CONSOLE", 0)
         subprocess.Popen(_build_execute_command(path), **popen_kwargs)
         return {"status": "success", "message": "実行を開始しました"}
@@ -3494,13 +4648,7 @@ async def open_in_explorer(request: OpenRequest):
          raise HTTPException(status_code=404, detail="パスが見つかりません")
 
     try:
-        if platform.system() == "Windows":
-            process = subprocess.Popen(['explorer', str(target_path).replace('/', '\\')])
-            _bring_explorer_to_front(process.pid, target_path)
-        elif platform.system() == "Darwin":
-            subprocess.Popen(["open", str(target_path)])
-        else:
-            subprocess.Popen(["xdg-open", str(target_path)])
+        _open_folder_with_os(target_path)
         return {"status": "success", "message": "フォルダを開きました"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"フォルダを開けませんでした: {str(e)}")
@@ -3541,7 +4689,7 @@ async def view_pdf(path: str = Query(..., description="表示するPDFファイ
         raise HTTPException(status_code=400, detail="PDFファイルではありません")
 
     # 日本語ファイル名に対応するため、RFC 2231形式でエンコード
-    encoded_filename = urllib.parse.quote(target_path.name)
+    encoded_filename = _fast_quote(target_path.name)
 
     return FileResponse(
         path=target_path,
@@ -3562,12 +4710,7 @@ async def open_in_default_app(request: OpenRequest):
         raise HTTPException(status_code=404, detail="ファイルが見つかりません")
 
     try:
-        if platform.system() == "Windows":
-            os.startfile(str(path))
-        elif platform.system() == "Darwin":  # macOS
-            subprocess.Popen(["open", str(path)])
-        else:  # Linux
-            subprocess.Popen(["xdg-open", str(path)])
+        _open_with_os(str(path))
         return {"status": "success", "message": "ファイルを開きました"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"ファイルを開けませんでした: {str(e)}")
@@ -3651,6 +4794,34 @@ def _is_excalidraw_markdown(path: Path) -> bool:
     return ".excalidraw" in lower_name and lower_name.endswith(".md")
 
 
+# urllib.parse.quote（safe='/'）でエンコード不要なASCII文字
+_URL_SAFE_BYTES = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~/"
+
+
+def _fast_quote(s: str) -> str:
+    """
+    urllib.parse.quote と同じ結果を返すパーセントエンコード
+
+    英数字のみのファイル名など、エンコード不要な文字だけで構成される場合は
+    bytes.translate（C実装）で判定してそのまま返す。
+    """
+    if s.isascii() and not s.encode("ascii").translate(None, _URL_SAFE_BYTES):
+        return s
+    return urllib.parse.quote(s)
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_obsidian_uri(vault: str, rel: str, is_dir: bool) -> str:
+    """
+    Vault名とVault内の相対パスから obsidian:// URI を構築する（同じファイルの再オープン用にキャッシュ）
+
+    フォルダの場合は末尾に / を付けるとObsidianでフォルダが開く
+    """
+    if is_dir and rel and not rel.endswith('/'):
+        rel += '/'
+    return f"obsidian://open?vault={_fast_quote(vault)}&file={_fast_quote(rel)}"
+
+
 def resolve_file_app_url(path_obj: Path) -> Optional[str]:
     """
     ファイルパスから、専用アプリで開くためのURL/URIを解決する
@@ -3674,13 +4845,13 @@ def resolve_file_app_url(path_obj: Path) -> Optional[str]:
             name_lower.endswith('.svg') or 
             name_lower.endswith('.png')):
             
-            encoded_path = urllib.parse.quote(str(path_obj))
+            encoded_path = _fast_quote(str(path_obj))
             return f"http://localhost:3001/?filepath={encoded_path}"
 
     # --- Jupyter (.ipynb) ---
     if start_path.endswith('.ipynb'):
         # Windows specific logic: Port 8082, Root %USERPROFILE%/000_work
-        if platform.system() == 'Windows':
+        if _PLATFORM == 'Windows':
             JUPYTER_BASE_URL = "http://localhost:8082/tree"
             user_profile = os.environ.get("USERPROFILE")
             if user_profile:
@@ -3693,7 +4864,7 @@ def resolve_file_app_url(path_obj: Path) -> Optional[str]:
                     
                     if str(resolved_path).lower().startswith(str(resolved_root).lower()):
                         relative_path = resolved_path.relative_to(resolved_root)
-                        url_path = urllib.parse.quote(str(relative_path).replace('\\', '/'))
+                        url_path = _fast_quote(str(relative_path).replace('\\', '/'))
                         return f"{JUPYTER_BASE_URL}/{url_path}"
                 except (ValueError, OSError):
                     # File is not inside 000_work, fall back to default logic or handle error
@@ -3703,7 +4874,7 @@ def resolve_file_app_url(path_obj: Path) -> Optional[str]:
         JUPYTER_BASE_URL = "http://localhost:8888/lab/tree"
         try:
             relative_path = path_obj.relative_to(settings.base_dir)
-            url_path = urllib.parse.quote(str(relative_path).replace('\\', '/'))
+            url_path = _fast_quote(str(relative_path).replace('\\', '/'))
             return f"{JUPYTER_BASE_URL}/{url_path}"
         except ValueError:
             pass 
@@ -3720,14 +4891,12 @@ def resolve_file_app_url(path_obj: Path) -> Optional[str]:
         if obsidian_idx != -1:
             vault_name = parts[obsidian_idx]
             relative_file_path = '/'.join(parts[obsidian_idx+1:])
-            encoded_file = urllib.parse.quote(relative_file_path)
-            encoded_vault = urllib.parse.quote(vault_name)
-            return f"obsidian://open?vault={encoded_vault}&file={encoded_file}"
+            return _build_obsidian_uri(vault_name, relative_file_path, False)
 
     # --- PDF ---
     # PDFはプラットフォームに関係なくブラウザで別タブ表示する
     if start_path.endswith('.pdf'):
-        encoded_path = urllib.parse.quote(str(path_obj))
+        encoded_path = _fast_quote(str(path_obj))
         return f"/api/view-pdf?path={encoded_path}"
 
     return None
@@ -3778,14 +4947,14 @@ def _close_tab_response(
 
 def _build_frontend_editor_redirect_url(path: Path) -> str:
     """内蔵エディタで開くためのフロントエンドURLを組み立てる。"""
-    encoded_parent = urllib.parse.quote(str(path.parent))
-    encoded_file = urllib.parse.quote(str(path))
+    encoded_parent = _fast_quote(str(path.parent))
+    encoded_file = _fast_quote(str(path))
     return f"/?path={encoded_parent}&open_file={encoded_file}&open_mode=web"
 
 
 def _build_frontend_directory_redirect_url(path: Path) -> str:
     """フォルダ表示用のフロントエンドURLを組み立てる。"""
-    encoded_path = urllib.parse.quote(str(path))
+    encoded_path = _fast_quote(str(path))
     return f"/?path={encoded_path}"
 
 
@@ -3882,18 +5051,7 @@ async def open_smart(request: OpenRequest):
                 webbrowser.open(converted_path)
             else:
                 # カスタムURI (obsidian 等)
-                if platform.system() == 'Darwin':
-                    if converted_path.startswith("obsidian://"):
-                        subprocess.Popen(['open', '-a', 'Obsidian', converted_path])
-                        _bring_obsidian_to_front()
-                    else:
-                        subprocess.Popen(['open', converted_path])
-                elif platform.system() == 'Windows':
-                    os.startfile(converted_path)
-                    if converted_path.startswith("obsidian://"):
-                        _bring_obsidian_to_front()
-                else:
-                    subprocess.Popen(['xdg-open', converted_path])
+                _open_custom_uri(converted_path)
             
             return SmartOpenResponse(
                 status="success",
@@ -3947,18 +5105,7 @@ async def open_smart(request: OpenRequest):
                     webbrowser.open(target_url)
                 else:
                     # obsidian:// 等のカスタムURI
-                    if platform.system() == 'Darwin':
-                        if target_url.startswith("obsidian://"):
-                            subprocess.Popen(['open', '-a', 'Obsidian', target_url])
-                            _bring_obsidian_to_front()
-                        else:
-                            subprocess.Popen(['open', target_url])
-                    elif platform.system() == 'Windows':
-                        os.startfile(target_url)
-                        if target_url.startswith("obsidian://"):
-                            _bring_obsidian_to_front()
-                    else:
-                        subprocess.Popen(['xdg-open', target_url])
+                    _open_custom_uri(target_url)
 
                 return SmartOpenResponse(
                     status="success",
@@ -3986,12 +5133,7 @@ async def open_smart(request: OpenRequest):
 
         # --- その他 → OSデフォルトアプリ ---
         try:
-            if platform.system() == "Windows":
-                os.startfile(str(t_path))
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", str(t_path)])
-            else:
-                subprocess.Popen(["xdg-open", str(t_path)])
+            _open_with_os(str(t_path))
             return SmartOpenResponse(
                 status="success",
                 action="opened",
@@ -4009,7 +5151,7 @@ async def open_in_antigravity(request: OpenRequest):
     """
     path = normalize_path(request.path)
     
-    if platform.system() == 'Darwin':
+    if _PLATFORM == 'Darwin':
         # 起動可能なアプリケーションパッケージ（.app）の候補パス
         candidates = [
             '/Applications/Antigravity IDE.app',
@@ -4030,7 +5172,7 @@ async def open_in_antigravity(request: OpenRequest):
         raise HTTPException(status_code=404, detail="Antigravityが見つかりません")
 
     try:
-        subprocess.Popen(['open', '-a', antigravity_path, str(target_path)])
+        _spawn_detached(['open', '-a', antigravity_path, str(target_path)])
         return {"status": "success", "message": "Antigravityで開きました"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Antigravityの起動に失敗しました: {str(e)}")
@@ -4056,7 +5198,7 @@ async def open_in_jupyter(request: OpenRequest):
 
     # URLエンコード
     # Note: jupyterはパス区切りをスラッシュにする必要がある
-    url_path = urllib.parse.quote(str(relative_path).replace('\\', '/'))
+    url_path = _fast_quote(str(relative_path).replace('\\', '/'))
     target_url = f"{JUPYTER_BASE_URL}/{url_path}"
 
     try:
@@ -4080,7 +5222,7 @@ async def open_in_excalidraw(request: OpenRequest):
     # ここではシンプルにローカルパスを渡すクエリパラメータ形式と仮定
     # 実装例: http://localhost:3001/?file=/absolute/path/to/file.excalidraw
     
-    encoded_path = urllib.parse.quote(str(path))
+    encoded_path = _fast_quote(str(path))
     target_url = f"{EXCALIDRAW_BASE_URL}/?filepath={encoded_path}"
 
     try:
@@ -4119,20 +5261,13 @@ async def open_in_obsidian(request: OpenRequest):
         # Vault以降のパスを特定
         relative_file_path = '/'.join(parts[obsidian_idx+1:])
         
-        # フォルダの場合は末尾に / を付けるとObsidianでフォルダが開く
-        target_path = Path(file_path)
-        if target_path.is_dir() and relative_file_path and not relative_file_path.endswith('/'):
-            relative_file_path += '/'
+        # Obsidian URI を構築（フォルダの場合は末尾に / が付く）
+        obsidian_uri = _build_obsidian_uri(vault_name, relative_file_path, Path(file_path).is_dir())
         
-        # Obsidian URI を構築
-        encoded_file = urllib.parse.quote(relative_file_path)
-        encoded_vault = urllib.parse.quote(vault_name)
-        obsidian_uri = f"obsidian://open?vault={encoded_vault}&file={encoded_file}"
-        
-        if platform.system() == 'Darwin':  # macOS
-            subprocess.Popen(['open', '-a', 'Obsidian', obsidian_uri])
+        if _PLATFORM == 'Darwin':  # macOS
+            _spawn_detached(['open', '-a', 'Obsidian', obsidian_uri])
             _bring_obsidian_to_front()
-        elif platform.system() == 'Windows':
+        elif _PLATFORM == 'Windows':
             os.startfile(obsidian_uri)
             _bring_obsidian_to_front()
         else:
@@ -4146,10 +5281,17 @@ async def open_in_obsidian(request: OpenRequest):
         raise HTTPException(status_code=500, detail=f"Obsidianの起動に失敗しました: {str(e)}")
 
 
+# テキストかどうかを先に判定するために読む先頭のバイト数（バイナリなら残りを読まずに 400 を返す）
+FILE_CONTENT_PROBE_BYTES = 8192
+
+
 @router.get("/file-content")
-async def get_file_content(path: str = Query(..., description="ファイルのパス")):
+async def get_file_content(path: str = Query(..., description="ファイルのパス")) -> dict:
     """
     ファイルの内容を取得（テキストファイル用）
+
+    上限（環境変数 FILE_MANAGER_FILE_CONTENT_MAX_BYTES、0 で無制限）を設定した場合、
+    それを超えるファイルは読み込まずに 413 を返す
     """
     target_path = normalize_path(path)
 
@@ -4161,9 +5303,24 @@ async def get_file_content(path: str = Query(..., description="ファイルの
             raise HTTPException(status_code=400, detail="ディレクトリは読み込めません")
 
         try:
-            with open(t_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(t_path, 'rb') as f:
+                # 上限がある場合は読み込む前にサイズを確認する（開いたFDで stat し、パスを再解決しない）
+                max_bytes = settings.file_content_max_bytes
+                if max_bytes > 0 and os.fstat(f.fileno()).st_size > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"ファイルが大きすぎます（上限 {max_bytes} バイト）",
+                    )
+                # 先頭だけ先にデコードしてバイナリを早期に弾く
+                # （インクリメンタルデコーダなので、末尾で分断されたマルチバイト文字は続きと合わせて扱われる）
+                # テキストモードの open と同じく改行（\r\n / \r）を \n に揃える
+                # （テキストモードで書き戻す保存処理と組み合わせても CRLF が \r\r\n にならないように）
+                decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder('utf-8')(), translate=True)
+                head = decoder.decode(f.read(FILE_CONTENT_PROBE_BYTES))
+                content = head + decoder.decode(f.read(), final=True)
             return {"path": str(t_path), "content": content}
+        except HTTPException:
+            raise
         except UnicodeDecodeError:
             raise HTTPException(status_code=400, detail="テキストファイルではありません")
         except Exception as e:
@@ -4189,19 +5346,21 @@ async def fullpath(
     if not path:
         raise HTTPException(status_code=400, detail="パスが指定されていません")
     
-    # URLデコード
+    # URLデコード（% を含まない場合、unquote は文字列をそのまま返す）
     decoded_path = urllib.parse.unquote(path)
     
-    # ネットワークパス（UNC）の処理
+    # ネットワークパス（UNC）の処理。それ以外のパスは書き換えない
     if decoded_path.startswith('//'):
         decoded_path = decoded_path.replace('/', '\\')  # //server/share → \\server\share
 
     normalized_path = normalize_path(decoded_path)
 
-    if normalized_path.exists() and normalized_path.is_dir():
+    # is_dir() は存在しないパスでも False を返すため、exists() の stat は不要
+    if normalized_path.is_dir():
         return RedirectResponse(_build_frontend_directory_redirect_url(normalized_path))
 
-    if _prefers_html_response(request):
+    prefers_html = _prefers_html_response(request)
+    if prefers_html:
         preferred_response = await _handle_fullpath_html_preferences(request, normalized_path)
         if preferred_response is not None:
             return preferred_response
@@ -4210,7 +5369,7 @@ async def fullpath(
     open_request = OpenRequest(path=decoded_path)
     result = await open_smart(open_request)
 
-    if not _prefers_html_response(request):
+    if not prefers_html:
         return result
 
     if result.action == "open_url":
@@ -4242,15 +5401,10 @@ async def open_path(request: OpenRequest):
             return {"success": False, "error": f"パスが見つかりません: {request.path}"}
 
         try:
-            if platform.system() == "Windows":
-                if t_path.is_dir():
-                    subprocess.Popen(['explorer', str(t_path).replace('/', '\\')])
-                else:
-                    os.startfile(str(t_path))
-            elif platform.system() == "Darwin":
-                subprocess.Popen(["open", str(t_path)])
+            if _PLATFORM == "Windows" and t_path.is_dir():
+                subprocess.Popen(['explorer', str(t_path).replace('/', '\\')])
             else:
-                subprocess.Popen(["xdg-open", str(t_path)])
+                _open_with_os(str(t_path))
             return {"success": True, "message": f"開きました: {t_path}"}
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -4271,7 +5425,7 @@ async def open_path_get(path: str = Query(..., description="開くファイル
     if path_obj.is_dir():
         # フォルダの場合はフロントエンドを開く
         # ポート番号（5173）を固定せず、相対パスでリダイレクトすることで現在のホスト・ポートを維持する
-        encoded_path = urllib.parse.quote(str(path_obj))
+        encoded_path = _fast_quote(str(path_obj))
         return RedirectResponse(f"/?path={encoded_path}")
 
     
@@ -4304,13 +5458,7 @@ async def open_folder(request: OpenRequest):
         return {"success": False, "error": f"フォルダが見つかりません: {request.path}"}
     
     try:
-        if platform.system() == "Windows":
-            process = subprocess.Popen(['explorer', str(path).replace('/', '\\')])
-            _bring_explorer_to_front(process.pid, path)
-        elif platform.system() == "Darwin":
-            subprocess.Popen(["open", str(path)])
-        else:
-            subprocess.Popen(["xdg-open", str(path)])
+        _open_folder_with_os(path)
         return {"success": True, "message": f"フォルダを開きました: {path}"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -4322,16 +5470,16 @@ async def open_trash():
     ゴミ箱を開く
     """
     try:
-        if platform.system() == "Windows":
+        if _PLATFORM == "Windows":
             # Windows: shell:RecycleBinFolder
             subprocess.Popen(['explorer', 'shell:RecycleBinFolder'])
-        elif platform.system() == "Darwin":
+        elif _PLATFORM == "Darwin":
             # macOS: ~/.Trash
             trash_path = os.path.expanduser("~/.Trash")
-            subprocess.Popen(["open", trash_path])
+            _spawn_detached(["open", trash_path])
         else:
             # Linux: xdg-open trash:///
-            subprocess.Popen(["xdg-open", "trash:///"])
+            _spawn_detached(["xdg-open", "trash:///"])
         return {"success": True, "message": "ゴミ箱を開きました"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -4346,7 +5494,7 @@ async def get_test_folder_path():
     """
     try:
         path_str = ""
-        if platform.system() == "Windows":
+        if _PLATFORM == "Windows":
             path_str = os.path.expandvars(r"%userprofile%\000_work\test")
         else:
             # Mac / Linux
@@ -4362,11 +5510,27 @@ async def get_test_folder_path():
 # タスク管理API
 # ========================================
 
+# ロングポーリングで実際に待機する最大秒数
+# 待機は進捗率・状態の変化でしか起きないため、処理中のファイル名の更新がこれ以上遅れないよう短く抑える
+TASK_PROGRESS_MAX_WAIT_SECONDS = 1.0
+
+
+# 完了したバッチ処理の結果（パスごとの結果リスト）を含むため、戻り値注釈で pydantic-core に直接JSON化させる
 @router.get("/tasks/{task_id}/progress")
-async def get_task_progress(task_id: str):
+async def get_task_progress(
+    task_id: str,
+    wait_seconds: float = Query(
+        0, ge=0, le=30, alias="wait",
+        description="進捗が変化するまで待機する最大秒数（ロングポーリング。TASK_PROGRESS_MAX_WAIT_SECONDS で頭打ち）",
+    ),
+    since_progress: Optional[int] = Query(None, description="クライアントが最後に受け取った進捗値"),
+) -> dict:
     """
     タスクの進捗を取得する
     
+    wait と since_progress を指定すると、進捗が since_progress から変化するか
+    タスクが終了するまで最大 wait 秒（TASK_PROGRESS_MAX_WAIT_SECONDS まで）待ってから応答する。
+    
     Returns:
         {
             id: タスクID
@@ -4379,7 +5543,12 @@ async def get_task_progress(task_id: str):
             result: 完了時の結果
         }
     """
-    task = task_manager.get_task(task_id)
+    if wait_seconds > 0 and since_progress is not None:
+        task = await task_manager.wait_for_progress(
+            task_id, since_progress, min(wait_seconds, TASK_PROGRESS_MAX_WAIT_SECONDS)
+        )
+    else:
+        task = task_manager.get_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail="タスクが見つかりません")
     
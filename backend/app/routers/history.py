@@ -1,15 +1,15 @@
 """
 フォルダ履歴管理ルーター
 """
-import json
 import os
+import time
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from app.config import settings
+from app.json_utils import dumps_pretty, loads
 
 router = APIRouter()
 
@@ -17,46 +17,79 @@ router = APIRouter()
 HISTORY_FILE = Path("folder_history.json")
 
 
-import time
-
 class HistoryItem(BaseModel):
     path: str
     count: int = 1
     timestamp: float = 0
 
+
 class HistoryPayload(BaseModel):
     history: List[HistoryItem]
 
 
+# 履歴リストをまとめて検証・dict のリストへ変換するアダプタ（pydantic-core が1回の呼び出しで処理する）
+_HISTORY_LIST_ADAPTER = TypeAdapter(List[HistoryItem])
+
+
+# 履歴ファイルの解析・検証結果: ((st_mtime_ns, st_size), 履歴リスト)
+# ファイルが変わっていなければ stat() 1回だけで返し、JSONの読み直しも検証もしない
+_history_cache: Optional[Tuple[Tuple[int, int], List[HistoryItem]]] = None
+
+
 @router.get("/history", response_model=List[HistoryItem])
-async def get_history():
+async def get_history() -> List[HistoryItem]:
     """
     フォルダ履歴を取得する
+
+    更新日時（ns）とサイズが前回と同じなら、前回の解析結果をそのまま返す
+    不正な項目を含む履歴ファイルは（従来通り）空の履歴として扱う
     """
-    if not HISTORY_FILE.exists():
+    global _history_cache
+
+    try:
+        st = HISTORY_FILE.stat()
+    except FileNotFoundError:
         return []
 
+    cache_key = (st.st_mtime_ns, st.st_size)
+    cached = _history_cache
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
     try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            
-            # リスト形式であるか確認
-            if not isinstance(data, list):
-                return []
-                
-            # 文字列のリスト（旧形式）の場合
-            if data and isinstance(data[0], str):
-                current_time = time.time()
-                # 旧形式を新形式に変換して返す (count=1)
-                # 順序は維持されるので、タイムスタンプを少しずつずらすか、同じにするか
-                return [
-                    HistoryItem(path=path, count=1, timestamp=current_time)
-                    for path in data
-                ]
-            
+        # バイト列のまま1回で読み、デコードせずにパースする
+        # キャッシュキーは開いたファイルから取り直し、stat と読み込みの間に置き換えられても読んだ内容と一致させる
+        with open(HISTORY_FILE, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = loads(f.read())
+        cache_key = (st.st_mtime_ns, st.st_size)
+
+        # リスト形式であるか確認
+        if not isinstance(data, list):
+            return []
+
+        # 文字列のリスト（旧形式）の場合
+        if data and isinstance(data[0], str):
+            current_time = time.time()
+            # 旧形式を新形式に変換して返す (count=1)
+            # 順序は維持されるので、タイムスタンプを少しずつずらすか、同じにするか
+            history = [
+                {"path": path, "count": 1, "timestamp": current_time}
+                for path in data
+            ]
+        else:
             # 新形式（オブジェクトのリスト）の場合
-            return [HistoryItem(**item) for item in data]
+            history = data
+
+        # 欠けた項目は既定値で補い、不正な項目は ValidationError として下で空の履歴にする
+        # （検証は履歴ファイルが変わった時だけ。結果をキャッシュして次回以降は使い回す）
+        items = _HISTORY_LIST_ADAPTER.validate_python(history)
+        _history_cache = (cache_key, items)
+        return items
             
+    except FileNotFoundError:
+        # stat の後に削除された
+        return []
     except Exception as e:
         print(f"Error reading history file: {e}")
         return []
@@ -67,11 +100,17 @@ async def save_history(payload: HistoryPayload):
     """
     フォルダ履歴を保存する
     """
+    global _history_cache
+
     try:
-        # dict形式に変換して保存
-        save_data = [item.dict() for item in payload.history]
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        # dict形式に変換して保存（リスト全体を1回でダンプする）
+        save_data = _HISTORY_LIST_ADAPTER.dump_python(payload.history)
+        # 一時ファイルに書いてから置き換える（書き込み途中で終了しても履歴ファイルが壊れない）
+        tmp_file = HISTORY_FILE.with_name(HISTORY_FILE.name + ".tmp")
+        tmp_file.write_bytes(dumps_pretty(save_data))
+        os.replace(tmp_file, HISTORY_FILE)
+        # 次回の取得では書き込んだファイルを読み直す
+        _history_cache = None
         return {"status": "success"}
     except Exception as e:
         print(f"Error saving history file: {e}")
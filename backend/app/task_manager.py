@@ -4,17 +4,25 @@
 非同期で実行されるファイル操作タスクの状態を管理する。
 進捗追跡、キャンセル機能を提供する。
 """
+import asyncio
 import uuid
 import threading
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, List, Optional, Literal, Tuple
 from datetime import datetime
 
 TaskStatus = Literal["pending", "running", "completed", "cancelled", "error"]
 
-@dataclass
+# 進捗の更新を待たずに即座に応答するステータス
+ACTIVE_STATUSES = ("pending", "running")
+
+@dataclass(slots=True)
 class TaskInfo:
-    """タスク情報を保持するデータクラス"""
+    """
+    タスク情報を保持するデータクラス
+
+    進捗更新のたびに属性を書き換えるため、__slots__ で属性辞書を持たせない
+    """
     id: str
     status: TaskStatus = "pending"
     progress: int = 0  # 0-100
@@ -26,9 +34,23 @@ class TaskInfo:
     result: Optional[Any] = None
     created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
+    # 進捗の変化を待っているロングポーリング要求（イベントループとイベントの組）
+    waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+
+    def notify(self) -> None:
+        """待機中のロングポーリング要求を起こす（ワーカースレッドから呼び出し可能）"""
+        for loop, event in tuple(self.waiters):
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # イベントループが既に閉じている
 
     def to_dict(self) -> Dict[str, Any]:
         """辞書形式に変換"""
+        created_at = self.created_at
+        completed_at = self.completed_at
         return {
             "id": self.id,
             "status": self.status,
@@ -38,35 +60,24 @@ class TaskInfo:
             "processed_files": self.processed_files,
             "cancelled": self.cancelled,
             "error_message": self.error_message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": created_at.isoformat() if created_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
         }
 
 
 class TaskManager:
     """
-    タスク管理シングルトンクラス
+    タスク管理クラス（アプリ全体ではモジュール末尾の task_manager を共有する）
     
     タスクの作成、状態更新、キャンセルを管理する。
     スレッドセーフな実装。
-    """
-    _instance: Optional['TaskManager'] = None
-    _lock = threading.Lock()
-
-    def __new__(cls) -> 'TaskManager':
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-        return cls._instance
 
+    _tasks は作成・削除時に丸ごと差し替える（コピーオンライト）ため、参照側はロック不要。
+    各タスクのフィールド更新は単純な属性代入（GILで原子的）なのでロックを取らない。
+    """
     def __init__(self):
-        if self._initialized:
-            return
         self._tasks: Dict[str, TaskInfo] = {}
         self._tasks_lock = threading.Lock()
-        self._initialized = True
 
     def create_task(self, total_files: int = 0) -> TaskInfo:
         """
@@ -82,21 +93,21 @@ class TaskManager:
         task = TaskInfo(id=task_id, total_files=total_files)
         
         with self._tasks_lock:
-            self._tasks[task_id] = task
+            self._tasks = {**self._tasks, task_id: task}
         
         return task
 
     def get_task(self, task_id: str) -> Optional[TaskInfo]:
-        """タスク情報を取得"""
-        with self._tasks_lock:
-            return self._tasks.get(task_id)
+        """タスク情報を取得（ロック不要）"""
+        return self._tasks.get(task_id)
 
     def update_progress(
         self,
         task_id: str,
         processed_files: int,
         current_file: str = "",
-        status: Optional[TaskStatus] = None
+        status: Optional[TaskStatus] = None,
+        progress: Optional[int] = None
     ) -> bool:
         """
         タスクの進捗を更新する
@@ -106,57 +117,105 @@ class TaskManager:
             processed_files: 処理済みファイル数
             current_file: 現在処理中のファイル名
             status: ステータス（省略時は変更なし）
+            progress: 進捗率 0-100（呼び出し側で算出済みの場合に指定。省略時は件数から算出）
             
         Returns:
             更新成功時True、タスクが存在しない場合False
         """
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            
-            task.processed_files = processed_files
-            task.current_file = current_file
-            
-            if task.total_files > 0:
-                task.progress = int((processed_files / task.total_files) * 100)
-            
-            if status:
-                task.status = status
-            
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        
+        previous = (task.progress, task.status)
+        task.processed_files = processed_files
+        task.current_file = current_file
+        
+        if progress is not None:
+            task.progress = progress
+        elif task.total_files > 0:
+            task.progress = processed_files * 100 // task.total_files
+        
+        if status:
+            task.status = status
+        
+        if task.waiters and (task.progress, task.status) != previous:
+            task.notify()
+        
+        return True
 
     def set_running(self, task_id: str) -> bool:
         """タスクを実行中に設定"""
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            task.status = "running"
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        task.status = "running"
+        task.notify()
+        return True
 
     def complete_task(self, task_id: str, result: Any = None) -> bool:
         """タスクを完了に設定"""
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            task.status = "completed"
-            task.progress = 100
-            task.result = result
-            task.completed_at = datetime.now()
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        # ロックなしで参照されるため、status は結果を設定し終えてから最後に更新する
+        task.progress = 100
+        task.result = result
+        task.completed_at = datetime.now()
+        task.status = "completed"
+        task.notify()
+        return True
 
     def fail_task(self, task_id: str, error_message: str) -> bool:
         """タスクをエラーに設定"""
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            task.status = "error"
-            task.error_message = error_message
-            task.completed_at = datetime.now()
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        task.error_message = error_message
+        task.completed_at = datetime.now()
+        task.status = "error"
+        task.notify()
+        return True
+
+    async def wait_for_progress(
+        self,
+        task_id: str,
+        since_progress: int,
+        timeout: float
+    ) -> Optional[TaskInfo]:
+        """
+        進捗が since_progress から変化するか、タスクが終了するまで待機する（ロングポーリング用）
+        
+        Args:
+            task_id: タスクID
+            since_progress: クライアントが最後に受け取った進捗値
+            timeout: 最大待機秒数
+            
+        Returns:
+            TaskInfo（タスクが存在しない場合None）
+        """
+        task = self._tasks.get(task_id)
+        if not task:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return task
+            event = asyncio.Event()
+            waiter = (loop, event)
+            task.waiters.append(waiter)
+            try:
+                # 登録前に行われた更新を取りこぼさないよう、登録後に状態を確認する
+                if task.progress != since_progress or task.status not in ACTIVE_STATUSES:
+                    return task
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    return task
+            finally:
+                task.waiters.remove(waiter)
 
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -164,32 +223,30 @@ class TaskManager:
         
         実際のキャンセル処理はワーカースレッドがフラグを検知して行う
         """
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            if task.status in ("completed", "cancelled", "error"):
-                return False  # 既に終了済み
-            task.cancelled = True
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        if task.status in ("completed", "cancelled", "error"):
+            return False  # 既に終了済み
+        task.cancelled = True
+        return True
 
     def is_cancelled(self, task_id: str) -> bool:
         """タスクがキャンセルされたかどうか"""
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            return task.cancelled
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        return task.cancelled
 
     def set_cancelled(self, task_id: str) -> bool:
         """タスクをキャンセル済みに設定"""
-        with self._tasks_lock:
-            task = self._tasks.get(task_id)
-            if not task:
-                return False
-            task.status = "cancelled"
-            task.completed_at = datetime.now()
-            return True
+        task = self._tasks.get(task_id)
+        if not task:
+            return False
+        task.completed_at = datetime.now()
+        task.status = "cancelled"
+        task.notify()
+        return True
 
     def cleanup_old_tasks(self, max_age_seconds: int = 3600) -> int:
         """
@@ -202,17 +259,20 @@ class TaskManager:
             削除したタスク数
         """
         now = datetime.now()
-        to_delete = []
+        to_delete = set()
         
         with self._tasks_lock:
             for task_id, task in self._tasks.items():
                 if task.completed_at:
                     age = (now - task.completed_at).total_seconds()
                     if age > max_age_seconds:
-                        to_delete.append(task_id)
+                        to_delete.add(task_id)
             
-            for task_id in to_delete:
-                del self._tasks[task_id]
+            if to_delete:
+                self._tasks = {
+                    task_id: task for task_id, task in self._tasks.items()
+                    if task_id not in to_delete
+                }
         
         return len(to_delete)
 
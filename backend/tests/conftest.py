@@ -16,6 +16,16 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def batch_task(tmp_path, monkeypatch):
+    """tmp_path をベースディレクトリにして、バッチ処理用のタスクを作成する"""
+    from app import config
+    from app.task_manager import task_manager
+
+    monkeypatch.setattr(config.settings, "_base_dir_override", tmp_path)
+    return task_manager.create_task()
+
+
 @pytest.fixture
 def temp_dir():
     """テスト用の一時ディレクトリを作成"""
@@ -119,3 +119,48 @@ class TestConfigApi:
         assert response.status_code == 200
         assert response.json()["defaultTextFileExtension"] == "md"
         assert '"defaultTextFileExtension": "md"' in preferences_path.read_text(encoding="utf-8")
+
+    def test_get_config_reflects_saved_preferences_after_cache(self, client, temp_dir, monkeypatch):
+        """設定取得はキャッシュされるが、保存後は新しい設定が返る"""
+        from app import config
+
+        preferences_path = temp_dir / "settings.json"
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        monkeypatch.setattr(config.settings, "_preferences_file_override", preferences_path)
+
+        assert client.get("/api/config").json()["apiTimeout"] == 10
+
+        response = client.post(
+            "/api/config/preferences",
+            json={"textFileOpenMode": "web", "markdownOpenMode": "web", "apiTimeout": 30},
+        )
+        assert response.status_code == 200
+
+        assert client.get("/api/config").json()["apiTimeout"] == 30
+
+    def test_get_config_reflects_external_edit_of_preferences_file(self, client, temp_dir, monkeypatch):
+        """設定ファイルがAPI以外で直接編集された場合も、キャッシュを破棄せず新しい設定が返る"""
+        import json
+        import os
+
+        from app import config
+
+        preferences_path = temp_dir / "settings.json"
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        monkeypatch.setattr(config.settings, "_preferences_file_override", preferences_path)
+
+        assert client.get("/api/config").json()["apiTimeout"] == 10
+
+        preferences_path.write_text(json.dumps({"apiTimeout": 45}), encoding="utf-8")
+        # 更新時刻の粒度が粗いファイルシステムでも変更を検出できるよう、mtimeを明示的に進める
+        stat = preferences_path.stat()
+        os.utime(preferences_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert client.get("/api/config").json()["apiTimeout"] == 45
+
+    def test_cors_headers_are_added_to_api_responses(self, client):
+        """APIレスポンスには他オリジンからのアクセス用のCORSヘッダーが付与される"""
+        response = client.get("/api/config", headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "http://example.com"
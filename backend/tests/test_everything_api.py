@@ -2,6 +2,7 @@
 インデックス検索プロキシのOS別接続先を検証する。
 macOSではLocal-fulltext-searchへ統合し、WindowsのEverything接続は維持する。
 """
+import json
 
 
 class _MockResponse:
@@ -13,6 +14,10 @@ class _MockResponse:
     def json(self):
         return self._payload
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode("utf-8")
+
     def raise_for_status(self) -> None:
         return None
 
@@ -41,7 +46,7 @@ def test_mac_index_search_proxies_to_local_fulltext_search(client, monkeypatch):
     from app.routers import everything
 
     calls = []
-    monkeypatch.setattr(everything.platform, "system", lambda: "Darwin")
+    monkeypatch.setattr(everything, "IS_WINDOWS", False)
     monkeypatch.setattr(
         everything.httpx,
         "AsyncClient",
@@ -63,7 +68,7 @@ def test_windows_index_search_keeps_everything_port(client, monkeypatch):
     from app.routers import everything
 
     calls = []
-    monkeypatch.setattr(everything.platform, "system", lambda: "Windows")
+    monkeypatch.setattr(everything, "IS_WINDOWS", True)
     monkeypatch.setattr(
         everything.httpx,
         "AsyncClient",
@@ -75,3 +80,215 @@ def test_windows_index_search_keeps_everything_port(client, monkeypatch):
     assert response.status_code == 200
     assert calls[0][0] == "http://localhost:8080/"
     assert calls[0][1]["json"] == 1
+
+
+def test_index_search_reuses_lifespan_client(monkeypatch):
+    """
+    lifespan起動中は app.state の共有クライアントを使い回し、リクエスト毎に生成しない。
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.routers import everything
+
+    calls = []
+    created = []
+
+    def fake_create_index_client():
+        client = _MockAsyncClient(calls=calls)
+        client.aclose = _noop_aclose
+        created.append(client)
+        return client
+
+    def fail_async_client(**_kwargs):
+        raise AssertionError("共有クライアントがあるのに新規生成された")
+
+    monkeypatch.setattr(everything, "IS_WINDOWS", True)
+    monkeypatch.setattr(everything, "create_index_client", fake_create_index_client)
+    monkeypatch.setattr(everything.httpx, "AsyncClient", fail_async_client)
+
+    with TestClient(app) as lifespan_client:
+        for _ in range(3):
+            response = lifespan_client.get("/api/index", params={"search": "alpha"})
+            assert response.status_code == 200
+
+    assert len(created) == 1
+    assert len(calls) == 3
+
+
+async def _noop_aclose():
+    return None
+
+
+def test_convert_everything_results_builds_full_paths():
+    """
+    Everythingの結果変換で、親パス末尾の区切り文字有無に関わらず正しいフルパスになる。
+    """
+    from app.routers import everything
+
+    results = everything.convert_everything_results([
+        {"name": "a.txt", "path": "C:\\work", "type": "file", "size": "12", "date_modified": "116444736000000000"},
+        {"name": "docs", "path": "C:\\", "type": "folder"},
+        {"name": "orphan"},
+    ])
+
+    assert results[0] == {"name": "a.txt", "type": "file", "path": "C:\\work\\a.txt", "size": 12, "date_modified": 0.0}
+    assert results[1]["path"] == "C:\\docs"
+    assert results[1]["type"] == "directory"
+    assert results[2]["path"] == "orphan"
+    assert results[2]["size"] is None
+
+
+def test_convert_everything_results_skips_malformed_rows():
+    """
+    サイズが数値でない行やnameがnullの行が混じっていても、その行だけを読み飛ばして残りを返す。
+    """
+    from app.routers import everything
+
+    results = everything.convert_everything_results([
+        {"name": "ok.txt", "path": "C:\\work", "type": "file", "size": "5"},
+        {"name": "bad-size.txt", "path": "C:\\work", "type": "file", "size": "12abc"},
+        {"name": None, "path": "C:\\work", "type": "file"},
+        None,
+        {"name": "ok2.txt", "path": "C:\\work", "type": "file"},
+    ])
+
+    assert [r["path"] for r in results] == ["C:\\work\\ok.txt", "C:\\work\\ok2.txt"]
+    assert results[0]["size"] == 5
+
+
+def test_mac_index_search_streams_upstream_body(monkeypatch):
+    """
+    macOSでlifespanの共有クライアントがある場合、上流のJSONをそのままストリーミング転送する。
+    """
+    import httpx
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.routers import everything
+
+    payload = b'{"totalResults": 2, "results": [{"name": "a"}, {"name": "b"}]}'
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url)
+        return httpx.Response(200, content=payload, headers={"content-type": "application/json"})
+
+    monkeypatch.setattr(everything, "IS_WINDOWS", False)
+    monkeypatch.setattr(
+        everything,
+        "create_index_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with TestClient(app) as lifespan_client:
+        response = lifespan_client.get("/api/index", params={"search": "alpha"})
+
+    assert response.status_code == 200
+    assert response.content == payload
+    assert requested[0].path == "/api/index"
+    assert requested[0].params["search"] == "alpha"
+
+
+def test_mac_index_search_stream_reports_upstream_error(monkeypatch):
+    """
+    上流がエラーを返した場合は 503 を返す。
+    """
+    import httpx
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.routers import everything
+
+    monkeypatch.setattr(everything, "IS_WINDOWS", False)
+    monkeypatch.setattr(
+        everything,
+        "create_index_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(500))),
+    )
+
+    with TestClient(app) as lifespan_client:
+        response = lifespan_client.get("/api/index", params={"search": "alpha"})
+
+    assert response.status_code == 503
+
+
+def test_index_models_are_built_at_import():
+    """
+    検索系のpydanticモデルはimport時点でスキーマ構築済みで、初回リクエストで遅延構築されない。
+    """
+    from app.config import Settings
+    from app.routers import everything, everything_curl
+
+    models = (
+        everything.EverythingItem,
+        everything.EverythingResponse,
+        everything.FileItem,
+        everything.SearchResponse,
+        everything.StatusResponse,
+        everything_curl.FileItem,
+        everything_curl.SearchResponse,
+        everything_curl.StatusResponse,
+        Settings,
+    )
+    assert all(model.__pydantic_complete__ for model in models)
+
+
+def test_windows_index_search_handles_null_results(client, monkeypatch):
+    """
+    Everythingが results: null を返しても空配列として扱う。
+    """
+    from app.routers import everything
+
+    class _NullResultsClient(_MockAsyncClient):
+        async def get(self, url, *, params=None, timeout=None):
+            self._calls.append((url, params, timeout))
+            return _MockResponse({"totalResults": 0, "results": None})
+
+    calls = []
+    monkeypatch.setattr(everything, "IS_WINDOWS", True)
+    monkeypatch.setattr(
+        everything.httpx,
+        "AsyncClient",
+        lambda **kwargs: _NullResultsClient(calls=calls, **kwargs),
+    )
+
+    response = client.get("/api/index", params={"search": "zzz"})
+
+    assert response.status_code == 200
+    assert response.json() == {"totalResults": 0, "results": []}
+
+
+def test_index_status_does_not_cache_failed_probe(client, monkeypatch):
+    """
+    接続失敗のステータスはキャッシュせず、サービス起動後の次の問い合わせで準備完了を返す。
+    """
+    from app.routers import everything
+
+    class _FailingClient(_MockAsyncClient):
+        async def get(self, url, *, params=None, timeout=None):
+            self._calls.append((url, params, timeout))
+            raise everything.httpx.ConnectError("connection refused")
+
+    calls = []
+    monkeypatch.setattr(everything, "IS_WINDOWS", True)
+    everything.get_status.cache_clear()
+    try:
+        monkeypatch.setattr(
+            everything.httpx,
+            "AsyncClient",
+            lambda **kwargs: _FailingClient(calls=calls, **kwargs),
+        )
+        assert client.get("/api/index/status").json() == {"ready": False, "total_indexed": 0}
+
+        monkeypatch.setattr(
+            everything.httpx,
+            "AsyncClient",
+            lambda **kwargs: _MockAsyncClient(calls=calls, **kwargs),
+        )
+        assert client.get("/api/index/status").json() == {"ready": True, "total_indexed": 1}
+        # 成功応答はキャッシュされ、再問い合わせしない
+        assert client.get("/api/index/status").json() == {"ready": True, "total_indexed": 1}
+        assert len(calls) == 2
+    finally:
+        everything.get_status.cache_clear()
@@ -10,6 +10,7 @@ import pytest
 import tempfile
 import os
 import hashlib
+import time
 from pathlib import Path
 from app.routers.files import fast_copy_file
 
@@ -145,3 +146,807 @@ class TestFastCopyFile:
         # Assert
         assert result is True
         assert dest.read_text(encoding="utf-8") == "テスト内容"
+
+
+class TestCalculateFileChecksum:
+    """calculate_file_checksum関数のテストクラス"""
+
+    def test_same_content_same_checksum(self, tmp_path):
+        """内容が同じなら一致し、1バイトでも違えば不一致になる"""
+        from app.routers.files import calculate_file_checksum
+
+        data = os.urandom(256 * 1024)
+        (tmp_path / "a.bin").write_bytes(data)
+        (tmp_path / "b.bin").write_bytes(data)
+        (tmp_path / "c.bin").write_bytes(data[:-1] + bytes([data[-1] ^ 1]))
+
+        assert calculate_file_checksum(tmp_path / "a.bin") == calculate_file_checksum(tmp_path / "b.bin")
+        assert calculate_file_checksum(tmp_path / "a.bin") != calculate_file_checksum(tmp_path / "c.bin")
+
+    def test_falls_back_to_sha256_without_blake3(self, tmp_path, monkeypatch):
+        """blake3 が無い環境では SHA256 を返す"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "blake3", None)
+        target = tmp_path / "a.bin"
+        target.write_bytes(b"checksum")
+
+        assert files.calculate_file_checksum(target) == calculate_checksum(target)
+
+    def test_reuses_checksum_computed_during_copy(self, tmp_path, monkeypatch):
+        """コピー時に計算したコピー元のチェックサムは再計算せずに返し、内容が変われば計算し直す"""
+        from app.routers import files
+
+        src = tmp_path / "source.bin"
+        src.write_bytes(b"original")
+        checksum = files.copy_file_with_checksum(src, tmp_path / "dest.bin")
+
+        def fail_hasher():
+            raise AssertionError("再計算されないはず")
+
+        monkeypatch.setattr(files, "_new_checksum_hasher", fail_hasher)
+        assert files.calculate_file_checksum(src, use_cache=True) == checksum
+
+        monkeypatch.undo()
+        src.write_bytes(b"changed content")
+        assert files.calculate_file_checksum(src, use_cache=True) != checksum
+
+    def test_destination_is_always_hashed_from_disk(self, tmp_path):
+        """コピー先は mtime・サイズが同じでもメモを使わず、内容の破損を検出する"""
+        from app.routers import files
+
+        src = tmp_path / "source.bin"
+        src.write_bytes(b"original")
+        dest = tmp_path / "dest.bin"
+        files.copy_file_with_checksum(src, dest)
+        assert files.verify_copy(src, dest, use_checksum=True)[0]
+
+        # 同じサイズで内容だけ壊し、mtime を元に戻す（copystat 済みのコピー先と同じ状況）
+        st = dest.stat()
+        dest.write_bytes(b"corrupt!")
+        os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert files.verify_copy(src, dest, use_checksum=True) == (False, "チェックサムが一致しません")
+
+
+class TestCopyFileWithChecksum:
+    """copy_file_with_checksum関数のテストクラス"""
+
+    def test_copies_content_and_returns_source_checksum(self, tmp_path):
+        """1回の読み込みでコピーし、コピー元のチェックサムを返す"""
+        from app.routers.files import calculate_file_checksum, copy_file_with_checksum
+
+        src = tmp_path / "source.bin"
+        dest = tmp_path / "dest.bin"
+        src.write_bytes(os.urandom(3 * 1024 * 1024 + 7))
+        os.utime(src, (1_700_000_000, 1_700_000_000))
+
+        checksum = copy_file_with_checksum(src, dest, chunk_size=1024 * 1024)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert checksum == calculate_file_checksum(src) == calculate_file_checksum(dest)
+        assert int(dest.stat().st_mtime) == 1_700_000_000
+
+
+@pytest.mark.skipif(not hasattr(os, "sendfile"), reason="sendfile が使えない環境")
+class TestFastCopyLinuxFallback:
+    """_fast_copy_linux の copy_file_range → sendfile フォールバックのテスト"""
+
+    def test_sendfile_resumes_after_partial_copy_file_range(self, tmp_path, monkeypatch):
+        """copy_file_range が途中で失敗しても、残りを sendfile で正しい位置に書き足す"""
+        from app.routers import files
+
+        src = tmp_path / "source.bin"
+        dest = tmp_path / "dest.bin"
+        data = os.urandom(1024 * 1024)
+        src.write_bytes(data)
+
+        calls = {"count": 0}
+
+        def partial_copy_file_range(src_fd, dest_fd, count, offset_src, offset_dst):
+            calls["count"] += 1
+            if calls["count"] > 1:
+                raise OSError(18, "Invalid cross-device link")
+            chunk = os.pread(src_fd, 4096, offset_src)
+            return os.pwrite(dest_fd, chunk, offset_dst)
+
+        monkeypatch.setattr(files.os, "copy_file_range", partial_copy_file_range, raising=False)
+
+        assert files._fast_copy_linux(src, dest) is True
+        assert dest.read_bytes() == data
+
+
+class TestFastCopyMany:
+    """fast_copy_many のテストクラス"""
+
+    def test_copies_files_across_directories(self, tmp_path):
+        """複数ディレクトリ宛てのファイルをまとめてコピーし、失敗は個別に返す"""
+        from app.routers.files import fast_copy_many
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (tmp_path / "out" / "a").mkdir(parents=True)
+        (tmp_path / "out" / "b").mkdir(parents=True)
+        pairs = []
+        for index, sub in enumerate(["a", "b", "a"]):
+            source = src / f"file{index}.txt"
+            source.write_text(f"content {index}")
+            pairs.append((str(source), str(tmp_path / "out" / sub / source.name)))
+        pairs.append((str(src / "missing.txt"), str(tmp_path / "out" / "a" / "missing.txt")))
+        pairs.append((str(src / "file0.txt"), str(tmp_path / "no-such-dir" / "file0.txt")))
+
+        outcome = fast_copy_many(pairs)
+
+        assert len(outcome) == len(pairs)
+        succeeded = {src_path for src_path, success, _ in outcome if success}
+        failed = [src_path for src_path, success, _ in outcome if not success]
+        assert succeeded == {str(src / f"file{index}.txt") for index in range(3)}
+        assert sorted(failed) == sorted([str(src / "missing.txt"), str(src / "file0.txt")])
+        assert (tmp_path / "out" / "a" / "file2.txt").read_text() == "content 2"
+        assert (tmp_path / "out" / "b" / "file1.txt").read_text() == "content 1"
+
+
+class TestParallelCopyDirectory:
+    """parallel_copy_directory / verify_copy のテストクラス"""
+
+    def test_copies_tree_and_verifies_with_checksum(self, tmp_path):
+        """ネストしたディレクトリを丸ごとコピーし、チェックサム検証まで通る"""
+        from app.routers.files import get_directory_stats, parallel_copy_directory, verify_copy
+
+        src = tmp_path / "src"
+        (src / "a" / "b").mkdir(parents=True)
+        (src / "top.txt").write_text("top")
+        (src / "a" / "mid.txt").write_text("middle")
+        (src / "a" / "b" / "leaf.bin").write_bytes(os.urandom(4096))
+        dest = tmp_path / "dest"
+
+        success, _, copied, failed = parallel_copy_directory(src, dest)
+
+        assert success is True
+        assert (copied, failed) == (3, 0)
+        assert (dest / "a" / "b" / "leaf.bin").read_bytes() == (src / "a" / "b" / "leaf.bin").read_bytes()
+        assert get_directory_stats(dest) == get_directory_stats(src) == (3, 3 + 6 + 4096)
+        assert verify_copy(src, dest, use_checksum=True) == (True, "検証成功")
+
+    def test_empty_tree_recreates_subdirectories(self, tmp_path):
+        """ファイルが無いディレクトリは空のサブディレクトリ構造だけを再現する"""
+        from app.routers.files import parallel_copy_directory
+
+        src = tmp_path / "src"
+        (src / "x" / "y").mkdir(parents=True)
+        dest = tmp_path / "dest"
+
+        success, _, copied, _ = parallel_copy_directory(src, dest)
+
+        assert success is True
+        assert copied == 0
+        assert (dest / "x" / "y").is_dir()
+
+    def test_verify_detects_renamed_file_with_same_size(self, tmp_path):
+        """件数・合計サイズが同じでも、コピー先にないファイルがあれば検証失敗になる"""
+        from app.routers.files import verify_copy
+
+        src = tmp_path / "src"
+        dest = tmp_path / "dest"
+        src.mkdir()
+        dest.mkdir()
+        (src / "a.txt").write_text("same")
+        (dest / "b.txt").write_text("same")
+
+        verified, message = verify_copy(src, dest)
+
+        assert verified is False
+        assert "a.txt" in message
+
+    def test_verify_checksum_detects_changed_content(self, tmp_path):
+        """並列のチェックサム検証で、サイズが同じでも内容の違うファイルを検出する"""
+        from app.routers.files import verify_copy
+
+        src = tmp_path / "src"
+        dest = tmp_path / "dest"
+        for root in (src, dest):
+            root.mkdir()
+            for index in range(20):
+                (root / f"file{index}.txt").write_text(f"content {index:02d}")
+        (dest / "file7.txt").write_text("content XX")
+
+        assert verify_copy(src, dest) == (True, "検証成功")
+        assert verify_copy(src, dest, use_checksum=True) == (False, "チェックサムが一致しません: file7.txt")
+
+
+class TestSafeMove:
+    """safe_move関数のテストクラス"""
+
+    def test_same_filesystem_move_uses_rename(self, tmp_path, monkeypatch):
+        """同一ファイルシステム内の移動はコピーせずリネームで完了する"""
+        from app.routers import files
+
+        def fail_copy(src, dest, exclusive=False):
+            raise AssertionError("コピーは行われないはず")
+
+        monkeypatch.setattr(files, "fast_copy_file", fail_copy)
+        monkeypatch.setattr(files, "parallel_copy_directory", fail_copy)
+        src = tmp_path / "src_dir"
+        (src / "sub").mkdir(parents=True)
+        (src / "sub" / "a.txt").write_text("a")
+        dest = tmp_path / "moved_dir"
+
+        assert files.safe_move(src, dest) == (True, "移動完了")
+        assert not src.exists()
+        assert (dest / "sub" / "a.txt").read_text() == "a"
+
+    def test_checksum_move_still_copies_and_verifies(self, tmp_path):
+        """チェックサム検証を指定した場合はコピー → 検証 → 削除の経路を通る"""
+        from app.routers import files
+
+        src = tmp_path / "a.bin"
+        src.write_bytes(os.urandom(1024))
+        data = src.read_bytes()
+        dest = tmp_path / "b.bin"
+
+        assert files.safe_move(src, dest, verify_checksum=True) == (True, "移動完了")
+        assert not src.exists()
+        assert dest.read_bytes() == data
+
+
+class TestExecuteBatchMove:
+    """_execute_batch_move関数のテストクラス"""
+
+    def test_cross_device_directory_move_copies_tree_and_deletes_source(self, tmp_path, monkeypatch, batch_task):
+        """リネームできない場合はツリーをコピーしてから移動元を削除する"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "_try_rename_same_device", lambda src, dest: False)
+        src = tmp_path / "src_dir"
+        (src / "sub" / "deep").mkdir(parents=True)
+        (src / "sub" / "empty").mkdir()
+        (src / "top.txt").write_text("top")
+        (src / "sub" / "deep" / "leaf.txt").write_text("leaf")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        files._execute_batch_move(batch_task.id, [str(src)], dest, False, False, False)
+
+        result = batch_task.result
+        assert result["fail_count"] == 0
+        assert result["success_count"] == 2
+        assert result["results"][0]["status"] == "success"
+        assert not src.exists()
+        assert (dest / "src_dir" / "top.txt").read_text() == "top"
+        assert (dest / "src_dir" / "sub" / "deep" / "leaf.txt").read_text() == "leaf"
+        assert (dest / "src_dir" / "sub" / "empty").is_dir()
+
+    def test_copy_error_is_reported_and_source_is_kept(self, tmp_path, monkeypatch, batch_task):
+        """ワーカーでのコピー失敗は移動元ごとのエラーとして返り、移動元は削除されない"""
+        from app.routers import files
+
+        def fail_copy(src, dest, exclusive=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "_try_rename_same_device", lambda src, dest: False)
+        monkeypatch.setattr(files, "fast_copy_file", fail_copy)
+        src = tmp_path / "src_dir"
+        src.mkdir()
+        (src / "a.txt").write_text("a")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        files._execute_batch_move(batch_task.id, [str(src)], dest, False, False, False)
+
+        result = batch_task.result
+        assert result["fail_count"] == 1
+        assert result["results"][0] == {"path": str(src), "status": "error", "message": "disk full"}
+        assert (src / "a.txt").exists()
+
+    def test_only_moved_files_are_removed_from_source(self, tmp_path, monkeypatch, batch_task):
+        """移動できたファイルだけがコピー元から消え、残ったファイルのディレクトリは残る"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "_try_rename_same_device", lambda src, dest: False)
+        src = tmp_path / "src_dir"
+        (src / "done").mkdir(parents=True)
+        (src / "kept").mkdir()
+        (src / "done" / "a.txt").write_text("a")
+        (src / "kept" / "b.txt").write_text("new")
+        dest = tmp_path / "dest"
+        (dest / "src_dir" / "kept").mkdir(parents=True)
+        (dest / "src_dir" / "kept" / "b.txt").write_text("old")
+
+        files._execute_batch_move(batch_task.id, [str(src)], dest, False, False, False)
+
+        result = batch_task.result
+        assert result["success_count"] == 1
+        assert result["fail_count"] == 1
+        assert result["results"][0]["status"] == "error"
+        assert (dest / "src_dir" / "done" / "a.txt").read_text() == "a"
+        assert (dest / "src_dir" / "kept" / "b.txt").read_text() == "old"
+        assert not (src / "done" / "a.txt").exists()
+        assert (src / "kept" / "b.txt").read_text() == "new"
+
+
+
+class TestExecuteBatchCopyAsync:
+    """_execute_batch_copy_async関数のテストクラス"""
+
+    def test_copies_tree_and_counts_skipped_files_as_failures(self, tmp_path, batch_task):
+        """ツリーをコピーし、上書きしない既存ファイルは失敗数に数える"""
+        from app.routers import files
+
+        src = tmp_path / "src_dir"
+        (src / "sub" / "empty").mkdir(parents=True)
+        (src / "top.txt").write_text("top")
+        (src / "sub" / "leaf.txt").write_text("leaf")
+        dest = tmp_path / "dest"
+        (dest / "src_dir").mkdir(parents=True)
+        (dest / "src_dir" / "top.txt").write_text("old")
+
+        files._execute_batch_copy_async(batch_task.id, [str(src)], dest, False, True, False)
+
+        result = batch_task.result
+        assert result["success_count"] == 1
+        assert result["fail_count"] == 1
+        assert (dest / "src_dir" / "top.txt").read_text() == "old"
+        assert (dest / "src_dir" / "sub" / "leaf.txt").read_text() == "leaf"
+        assert (dest / "src_dir" / "sub" / "empty").is_dir()
+        assert (src / "top.txt").exists()
+
+    def test_copy_error_is_reported_per_source(self, tmp_path, monkeypatch, batch_task):
+        """ワーカーでのコピー失敗はコピー元ごとのエラーとして返る"""
+        from app.routers import files
+
+        def fail_copy(src, dest, exclusive=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "fast_copy_file", fail_copy)
+        src = tmp_path / "a.txt"
+        src.write_text("a")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        files._execute_batch_copy_async(batch_task.id, [str(src)], dest, True, False, False)
+
+        result = batch_task.result
+        assert result["fail_count"] == 1
+        assert result["results"][0] == {"path": str(src), "status": "error", "message": "disk full"}
+
+    def test_single_file_is_copied_without_work_queue(self, tmp_path, monkeypatch, batch_task):
+        """1ファイルだけのバッチはキューとスキャナースレッドを使わずにコピーする"""
+        from app.routers import files
+
+        def no_queue(*args, **kwargs):
+            raise AssertionError("キューは使わない")
+
+        monkeypatch.setattr(files, "_BatchQueue", no_queue)
+        src = tmp_path / "a.txt"
+        src.write_text("a")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        files._execute_batch_copy_async(batch_task.id, [str(src)], dest, True, True, False)
+
+        result = batch_task.result
+        assert result["success_count"] == 1
+        assert result["results"][0] == {"path": str(src), "status": "success", "message": "コピー完了"}
+        assert (dest / "a.txt").read_text() == "a"
+
+    def test_copy_error_is_reported_for_relative_source_path(self, tmp_path, monkeypatch, batch_task):
+        """相対パスで指定したコピー元でも、配下のコピー失敗は指定したパスのエラーとして返る"""
+        from app.routers import files
+
+        def fail_copy(src, dest, exclusive=False):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "fast_copy_file", fail_copy)
+        (tmp_path / "src_dir").mkdir()
+        (tmp_path / "src_dir" / "a.txt").write_text("a")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        files._execute_batch_copy_async(batch_task.id, ["src_dir"], dest, True, False, False)
+
+        result = batch_task.result
+        assert result["results"][0] == {"path": "src_dir", "status": "error", "message": "disk full"}
+
+    def test_overwrite_replaces_existing_file_and_directory(self, tmp_path, batch_task):
+        """上書き時は既存のファイル・同名ディレクトリを置き換え、一時ファイルを残さない"""
+        from app.routers import files
+
+        src = tmp_path / "src_dir"
+        src.mkdir()
+        (src / "a.txt").write_text("new")
+        (src / "b.txt").write_text("file")
+        dest = tmp_path / "dest"
+        (dest / "src_dir" / "b.txt").mkdir(parents=True)
+        (dest / "src_dir" / "a.txt").write_text("old")
+
+        files._execute_batch_copy_async(batch_task.id, [str(src)], dest, True, False, False)
+
+        result = batch_task.result
+        assert result["success_count"] == 2
+        assert (dest / "src_dir" / "a.txt").read_text() == "new"
+        assert (dest / "src_dir" / "b.txt").read_text() == "file"
+        assert sorted(p.name for p in (dest / "src_dir").iterdir()) == ["a.txt", "b.txt"]
+
+    def test_failed_overwrite_keeps_existing_file(self, tmp_path, monkeypatch, batch_task):
+        """上書きコピーに失敗しても既存ファイルは元のまま残る"""
+        from app.routers import files
+
+        def fail_copy(src, dest, exclusive=False):
+            dest.write_text("partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "fast_copy_file", fail_copy)
+        src = tmp_path / "a.txt"
+        src.write_text("new")
+        dest = tmp_path / "dest"
+        dest.mkdir()
+        (dest / "a.txt").write_text("old")
+
+        files._execute_batch_copy_async(batch_task.id, [str(src)], dest, True, False, False)
+
+        assert batch_task.result["fail_count"] == 1
+        assert (dest / "a.txt").read_text() == "old"
+        assert [p.name for p in dest.iterdir()] == ["a.txt"]
+
+
+class TestBatchCopyItem:
+    """_batch_copy_item関数のテストクラス"""
+
+    @pytest.mark.parametrize("verify_checksum", [False, True])
+    def test_existing_destination_is_skipped_untouched(self, tmp_path, verify_checksum):
+        """上書きしない場合、既存のコピー先はコピー自体の排他作成で検出してスキップし、内容を変えない"""
+        from app.routers import files
+
+        src = tmp_path / "a.txt"
+        src.write_text("new")
+        dest = tmp_path / "b.txt"
+        dest.write_text("old")
+
+        status, *_ = files._batch_copy_item(str(src), str(dest), str(src), False, verify_checksum)
+
+        assert status == "skipped"
+        assert dest.read_text() == "old"
+
+    @pytest.mark.parametrize("verify_checksum", [False, True])
+    def test_new_destination_is_copied(self, tmp_path, verify_checksum):
+        """上書きしない場合でも、コピー先が無ければそのままコピーする"""
+        from app.routers import files
+
+        src = tmp_path / "a.txt"
+        src.write_text("new")
+        dest = tmp_path / "b.txt"
+
+        status, *_ = files._batch_copy_item(str(src), str(dest), str(src), False, verify_checksum)
+
+        assert status == "success"
+        assert dest.read_text() == "new"
+
+    def test_clonefile_eexist_is_skipped_without_fallback(self, tmp_path, monkeypatch):
+        """macOS で clonefile が EEXIST を返した場合は copy2 にフォールバックせずスキップ扱いにする"""
+        import errno
+        from app.routers import files
+
+        def clone_exists(src, dest, exclusive=False):
+            raise OSError(errno.EEXIST, "clonefile failed")
+
+        def fail_copy2(*args, **kwargs):
+            raise AssertionError("フォールバックされないはず")
+
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
+        monkeypatch.setattr(files, "_fast_copy_macos", clone_exists)
+        monkeypatch.setattr(files.shutil, "copy2", fail_copy2)
+        src = tmp_path / "a.txt"
+        src.write_text("new")
+        dest = tmp_path / "b.txt"
+        dest.write_text("old")
+
+        status, *_ = files._batch_copy_item(str(src), str(dest), str(src), False, False)
+
+        assert status == "skipped"
+        assert dest.read_text() == "old"
+
+    def test_failed_overwrite_removes_temp_file(self, tmp_path, monkeypatch):
+        """上書きコピーが途中で失敗しても一時ファイルを残さず、既存のコピー先も変えない"""
+        from app.routers import files
+
+        def partial_copy(src, dest, exclusive=False):
+            Path(dest).write_text("partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(files, "fast_copy_file", partial_copy)
+        src = tmp_path / "a.txt"
+        src.write_text("new")
+        dest = tmp_path / "b.txt"
+        dest.write_text("old")
+
+        status, *_ = files._batch_copy_item(str(src), str(dest), str(src), True, False)
+
+        assert status == "error"
+        assert dest.read_text() == "old"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["a.txt", "b.txt"]
+
+
+class TestIoWorkersFor:
+    """_io_workers_for関数のテストクラス"""
+
+    def test_rotational_device_uses_fewer_workers(self, tmp_path, monkeypatch):
+        """HDD上のパスには少ないワーカー数を返す"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "_is_rotational_device", lambda st_dev: True)
+        assert files._io_workers_for(tmp_path) == files.ROTATIONAL_IO_WORKERS
+
+    def test_network_filesystem_uses_network_workers(self, tmp_path, monkeypatch):
+        """ネットワークファイルシステム上のパスにはネットワーク用のワーカー数を返す"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "_is_network_device", lambda st_dev: True)
+        monkeypatch.setattr(files, "_is_rotational_device", lambda st_dev: True)
+        assert files._io_workers_for(tmp_path) == files.NETWORK_IO_WORKERS
+
+    @pytest.mark.skipif(not hasattr(os, "makedev"), reason="デバイス番号を扱えない環境")
+    def test_network_device_is_detected_from_mountinfo(self, tmp_path, monkeypatch):
+        """mountinfo でデバイス番号が一致するマウントの種別から判定する"""
+        import builtins
+        import io
+        from app.routers import files
+
+        st_dev = os.makedev(0, 52)
+        mountinfo = (
+            "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+            "52 22 0:52 / /mnt/nas rw,relatime shared:30 - nfs4 nas:/export rw,vers=4.2\n"
+        )
+        real_open = builtins.open
+        monkeypatch.setattr(
+            builtins, "open",
+            lambda file, *args, **kwargs: io.StringIO(mountinfo) if file == "/proc/self/mountinfo" else real_open(file, *args, **kwargs),
+        )
+        files._is_network_device.cache_clear()
+        try:
+            assert files._is_network_device(st_dev) is True
+            assert files._is_network_device(os.makedev(8, 1)) is False
+        finally:
+            files._is_network_device.cache_clear()
+
+    def test_missing_path_is_judged_by_parent(self, tmp_path, monkeypatch):
+        """存在しないパスは親ディレクトリのデバイスで判定する"""
+        from app.routers import files
+
+        seen = []
+
+        def is_rotational(st_dev):
+            seen.append(st_dev)
+            return False
+
+        monkeypatch.setattr(files, "_is_rotational_device", is_rotational)
+        assert files._io_workers_for(tmp_path / "not_yet_created") == files.MAX_IO_WORKERS
+        assert seen == [os.stat(tmp_path).st_dev]
+
+
+class TestCalculateFileSampleChecksum:
+    """calculate_file_sample_checksum関数のテストクラス"""
+
+    def test_detects_changes_in_sampled_blocks_only(self, tmp_path):
+        """先頭・中央・末尾のブロックとサイズの違いは検出し、サンプル外の違いは見ない"""
+        from app.routers.files import calculate_file_sample_checksum
+
+        block = 1024
+        data = bytearray(os.urandom(block * 10))
+        (tmp_path / "a.bin").write_bytes(data)
+        base = calculate_file_sample_checksum(tmp_path / "a.bin", block)
+
+        tail_changed = bytearray(data)
+        tail_changed[-1] ^= 1
+        (tmp_path / "b.bin").write_bytes(tail_changed)
+        assert calculate_file_sample_checksum(tmp_path / "b.bin", block) != base
+
+        (tmp_path / "c.bin").write_bytes(data[:-1])
+        assert calculate_file_sample_checksum(tmp_path / "c.bin", block) != base
+
+        unsampled_changed = bytearray(data)
+        unsampled_changed[block * 2] ^= 1
+        (tmp_path / "d.bin").write_bytes(unsampled_changed)
+        assert calculate_file_sample_checksum(tmp_path / "d.bin", block) == base
+
+    def test_sample_verify_move_checks_blocks(self, tmp_path, monkeypatch):
+        """verify_mode="sample" 相当の移動はコピー後にサンプル検証を通して完了する"""
+        from app.routers import files
+
+        checked = []
+        original = files.calculate_file_sample_checksum
+
+        def tracking_checksum(path, *args):
+            checked.append(Path(path).name)
+            return original(path, *args)
+
+        monkeypatch.setattr(files, "_try_rename_same_device", lambda src, dest: False)
+        monkeypatch.setattr(files, "calculate_file_sample_checksum", tracking_checksum)
+        src = tmp_path / "a.bin"
+        src.write_bytes(os.urandom(64 * 1024))
+        data = src.read_bytes()
+        dest = tmp_path / "b.bin"
+
+        assert files.safe_move(src, dest, sample_verify=True) == (True, "移動完了")
+        assert dest.read_bytes() == data
+        assert checked == ["a.bin", "b.bin"]
+
+
+class TestCopyFileWithChecksumDirectIo:
+    """copy_file_with_checksum の O_DIRECT 書き込みのテストクラス"""
+
+    def test_direct_copy_handles_unaligned_tail(self, tmp_path, monkeypatch):
+        """ブロック境界に揃わないサイズでも末尾まで正しくコピーし、同じチェックサムを返す"""
+        from app.routers import files
+
+        monkeypatch.setattr(files, "DIRECT_IO_THRESHOLD", 0)
+        src = tmp_path / "source.bin"
+        dest = tmp_path / "dest.bin"
+        src.write_bytes(os.urandom(3 * 65536 + 123))
+
+        checksum = files.copy_file_with_checksum(src, dest, chunk_size=65536)
+
+        assert dest.read_bytes() == src.read_bytes()
+        assert checksum == files.calculate_file_checksum(dest)
+
+    def test_direct_copy_path_used_when_available(self, tmp_path, monkeypatch):
+        """O_DIRECT で開けた場合はアラインしたバッファ経由でコピーする"""
+        from app.routers import files
+
+        if not hasattr(os, "O_DIRECT"):
+            pytest.skip("O_DIRECT が無い環境")
+        opened = []
+
+        def open_plain(dest, flags):
+            fd = os.open(dest, flags, 0o666)
+            opened.append(fd)
+            return fd
+
+        # ファイルシステムが O_DIRECT 非対応でも経路を通せるよう通常のオープンで代用する
+        monkeypatch.setattr(files, "DIRECT_IO_THRESHOLD", 0)
+        monkeypatch.setattr(files, "_open_direct_for_write", open_plain)
+        src = tmp_path / "source.bin"
+        dest = tmp_path / "dest.bin"
+        src.write_bytes(os.urandom(2 * 8192 + 5))
+
+        files.copy_file_with_checksum(src, dest, chunk_size=8192)
+
+        assert opened
+        assert dest.read_bytes() == src.read_bytes()
+
+
+class TestRunBounded:
+    """_run_bounded関数のテストクラス"""
+
+    def test_limits_in_flight_jobs_and_returns_all_results(self):
+        """同時実行数を max_in_flight 以下に抑えつつ、全ジョブの結果を返す"""
+        import threading
+        import time
+        from app.routers.files import IO_POOL, _run_bounded
+
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def job(value):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return value * 2
+
+        results = list(_run_bounded(IO_POOL, job, ((i,) for i in range(20)), 3))
+
+        assert sorted(results) == [i * 2 for i in range(20)]
+        assert peak[0] <= 3
+
+    def test_breaking_out_stops_submitting(self):
+        """途中でループを抜けると、それ以降のジョブは投入されない"""
+        from app.routers.files import IO_POOL, _run_bounded
+
+        consumed = []
+
+        def args():
+            for i in range(1000):
+                consumed.append(i)
+                yield (i,)
+
+        for _ in _run_bounded(IO_POOL, lambda value: value, args(), 2):
+            break
+
+        assert len(consumed) < 10
+
+
+
+
+class TestSubmitBatchJob:
+    """_submit_batch_job関数のテストクラス"""
+
+    def test_unexpected_error_marks_task_as_failed(self):
+        """想定外の例外で終了したバッチ処理はタスクのエラーとして記録される"""
+        from app.routers import files
+        from app.task_manager import task_manager
+
+        def broken_job():
+            raise RuntimeError("boom")
+
+        task = task_manager.create_task()
+        files._submit_batch_job(task.id, broken_job)
+
+        for _ in range(100):
+            if task_manager.get_task(task.id).status == "error":
+                break
+            time.sleep(0.01)
+        assert task_manager.get_task(task.id).status == "error"
+        assert task_manager.get_task(task.id).error_message == "boom"
+
+class TestBatchQueue:
+    """_BatchQueueクラスのテストクラス"""
+
+    def test_get_batch_returns_items_in_order_up_to_limit(self):
+        """投入順に最大件数まで取り出す"""
+        from app.routers.files import _BatchQueue
+
+        work_queue = _BatchQueue(maxsize=10)
+        work_queue.put_many([1, 2, 3])
+        work_queue.put_many([4])
+
+        assert work_queue.get_batch(3) == [1, 2, 3]
+        assert work_queue.get_batch(3) == [4]
+
+    def test_get_batch_waits_until_items_or_close(self):
+        """空の間は待ち、close() 後は残りを返し切ってから空リストを返す"""
+        import threading
+        from app.routers.files import _BatchQueue
+
+        work_queue = _BatchQueue(maxsize=10)
+        batches = []
+        consumer = threading.Thread(target=lambda: batches.append(work_queue.get_batch(3)))
+        consumer.start()
+        consumer.join(timeout=0.05)
+        assert consumer.is_alive()
+
+        work_queue.put_many([1])
+        consumer.join(timeout=1)
+        assert batches == [[1]]
+
+        work_queue.put_many([2])
+        work_queue.close()
+        assert work_queue.get_batch(3) == [2]
+        assert work_queue.get_batch(3) == []
+
+    def test_put_many_waits_until_consumer_frees_space(self):
+        """満杯の間は put_many が待ち、取り出されると続きを投入する"""
+        import threading
+        from app.routers.files import _BatchQueue
+
+        work_queue = _BatchQueue(maxsize=2)
+        work_queue.put_many([1, 2])
+        producer = threading.Thread(target=work_queue.put_many, args=([3],))
+        producer.start()
+        producer.join(timeout=0.05)
+        assert producer.is_alive()
+
+        assert work_queue.get_batch(2) == [1, 2]
+        producer.join(timeout=1)
+        assert work_queue.get_batch(2) == [3]
+
+
+class TestProgressPublisher:
+    """_ProgressPublisherクラスのテストクラス"""
+
+    def test_publishes_latest_state_on_exit(self):
+        """with ブロックを抜けると最後に更新した値が通知される"""
+        from app.routers.files import _ProgressPublisher
+        from app.task_manager import task_manager
+
+        task = task_manager.create_task(total_files=3)
+        with _ProgressPublisher(task.id, label="コピー: ") as progress:
+            for index, name in enumerate(["a.txt", "b.txt", "c.txt"], start=1):
+                progress.update(index, os.path.join("dir", name))
+
+        info = task_manager.get_task(task.id)
+        assert info.processed_files == 3
+        assert info.current_file == "コピー: c.txt"
+        assert info.progress == 100
@@ -50,6 +50,21 @@ class TestGetFiles:
         assert "file1.txt" in names
         assert "file2.md" in names
 
+    def test_get_files_hides_leftover_copy_temp_files(self, client, temp_dir, monkeypatch):
+        """上書きコピーの一時ファイルが残っていても一覧・検索には表示しない"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        (temp_dir / "file1.txt.fm-tmp-0123abcd").write_text("partial")
+        (temp_dir / "file1.txt.fm-tmp-notes").write_text("user file")
+
+        names = [item["name"] for item in client.get("/api/files", params={"path": ""}).json()["items"]]
+        found = [item["name"] for item in client.get("/api/search", params={"path": "", "query": "file1"}).json()["items"]]
+
+        assert "file1.txt.fm-tmp-0123abcd" not in names
+        assert "file1.txt.fm-tmp-notes" in names
+        assert "file1.txt.fm-tmp-0123abcd" not in found
+        assert "file1.txt.fm-tmp-notes" in found
+
     def test_get_files_item_structure(self, client, temp_dir, monkeypatch):
         """各アイテムが必要な情報を持っている"""
         from app import config
@@ -64,6 +79,8 @@ class TestGetFiles:
         folder = next(item for item in items if item["name"] == "folder1")
         assert folder["type"] == "directory"
         assert "path" in folder
+        assert folder["size"] is None
+        assert folder["modified"] is None
 
         # ファイルの構造確認
         file = next(item for item in items if item["name"] == "file1.txt")
@@ -72,6 +89,20 @@ class TestGetFiles:
         assert "size" in file
         assert "modified" in file
 
+    def test_get_files_modified_is_local_iso_string(self, client, temp_dir, monkeypatch):
+        """更新日時はローカル時刻のISO形式（秒精度）で返る"""
+        import os
+        from datetime import datetime
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        mtime = datetime(2026, 3, 4, 5, 6, 7).timestamp()
+        os.utime(temp_dir / "file1.txt", (mtime, mtime))
+
+        response = client.get("/api/files", params={"path": ""})
+
+        file = next(item for item in response.json()["items"] if item["name"] == "file1.txt")
+        assert file["modified"] == "2026-03-04T05:06:07"
+
     def test_get_files_nested_directory(self, client, temp_dir, monkeypatch):
         """ネストしたディレクトリの内容を取得できる"""
         from app import config
@@ -153,6 +184,31 @@ class TestGetFiles:
         assert "folder1_loop" not in names
 
 
+    def test_modified_matches_isoformat(self, client, temp_dir, monkeypatch):
+        """modified は datetime.isoformat() と同じ文字列（小数秒を含む）で返す"""
+        import os
+        from datetime import datetime
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        target = temp_dir / "file1.txt"
+        os.utime(target, ns=(1_700_000_000_123_456_000, 1_700_000_000_123_456_000))
+
+        response = client.get("/api/files", params={"path": ""})
+
+        item = next(i for i in response.json()["items"] if i["name"] == "file1.txt")
+        assert item["modified"] == datetime.fromtimestamp(target.stat().st_mtime).isoformat()
+        assert item["modified"].endswith(".123456")
+
+    @pytest.mark.parametrize("timestamp", [0.0, 1_700_000_000.0, 1_700_000_000.5, 1_700_000_000.9999996])
+    def test_format_mtime_is_byte_identical_to_isoformat(self, timestamp):
+        """_format_mtime は小数部の有無・繰り上がりを含めて isoformat() と同じ出力になる"""
+        from datetime import datetime
+        from app.routers.files import _format_mtime
+
+        assert _format_mtime(timestamp) == datetime.fromtimestamp(timestamp).isoformat()
+
+
 class TestFolderLatestModified:
     """フォルダ配下の最新更新日時を取得するAPIのテスト"""
 
@@ -388,6 +444,30 @@ class TestSearchFiles:
         assert data["items"][0]["name"] == "match_dir"
         assert data["items"][0]["type"] == "directory"
 
+    def test_search_files_items_keep_file_item_shape(self, client, temp_dir, monkeypatch):
+        """結果はモデル検証を通さずに返すが、FileItem と同じキー構成とOpenAPIスキーマを保つ"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        (temp_dir / "match_dir").mkdir()
+        (temp_dir / "match_file.txt").write_text("match")
+
+        response = client.get("/api/search", params={"path": "", "query": "match", "depth": 1})
+
+        assert response.status_code == 200
+        items = {item["name"]: item for item in response.json()["items"]}
+        assert items["match_dir"] == {
+            "name": "match_dir",
+            "type": "directory",
+            "path": (temp_dir / "match_dir").as_posix(),
+            "size": None,
+            "modified": None,
+        }
+        assert items["match_file.txt"]["size"] == 5
+        schema = client.get("/openapi.json").json()
+        response_schema = schema["paths"]["/api/search"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert response_schema["$ref"].endswith("SearchResponse")
+
     def test_search_files_skips_recursive_symlink_entries(self, client, temp_dir, monkeypatch):
         """再帰検索でもベース配下を指すシンボリックリンクはたどらない"""
         from app import config
@@ -403,6 +483,120 @@ class TestSearchFiles:
         assert data["total"] == 0
         assert data["items"] == []
 
+    def test_search_files_applies_literal_and_glob_ignore_patterns(self, client, temp_dir, monkeypatch):
+        """除外パターンは名前の完全一致とワイルドカードの両方で判定される"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        (temp_dir / "node_modules").mkdir()
+        (temp_dir / "node_modules" / "hit_in_modules.txt").write_text("x")
+        (temp_dir / "hit.pyc").write_text("x")
+        (temp_dir / "hit.py").write_text("x")
+
+        response = client.get(
+            "/api/search",
+            params={"path": "", "query": "hit", "depth": 0, "ignore": "node_modules,*.pyc"},
+        )
+
+        assert response.status_code == 200
+        names = [item["name"] for item in response.json()["items"]]
+        assert names == ["hit.py"]
+
+    def test_search_files_ignore_patterns_match_path_substrings(self, client, temp_dir, monkeypatch):
+        """除外パターンは従来通りパス文字列への部分一致でも判定される"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        (temp_dir / "my_node_modules_backup").mkdir()
+        (temp_dir / "my_node_modules_backup" / "hidden.txt").write_text("x")
+        (temp_dir / ".gitignore").write_text("x")
+        (temp_dir / "build" / "cache").mkdir(parents=True)
+        (temp_dir / "build" / "cache" / "hidden2.txt").write_text("x")
+        (temp_dir / "keep.txt").write_text("x")
+
+        response = client.get(
+            "/api/search",
+            params={"path": "", "query": "e", "depth": 0, "ignore": "node_modules,build/cache"},
+        )
+
+        assert response.status_code == 200
+        names = {item["name"] for item in response.json()["items"]}
+        assert "keep.txt" in names
+        assert ".gitignore" not in names
+        assert "my_node_modules_backup" not in names
+        assert "hidden.txt" not in names
+        assert "hidden2.txt" not in names
+
+    @pytest.mark.parametrize("patterns,name,path", [
+        (["*.pyc"], "a.pyc", "/x/a.pyc"),
+        (["a[1]"], "a[1]", "/x/a[1]"),
+        (["node_modules"], "pkg", "/x/node_modules/pkg"),
+        (["modules"], "my_node_modules_backup", "/x/my_node_modules_backup"),
+        ([".git"], ".gitignore", "/x/.gitignore"),
+        (["build/cache"], "y", "/build/cache/y"),
+        (["*.pyc"], "a.py", "/x/a.py"),
+        (["Node_Modules"], "pkg", "/x/node_modules/pkg"),
+    ])
+    def test_ignore_matcher_agrees_with_original_rules(self, patterns, name, path):
+        """IgnoreMatcher は fnmatch・完全一致・パスへの部分一致という従来の判定と同じ結果になる"""
+        import fnmatch
+        from app.routers.files import IgnoreMatcher
+
+        expected = any(
+            fnmatch.fnmatch(name, p) or name == p or p in path for p in patterns
+        )
+
+        assert IgnoreMatcher(patterns).matches(name, path) is expected
+
+    def test_truncated_search_is_deterministic(self, temp_dir):
+        """max_results で打ち切る場合も、浅い階層・パス順の先頭から同じ結果を返す"""
+        from app.routers.files import search_files_recursive
+
+        root = temp_dir / "tree"
+        for top in ("a", "b", "c"):
+            for sub in ("x", "y"):
+                (root / top / sub).mkdir(parents=True)
+                (root / top / sub / f"hit_{top}{sub}.txt").write_text("x")
+            (root / top / f"hit_{top}.txt").write_text("x")
+        (root / "hit_root.txt").write_text("x")
+
+        runs = []
+        for _ in range(5):
+            results = []
+            search_files_recursive(root, "hit", 1, 0, [], results, 3, "file")
+            runs.append([item["name"] for item in results])
+
+        assert all(run == runs[0] for run in runs)
+        assert runs[0] == ["hit_a.txt", "hit_b.txt", "hit_root.txt"]
+
+    def test_search_files_does_not_scan_ignored_directories(self, client, temp_dir, monkeypatch):
+        """除外されたディレクトリは配下を走査しない（サブツリーごと枝刈りされる）"""
+        from app import config
+        from app.routers import files
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        (temp_dir / "node_modules" / "deep").mkdir(parents=True)
+        (temp_dir / "node_modules" / "deep" / "hit.txt").write_text("x")
+
+        scanned = []
+        original_scandir = files.os.scandir
+
+        def recording_scandir(path):
+            scanned.append(str(path))
+            return original_scandir(path)
+
+        monkeypatch.setattr(files.os, "scandir", recording_scandir)
+
+        response = client.get(
+            "/api/search",
+            params={"path": "", "query": "hit", "depth": 0, "ignore": "node_modules"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+        assert scanned
+        assert not any("node_modules" in path for path in scanned)
+
 
 class TestDeleteItem:
     """DELETE /api/delete エンドポイントのテスト"""
@@ -514,12 +708,8 @@ class TestDeleteItem:
             nonlocal called
             called = True
             
-        # send2trashモジュールをモック (テスト環境での不要な依存を防ぐ)
-        import sys
-        import types
-        dummy_send2trash_module = types.ModuleType("send2trash")
-        dummy_send2trash_module.send2trash = mock_send2trash
-        monkeypatch.setitem(sys.modules, "send2trash", dummy_send2trash_module)
+        # モジュール読み込み時に解決済みの send2trash をモック (実際にゴミ箱へ移動しない)
+        monkeypatch.setattr(files, "send2trash", mock_send2trash)
         
         target_path = str(temp_dir / "test_del.txt")
         files._move_to_trash(target_path)
@@ -560,3 +750,355 @@ class TestDeleteItem:
         assert "locked_by" in data
         assert data["locked_by"][0]["pid"] == 1234
         assert data["locked_by"][0]["name"] == "EXCEL.EXE"
+
+
+class TestCollectAllFiles:
+    """collect_all_files のテスト"""
+
+    def test_yields_children_before_parents(self, temp_dir):
+        """子要素が必ず親ディレクトリより先に返され、最後にルート自身が返る"""
+        from app.routers.files import collect_all_files
+
+        (temp_dir / "folder1" / "deep").mkdir()
+        (temp_dir / "folder1" / "deep" / "leaf.txt").write_text("leaf")
+
+        items = [Path(item) for item, _ in collect_all_files(temp_dir)]
+
+        assert items[-1] == temp_dir
+        positions = {item: index for index, item in enumerate(items)}
+        for item in items[:-1]:
+            assert positions[item] < positions[item.parent]
+        assert len(items) == len(set(items)) == 8
+
+    def test_reports_directory_flag_from_scan(self, temp_dir):
+        """走査時の種別がそのまま返り、削除側で再度statする必要がない"""
+        from app.routers.files import collect_all_files
+
+        kinds = {Path(item): is_dir for item, is_dir in collect_all_files(temp_dir)}
+
+        assert kinds[temp_dir / "folder1"] is True
+        assert kinds[temp_dir / "folder1" / "nested.txt"] is False
+        assert kinds[temp_dir / "file1.txt"] is False
+
+
+class TestUnlinkOrRmdir:
+    """_unlink_or_rmdir のテスト（ネットワークドライブ向けの直接削除）"""
+
+    def test_removes_file_and_empty_directory(self, temp_dir):
+        """ファイルは unlink、空ディレクトリは rmdir へのフォールバックで削除される"""
+        from app.routers.files import _unlink_or_rmdir
+
+        target_file = temp_dir / "single.txt"
+        target_file.write_text("x")
+        empty_dir = temp_dir / "empty"
+        empty_dir.mkdir()
+
+        _unlink_or_rmdir(target_file)
+        _unlink_or_rmdir(empty_dir)
+
+        assert not target_file.exists()
+        assert not empty_dir.exists()
+
+    def test_non_empty_directory_raises(self, temp_dir):
+        """中身が残っているディレクトリは削除せずエラーにする"""
+        from app.routers.files import _unlink_or_rmdir
+
+        with pytest.raises(OSError):
+            _unlink_or_rmdir(temp_dir / "folder1")
+        assert (temp_dir / "folder1").is_dir()
+
+
+class TestExecuteBatchDeleteAsync:
+    """_execute_batch_delete_async のテスト"""
+
+    def test_deletes_nested_tree_without_leftover_directories(self, temp_dir, monkeypatch):
+        """深い階層のディレクトリも子から順に削除され、ルートまで残らない"""
+        from app.routers import files
+        from app.task_manager import task_manager
+
+        monkeypatch.setattr(files, "_is_network_drive", lambda path: True)
+        (temp_dir / "folder1" / "deep" / "deeper").mkdir(parents=True)
+        (temp_dir / "folder1" / "deep" / "deeper" / "leaf.txt").write_text("leaf")
+        (temp_dir / "folder1" / "deep" / "empty").mkdir()
+
+        task = task_manager.create_task()
+        files._execute_batch_delete_async(task.id, [str(temp_dir / "folder1")], False)
+
+        result = task_manager.get_task(task.id).result
+        assert not (temp_dir / "folder1").exists()
+        assert result["fail_count"] == 0
+        assert result["success_count"] == 2
+
+
+class TestCountFiles:
+    """POST /api/count-files エンドポイントのテスト"""
+
+    def test_counts_files_up_to_max_depth(self, client, temp_dir, monkeypatch):
+        """指定した深さまでのファイルが数えられる"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        response = client.post("/api/count-files", json={"paths": [str(temp_dir)], "max_depth": 3})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 3
+        assert data["details"][0]["type"] == "directory"
+
+    def test_limit_stops_counting_early(self, client, temp_dir, monkeypatch):
+        """limit を指定すると合計がその件数で打ち切られる"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        response = client.post(
+            "/api/count-files",
+            json={"paths": [str(temp_dir), str(temp_dir / "file1.txt")], "limit": 2},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_count"] == 2
+        assert data["details"][1]["count"] == 0
+
+
+class TestRecursiveSymlinkTarget:
+    """_is_recursive_symlink_target のテスト"""
+
+    def test_detects_links_into_root_but_not_prefix_siblings(self, tmp_path):
+        """ベース配下へのリンクは除外し、名前の前方一致するだけの兄弟ディレクトリへのリンクは除外しない"""
+        from app.routers.files import _is_recursive_symlink_target
+
+        root = tmp_path / "base"
+        (root / "inner").mkdir(parents=True)
+        (tmp_path / "base2").mkdir()
+        create_directory_symlink_or_skip(root / "to_inner", root / "inner")
+        create_directory_symlink_or_skip(root / "to_sibling", tmp_path / "base2")
+        create_directory_symlink_or_skip(root / "broken", tmp_path / "missing")
+
+        root_str = str(root.resolve())
+        assert _is_recursive_symlink_target(str(root / "to_inner"), root_str) is True
+        assert _is_recursive_symlink_target(str(root / "to_sibling"), root_str) is False
+        assert _is_recursive_symlink_target(str(root / "broken"), root_str) is True
+
+    def test_relative_link_through_another_link_is_resolved(self, tmp_path):
+        """相対パスのリンク先は字面ではなく実際の位置で判定する（途中にリンクを挟んでベース外へ出る場合）"""
+        import os
+        from app.routers.files import _is_recursive_symlink_target
+
+        root = tmp_path / "base"
+        (root / "inner").mkdir(parents=True)
+        (tmp_path / "elsewhere" / "outside").mkdir(parents=True)
+        (tmp_path / "elsewhere" / "inner").mkdir()
+        create_directory_symlink_or_skip(root / "hop", tmp_path / "elsewhere" / "outside")
+        # 字面では base/inner だが、hop を辿ると elsewhere/inner になる
+        os.symlink(os.path.join("hop", "..", "inner"), root / "escape", target_is_directory=True)
+        # 字面・実際ともに base/inner
+        os.symlink(os.path.join("..", "base", "inner"), root / "back_inside", target_is_directory=True)
+
+        root_str = str(root.resolve())
+        assert _is_recursive_symlink_target(str(root / "escape"), root_str) is False
+        assert _is_recursive_symlink_target(str(root / "back_inside"), root_str) is True
+
+
+class TestWriteTextFileEndpoints:
+    """POST /api/create-file, /api/update-file エンドポイントのテスト"""
+
+    def test_create_file_writes_content(self, client, temp_dir, monkeypatch):
+        """指定した内容でファイルを作成する"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        response = client.post("/api/create-file", json={"path": str(temp_dir), "name": "new.txt", "content": "こんにちは"})
+
+        assert response.status_code == 200
+        assert (temp_dir / "new.txt").read_text(encoding="utf-8") == "こんにちは"
+
+    def test_update_file_overwrites_content(self, client, temp_dir, monkeypatch):
+        """既存ファイルの内容を置き換える"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        response = client.post("/api/update-file", json={"path": str(temp_dir / "file1.txt"), "content": "updated"})
+
+        assert response.status_code == 200
+        assert (temp_dir / "file1.txt").read_text(encoding="utf-8") == "updated"
+
+
+class TestCopyItemsBatch:
+    """POST /api/copy/batch エンドポイントのテスト"""
+
+    def test_sync_directory_copy_uses_fast_copy_per_file(self, client, temp_dir, monkeypatch):
+        """同期モードのフォルダコピーでも各ファイルを fast_copy_file でコピーする"""
+        from app import config
+        from app.routers import files
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+
+        copied = []
+        original = files.fast_copy_file
+
+        def tracking_copy(src, dest, exclusive=False):
+            copied.append(src.name)
+            return original(src, dest, exclusive=exclusive)
+
+        monkeypatch.setattr(files, "fast_copy_file", tracking_copy)
+        dest = temp_dir / "folder2"
+
+        response = client.post("/api/copy/batch", json={"src_paths": [str(temp_dir / "folder1")], "dest_path": str(dest)})
+
+        assert response.status_code == 200
+        assert response.json()["success_count"] == 1
+        assert (dest / "folder1" / "nested.txt").exists()
+        assert copied == ["nested.txt"]
+
+    def test_sibling_with_common_prefix_is_not_treated_as_subdirectory(self, client, temp_dir, monkeypatch):
+        """名前の前方一致だけの兄弟フォルダへは自分自身のサブディレクトリ扱いせずコピーできる"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        dest = temp_dir / "folder1_backup"
+        dest.mkdir()
+
+        response = client.post("/api/copy/batch", json={"src_paths": [str(temp_dir / "folder1")], "dest_path": str(dest)})
+
+        assert response.status_code == 200
+        assert response.json()["fail_count"] == 0
+        assert (dest / "folder1" / "nested.txt").exists()
+
+    def test_copy_into_own_subdirectory_is_rejected(self, client, temp_dir, monkeypatch):
+        """自分自身のサブディレクトリへのコピーはエラーになる"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        dest = temp_dir / "folder1" / "inner"
+        dest.mkdir()
+
+        response = client.post("/api/copy/batch", json={"src_paths": [str(temp_dir / "folder1")], "dest_path": str(dest)})
+
+        assert response.status_code == 200
+        assert response.json()["results"][0]["status"] == "error"
+
+
+class TestGetFileContent:
+    """GET /api/file-content エンドポイントのテスト"""
+
+    def test_returns_utf8_content(self, client, temp_dir, monkeypatch):
+        """UTF-8のテキストファイルの内容を返す"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        target = temp_dir / "memo.txt"
+        target.write_text("こんにちは\n", encoding="utf-8")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "こんにちは\n"
+
+    def test_crlf_is_normalized_and_round_trips(self, client, temp_dir, monkeypatch):
+        """CRLF/CR は \\n に揃えて返し、そのまま保存しても改行が壊れない"""
+        from app import config
+        from app.routers import files
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        # \r\n が先頭判定の境界で分断されるケースも確認する
+        monkeypatch.setattr(files, "FILE_CONTENT_PROBE_BYTES", 2)
+        target = temp_dir / "crlf.txt"
+        target.write_bytes(b"a\r\nb\r\nc\rd")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 200
+        content = response.json()["content"]
+        assert content == "a\nb\nc\nd"
+
+        files._write_text_file_sync(target, content)
+        assert b"\r\r\n" not in target.read_bytes()
+        assert target.read_text(encoding="utf-8") == "a\nb\nc\nd"
+
+    def test_rejects_binary_file(self, client, temp_dir, monkeypatch):
+        """UTF-8として読めないファイルは400になる"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        target = temp_dir / "image.bin"
+        target.write_bytes(b"\x89PNG\r\n\x1a\n\xff\xfe\x00")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 400
+
+    def test_multibyte_character_split_at_probe_boundary(self, client, temp_dir, monkeypatch):
+        """先頭判定の境界でマルチバイト文字が分断されてもテキストとして読める"""
+        from app import config
+        from app.routers import files
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        monkeypatch.setattr(files, "FILE_CONTENT_PROBE_BYTES", 4)
+        target = temp_dir / "split.txt"
+        target.write_text("aあいう", encoding="utf-8")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 200
+        assert response.json()["content"] == "aあいう"
+
+    def test_binary_detected_from_head_without_reading_rest(self, client, temp_dir, monkeypatch):
+        """先頭がUTF-8でなければ残りを読まずに400を返す"""
+        import builtins
+        from app import config
+        from app.routers import files
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        monkeypatch.setattr(files, "FILE_CONTENT_PROBE_BYTES", 4)
+        target = temp_dir / "data.bin"
+        target.write_bytes(b"\xff\xfe\xfd\xfc" + b"a" * 1024)
+
+        reads = []
+        real_open = builtins.open
+
+        class RecordingFile:
+            def __init__(self, f):
+                self._f = f
+
+            def read(self, size=-1):
+                reads.append(size)
+                return self._f.read(size)
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                self._f.close()
+
+        def recording_open(file, *args, **kwargs):
+            f = real_open(file, *args, **kwargs)
+            return RecordingFile(f) if str(file) == str(target) else f
+
+        monkeypatch.setattr(files, "open", recording_open, raising=False)
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 400
+        assert reads == [4]
+
+    @pytest.mark.parametrize("size,expected_status", [(16, 200), (17, 413)])
+    def test_size_limit_boundary(self, client, temp_dir, monkeypatch, size, expected_status):
+        """上限ちょうどのファイルは読み込み、上限を1バイトでも超えると読み込まずに413を返す"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        monkeypatch.setattr(config.settings, "file_content_max_bytes", 16)
+        target = temp_dir / "large.txt"
+        target.write_text("x" * size, encoding="utf-8")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == expected_status
+
+    def test_no_size_limit_by_default(self, client, temp_dir, monkeypatch):
+        """上限は既定では無制限で、大きなファイルも従来通り読み込める"""
+        from app import config
+        monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
+        assert config.settings.file_content_max_bytes == 0
+        target = temp_dir / "large.txt"
+        target.write_text("x" * (1024 * 1024), encoding="utf-8")
+
+        response = client.get("/api/file-content", params={"path": str(target)})
+
+        assert response.status_code == 200
+        assert len(response.json()["content"]) == 1024 * 1024
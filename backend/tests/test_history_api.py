@@ -0,0 +1,117 @@
+"""
+フォルダ履歴APIのテスト
+履歴ファイルの読み書きと解析結果のキャッシュを確認する
+"""
+import json
+
+
+class TestHistoryApi:
+    """/api/history エンドポイントのテスト"""
+
+    def test_missing_history_file_returns_empty_list(self, client, temp_dir, monkeypatch):
+        """履歴ファイルが無い場合は空リストを返す"""
+        from app.routers import history
+
+        monkeypatch.setattr(history, "HISTORY_FILE", temp_dir / "folder_history.json")
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        response = client.get("/api/history")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_unchanged_file_is_not_parsed_again(self, client, temp_dir, monkeypatch):
+        """ファイルが変わっていなければJSONを読み直さない"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        history_file.write_text(json.dumps([{"path": "/a", "count": 2, "timestamp": 1.0}]), encoding="utf-8")
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        loads = []
+        original_loads = history.loads
+
+        def counting_loads(data):
+            loads.append(data)
+            return original_loads(data)
+
+        monkeypatch.setattr(history, "loads", counting_loads)
+
+        first = client.get("/api/history").json()
+        second = client.get("/api/history").json()
+
+        assert first == second == [{"path": "/a", "count": 2, "timestamp": 1.0}]
+        assert len(loads) == 1
+
+    def test_missing_fields_get_model_defaults(self, client, temp_dir, monkeypatch):
+        """項目に欠けたフィールドがあれば HistoryItem の既定値で補って返す"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        history_file.write_text(json.dumps([{"path": "/a"}]), encoding="utf-8")
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        response = client.get("/api/history")
+
+        assert response.status_code == 200
+        assert response.json() == [{"path": "/a", "count": 1, "timestamp": 0}]
+
+    def test_malformed_entries_return_empty_list(self, client, temp_dir, monkeypatch):
+        """不正な項目を含む履歴ファイルはエラーにせず空リストを返す"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        history_file.write_text(json.dumps([{"path": "/a"}, {"count": "many"}]), encoding="utf-8")
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        response = client.get("/api/history")
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_saved_history_is_returned_by_next_get(self, client, temp_dir, monkeypatch):
+        """保存した履歴は次回の取得で返る（キャッシュが古い値を返さない）"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        history_file.write_text(json.dumps([{"path": "/old", "count": 1, "timestamp": 1.0}]), encoding="utf-8")
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+        client.get("/api/history")
+
+        response = client.post("/api/history", json={"history": [{"path": "/new", "count": 3, "timestamp": 2.0}]})
+
+        assert response.status_code == 200
+        assert client.get("/api/history").json() == [{"path": "/new", "count": 3, "timestamp": 2.0}]
+
+    def test_legacy_string_list_is_returned_as_items(self, client, temp_dir, monkeypatch):
+        """旧形式（パス文字列のリスト）は count=1 の履歴項目として返す"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        history_file.write_text(json.dumps(["/a", "/b"]), encoding="utf-8")
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        data = client.get("/api/history").json()
+
+        assert [item["path"] for item in data] == ["/a", "/b"]
+        assert all(item["count"] == 1 and item["timestamp"] > 0 for item in data)
+
+    def test_save_writes_utf8_json_atomically(self, client, temp_dir, monkeypatch):
+        """保存は一時ファイル経由で行い、日本語をエスケープせずに書き出す"""
+        from app.routers import history
+
+        history_file = temp_dir / "folder_history.json"
+        monkeypatch.setattr(history, "HISTORY_FILE", history_file)
+        monkeypatch.setattr(history, "_history_cache", None)
+
+        response = client.post("/api/history", json={"history": [{"path": "/データ", "count": 1, "timestamp": 1.0}]})
+
+        assert response.status_code == 200
+        assert "/データ" in history_file.read_text(encoding="utf-8")
+        assert json.loads(history_file.read_text(encoding="utf-8"))[0]["path"] == "/データ"
+        assert sorted(p.name for p in temp_dir.iterdir() if p.name.startswith("folder_history")) == ["folder_history.json"]
@@ -1,6 +1,7 @@
 # GET /api/open-path エンドポイントのテスト
 # フォルダを指定した場合のリダイレクト先の動作を確認する
 
+import os
 import pytest
 from pathlib import Path
 import urllib.parse
@@ -94,10 +95,10 @@ class TestFullPath:
             encoding="utf-8",
         )
         monkeypatch.setattr(config.settings, "_preferences_file_override", preferences_path)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -148,10 +149,10 @@ class TestFullPath:
             encoding="utf-8",
         )
         monkeypatch.setattr(config.settings, "_preferences_file_override", preferences_path)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -177,7 +178,7 @@ class TestFullPath:
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -212,7 +213,7 @@ class TestFullPath:
         monkeypatch.setattr(config.settings, "_preferences_file_override", preferences_path)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -240,7 +241,7 @@ class TestFullPath:
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -321,10 +322,10 @@ class TestFullPath:
         note_path.write_text("# note\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.get(
             "/api/fullpath",
@@ -473,7 +474,7 @@ class TestOpenObsidian:
         note_path.write_text("# note\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         startfile_calls = []
         focus_calls = []
@@ -505,7 +506,7 @@ class TestSmartOpenEditorFiles:
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.post(
             "/api/open/smart",
@@ -584,7 +585,7 @@ class TestSmartOpenEditorFiles:
         note_path.write_text("# note\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         startfile_calls = []
         focus_calls = []
@@ -600,6 +601,47 @@ class TestSmartOpenEditorFiles:
         assert focus_calls == [True]
 
 
+    def test_build_obsidian_uri_quotes_vault_and_marks_folders(self):
+        """Vault名もエンコードされ、フォルダは末尾に / が付く"""
+        from app.routers import files
+
+        assert files._build_obsidian_uri("my obsidian", "a b/note.md", False) == (
+            "obsidian://open?vault=my%20obsidian&file=a%20b/note.md"
+        )
+        assert files._build_obsidian_uri("obsidian", "dir", True) == "obsidian://open?vault=obsidian&file=dir/"
+        assert files._build_obsidian_uri("obsidian", "", True) == "obsidian://open?vault=obsidian&file="
+
+    def test_fast_quote_matches_urllib_quote(self):
+        """エンコード不要な文字列はそのまま、それ以外は urllib.parse.quote と同じ結果になる"""
+        from app.routers import files
+
+        for value in ["", "dir/note-1_v2.~md", "a b/c.md", "日本語/メモ.md", "a%b&c=d?e#f", "x+y:z"]:
+            assert files._fast_quote(value) == urllib.parse.quote(value)
+        plain = "folder/sub/file.txt"
+        assert files._fast_quote(plain) is plain
+
+    @pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="posix_spawn が無い環境")
+    def test_spawn_detached_uses_posix_spawn(self, monkeypatch):
+        """POSIX環境では fork せずに posix_spawn で起動し、見つからないコマンドは Popen と同じく失敗する"""
+        from app.routers import files
+
+        spawned = []
+        real_spawn = os.posix_spawn
+
+        def fake_spawn(path, argv, env):
+            spawned.append((path, argv))
+            return real_spawn(path, argv, env)
+
+        monkeypatch.setattr(files.os, "posix_spawn", fake_spawn)
+
+        files._spawn_detached(["true"])
+        assert len(spawned) == 1
+        assert Path(spawned[0][0]).name == "true"
+        assert spawned[0][1] == ["true"]
+
+        with pytest.raises(FileNotFoundError):
+            files._spawn_detached(["no-such-command-for-file-manager-test"])
+
 class TestOpenExplorer:
     """Explorer起動時のWindows固有挙動を確認するテスト"""
 
@@ -609,7 +651,7 @@ class TestOpenExplorer:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         popen_calls = []
         focus_calls = []
@@ -640,7 +682,7 @@ class TestOpenExplorer:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         popen_calls = []
         focus_calls = []
@@ -678,10 +720,10 @@ class TestProgramCodeActions:
         script_path.write_text("print('hello')\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         response = client.post("/api/open/editor", json={"path": str(script_path)})
 
@@ -710,7 +752,7 @@ class TestProgramCodeActions:
         script_path.write_text("print('run')\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
 
         popen_calls = []
 
@@ -736,7 +778,7 @@ class TestProgramCodeActions:
         script_path.write_text("@echo off\r\necho hello\r\n", encoding="utf-8")
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         popen_calls = []
 
@@ -764,7 +806,7 @@ class TestOpenAntigravity:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
         
         # 特定のパスのみ True を返すモック exists
         def fake_exists(p):
@@ -772,7 +814,7 @@ class TestOpenAntigravity:
         monkeypatch.setattr(files.os.path, "exists", fake_exists)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         target_file = temp_dir / "test.txt"
         target_file.touch()
@@ -791,7 +833,7 @@ class TestOpenAntigravity:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
         
         # 特定のパスのみ True を返すモック exists
         def fake_exists(p):
@@ -799,7 +841,7 @@ class TestOpenAntigravity:
         monkeypatch.setattr(files.os.path, "exists", fake_exists)
 
         popen_calls = []
-        monkeypatch.setattr(files.subprocess, "Popen", lambda args: popen_calls.append(args))
+        monkeypatch.setattr(files, "_spawn_detached", lambda args: popen_calls.append(args))
 
         target_file = temp_dir / "test.txt"
         target_file.touch()
@@ -818,7 +860,7 @@ class TestOpenAntigravity:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(files, "_PLATFORM", "Darwin")
         
         # すべて False を返す
         monkeypatch.setattr(files.os.path, "exists", lambda p: False)
@@ -837,7 +879,7 @@ class TestOpenAntigravity:
         from app.routers import files
 
         monkeypatch.setattr(config.settings, "_base_dir_override", temp_dir)
-        monkeypatch.setattr(files.platform, "system", lambda: "Windows")
+        monkeypatch.setattr(files, "_PLATFORM", "Windows")
 
         target_file = temp_dir / "test.txt"
         target_file.touch()
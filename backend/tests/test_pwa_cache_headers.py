@@ -24,6 +24,20 @@ class TestPwaCacheHeaders:
         assert response.status_code == 200
         assert response.headers["cache-control"] == "no-cache, no-store, must-revalidate"
 
+    def test_index_html_built_after_a_miss_is_served(self, client, temp_dir, monkeypatch):
+        """index.html が無い状態で一度参照されても、後から作成されれば配信する"""
+        from app import main
+
+        dist_dir = temp_dir / "dist"
+        dist_dir.mkdir()
+        monkeypatch.setattr(main, "FRONTEND_DIST_DIR", dist_dir)
+
+        assert main._get_index_html() is None
+
+        (dist_dir / "index.html").write_text("<!doctype html><html></html>", encoding="utf-8")
+
+        assert main._get_index_html() is not None
+
     def test_service_worker_is_served_with_no_cache(self, client, temp_dir, monkeypatch):
         """sw.js は更新検知できるよう no-cache で返す"""
         from app import main
@@ -57,3 +71,18 @@ class TestPwaCacheHeaders:
         assert response.status_code == 200
         assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
 
+
+    def test_static_files_skip_cors_processing(self, client, temp_dir, monkeypatch):
+        """静的配信はCORS処理の対象外（同一オリジン前提）"""
+        from app import main
+
+        dist_dir = temp_dir / "dist"
+        dist_dir.mkdir()
+        (dist_dir / "index.html").write_text("<!doctype html><html></html>", encoding="utf-8")
+
+        monkeypatch.setattr(main, "FRONTEND_DIST_DIR", dist_dir)
+
+        response = client.get("/", headers={"Origin": "http://example.com"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,183 @@
+"""
+TaskManager のテスト
+"""
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.task_manager import TaskManager
+
+
+class TestTaskManager:
+    """TaskManager の状態管理のテスト"""
+
+    def test_instances_are_independent(self):
+        """インスタンスごとに独立したタスク表を持つ"""
+        first = TaskManager()
+        second = TaskManager()
+        task = first.create_task()
+
+        assert first is not second
+        assert second.get_task(task.id) is None
+
+    def test_task_info_has_no_instance_dict(self):
+        """TaskInfo は __slots__ を使い、未定義の属性は設定できない"""
+        task = TaskManager().create_task()
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = 1
+
+    def test_create_and_get_task(self):
+        """作成したタスクをロックなしで取得できる"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=4)
+
+        assert manager.get_task(task.id) is task
+        assert manager.get_task("missing") is None
+
+    def test_create_replaces_mapping(self):
+        """作成時は _tasks を差し替え、既存のスナップショットを変更しない"""
+        manager = TaskManager()
+        snapshot = manager._tasks
+        task = manager.create_task()
+
+        assert task.id not in snapshot
+        assert task.id in manager._tasks
+
+    def test_progress_and_completion(self):
+        """進捗更新と完了が反映される"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=4)
+
+        assert manager.update_progress(task.id, processed_files=1, current_file="a.txt")
+        assert task.progress == 25
+        assert task.current_file == "a.txt"
+
+        assert manager.complete_task(task.id, result={"ok": True})
+        assert task.status == "completed"
+        assert task.progress == 100
+        assert task.result == {"ok": True}
+        assert not manager.update_progress("missing", processed_files=1)
+
+    def test_progress_can_be_passed_precomputed(self):
+        """呼び出し側で算出済みの進捗率はそのまま使う"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=3)
+
+        manager.update_progress(task.id, processed_files=1)
+        assert task.progress == 33
+        manager.update_progress(task.id, processed_files=2, progress=50)
+        assert task.progress == 50
+
+    def test_cancel(self):
+        """実行中のタスクのみキャンセルを受け付ける"""
+        manager = TaskManager()
+        task = manager.create_task()
+
+        assert manager.cancel_task(task.id)
+        assert manager.is_cancelled(task.id)
+        assert manager.set_cancelled(task.id)
+        assert task.status == "cancelled"
+        assert not manager.cancel_task(task.id)
+
+    def test_cleanup_old_tasks(self):
+        """完了から一定時間経過したタスクだけが削除される"""
+        manager = TaskManager()
+        old = manager.create_task()
+        recent = manager.create_task()
+        running = manager.create_task()
+        manager.complete_task(old.id)
+        manager.complete_task(recent.id)
+        old.completed_at = datetime.now() - timedelta(hours=2)
+        snapshot = manager._tasks
+
+        assert manager.cleanup_old_tasks(max_age_seconds=3600) == 1
+        assert manager.get_task(old.id) is None
+        assert manager.get_task(recent.id) is recent
+        assert manager.get_task(running.id) is running
+        assert old.id in snapshot
+
+
+class TestWaitForProgress:
+    """ロングポーリング（wait_for_progress）のテスト"""
+
+    def test_returns_immediately_when_progress_differs(self):
+        """既に進捗が変化していれば待たずに返す"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=4)
+        manager.update_progress(task.id, processed_files=2)
+
+        start = time.monotonic()
+        result = asyncio.run(manager.wait_for_progress(task.id, since_progress=0, timeout=5))
+
+        assert result is task
+        assert time.monotonic() - start < 1
+
+    def test_wakes_on_update_from_worker_thread(self):
+        """ワーカースレッドからの進捗更新で待機が解除される"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=4)
+        manager.set_running(task.id)
+
+        timer = threading.Timer(0.1, manager.update_progress, args=(task.id, 1))
+        start = time.monotonic()
+        timer.start()
+        result = asyncio.run(manager.wait_for_progress(task.id, since_progress=0, timeout=5))
+        timer.join()
+
+        assert result.progress == 25
+        assert time.monotonic() - start < 2
+        assert task.waiters == []
+
+    def test_times_out_without_change(self):
+        """変化が無ければタイムアウトまで待って現在の状態を返す"""
+        manager = TaskManager()
+        task = manager.create_task(total_files=4)
+        manager.set_running(task.id)
+
+        result = asyncio.run(manager.wait_for_progress(task.id, since_progress=0, timeout=0.1))
+
+        assert result is task
+        assert task.progress == 0
+        assert asyncio.run(manager.wait_for_progress("missing", since_progress=0, timeout=0.1)) is None
+
+    def test_progress_endpoint_long_poll(self, client):
+        """進捗エンドポイントが完了通知で応答する"""
+        from app.task_manager import task_manager
+
+        task = task_manager.create_task(total_files=2)
+        task_manager.set_running(task.id)
+        timer = threading.Timer(0.1, task_manager.complete_task, args=(task.id, {"ok": True}))
+        timer.start()
+        response = client.get(f"/api/tasks/{task.id}/progress", params={"wait": 5, "since_progress": 0})
+        timer.join()
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["result"] == {"ok": True}
+
+    def test_progress_endpoint_caps_wait(self, client, monkeypatch):
+        """wait が大きくても TASK_PROGRESS_MAX_WAIT_SECONDS で応答し、処理中のファイル名の更新を返す"""
+        from app.routers import files
+        from app.task_manager import task_manager
+
+        monkeypatch.setattr(files, "TASK_PROGRESS_MAX_WAIT_SECONDS", 0.2)
+        task = task_manager.create_task(total_files=100)
+        task_manager.set_running(task.id)
+        task_manager.update_progress(task.id, processed_files=0, current_file="a.txt")
+        # 進捗率は変えずにファイル名だけ更新する
+        timer = threading.Timer(0.05, task_manager.update_progress, args=(task.id, 0, "b.txt"))
+        timer.start()
+
+        started = time.monotonic()
+        response = client.get(f"/api/tasks/{task.id}/progress", params={"wait": 30, "since_progress": 0})
+        timer.join()
+
+        assert response.status_code == 200
+        assert time.monotonic() - started < 5
+        assert response.json()["current_file"] == "b.txt"
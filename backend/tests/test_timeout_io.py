@@ -31,6 +31,32 @@ def test_normalize_path_prevents_traversal():
     assert excinfo.value.status_code == 403
     assert "アクセスが拒否されました" in excinfo.value.detail
 
+def test_normalize_path_rejects_sibling_with_same_prefix(tmp_path, monkeypatch):
+    """ベースディレクトリ名を前方に含む兄弟ディレクトリ（/base と /base2）への相対アクセスを拒否する"""
+    base_dir = tmp_path / "base"
+    base_dir.mkdir()
+    (tmp_path / "base2").mkdir()
+    monkeypatch.setattr(config.settings, "_base_dir_override", base_dir)
+
+    assert files.normalize_path("child") == (base_dir / "child").resolve()
+    with pytest.raises(HTTPException) as excinfo:
+        files.normalize_path("../base2/secret.txt")
+    assert excinfo.value.status_code == 403
+
+def test_normalize_path_follows_repointed_symlink_immediately(tmp_path, monkeypatch):
+    """シンボリックリンクを張り替えた直後の解決結果が古いリンク先にならない"""
+    base_dir = tmp_path / "base"
+    (base_dir / "real").mkdir(parents=True)
+    (base_dir / "link").symlink_to(base_dir / "real")
+    monkeypatch.setattr(config.settings, "_base_dir_override", base_dir)
+
+    assert files.normalize_path("link") == (base_dir / "real").resolve()
+
+    (base_dir / "other").mkdir()
+    (base_dir / "link").unlink()
+    (base_dir / "link").symlink_to(base_dir / "other")
+    assert files.normalize_path("link") == (base_dir / "other").resolve()
+
 @pytest.mark.anyio
 async def test_run_with_timeout_raises_timeout_error(monkeypatch):
     """処理が指定されたタイムアウト時間を超えた場合に 504 エラーになることを検証"""
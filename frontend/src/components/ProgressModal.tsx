@@ -34,6 +34,12 @@ const OPERATION_LABELS: Record<OperationType, { title: string; action: string; c
     delete: { title: 'ファイル削除', action: '削除中', complete: '削除完了' }
 };
 
+// ロングポーリングでサーバー側に進捗の変化を待たせる最大秒数
+// （処理中のファイル名は進捗率が変わらなくても更新されるため、表示の遅れを1秒以内に抑える）
+const LONG_POLL_WAIT_SECONDS = 1;
+// 進捗取得に失敗した場合の再試行間隔（ミリ秒）
+const POLL_RETRY_MS = 1000;
+
 interface ProgressModalProps {
     isOpen: boolean;
     taskId: string | null;
@@ -66,60 +72,55 @@ export const ProgressModal: React.FC<ProgressModalProps> = ({
         }
     }, [taskId]);
 
-    // 進捗をポーリング
+    // 進捗をロングポーリング（進捗が変化するかタスクが終了するまでサーバー側で待機）
     useEffect(() => {
         if (!taskId || hasCalledComplete) return;
 
         let cancelled = false;
-        let intervalId: ReturnType<typeof setInterval> | null = null;
+        let lastProgress: number | null = null;
 
         const pollProgress = async () => {
-            try {
-                // 進捗取得
-                const response = await fetch(`${apiBaseUrl}/tasks/${taskId}/progress`);
-                if (cancelled) return;
-
-                if (!response.ok) {
-                    throw new Error('進捗の取得に失敗しました');
-                }
+            while (!cancelled) {
+                try {
+                    // 進捗取得（初回は即時、以降は変化を待つ）
+                    const params = lastProgress === null
+                        ? ''
+                        : `?wait=${LONG_POLL_WAIT_SECONDS}&since_progress=${lastProgress}`;
+                    const response = await fetch(`${apiBaseUrl}/tasks/${taskId}/progress${params}`);
+                    if (cancelled) return;
+
+                    if (!response.ok) {
+                        throw new Error('進捗の取得に失敗しました');
+                    }
 
-                const data: TaskProgress = await response.json();
+                    const data: TaskProgress = await response.json();
+                    if (cancelled) return;
 
-                if (!cancelled) {
                     setProgress(data);
+                    lastProgress = data.progress;
 
                     // 完了状態の場合
                     if (data.status === 'completed' || data.status === 'cancelled' || data.status === 'error') {
-                        if (!hasCalledComplete) {
-                            setHasCalledComplete(true);
-                            if (onComplete && data.result) {
-                                onComplete(data.result);
-                            }
-                            // 完了したらポーリング停止
-                            if (intervalId) {
-                                clearInterval(intervalId);
-                            }
+                        setHasCalledComplete(true);
+                        if (onComplete && data.result) {
+                            onComplete(data.result);
                         }
+                        // 完了したらポーリング停止
+                        return;
                     }
-                }
-            } catch (err: any) {
-                if (!cancelled) {
+                } catch (err: any) {
+                    if (cancelled) return;
                     console.error('Poll error:', err);
+                    // エラー時は少し待ってから再試行
+                    await new Promise((resolve) => setTimeout(resolve, POLL_RETRY_MS));
                 }
             }
         };
 
-        // 初回即時実行
         pollProgress();
 
-        // ポーリング開始
-        intervalId = setInterval(pollProgress, 500);
-
         return () => {
             cancelled = true;
-            if (intervalId) {
-                clearInterval(intervalId);
-            }
         };
     }, [taskId, apiBaseUrl, onComplete, hasCalledComplete]);
 